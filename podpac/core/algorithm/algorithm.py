@@ -6,6 +6,7 @@ from __future__ import division, unicode_literals, print_function, absolute_impo
 
 from collections import OrderedDict
 import inspect
+import asyncio
 
 import numpy as np
 import xarray as xr
@@ -15,9 +16,11 @@ import traitlets as tl
 from podpac.core.coordinates import Coordinates, union
 from podpac.core.units import UnitsDataArray
 from podpac.core.node import Node, NodeException, node_eval, COMMON_NODE_DOC
-from podpac.core.utils import common_doc, NodeTrait
+from podpac.core.utils import common_doc, NodeTrait, is_lazy
 from podpac.core.settings import settings
 from podpac.core.managers.multi_threading import thread_manager
+from podpac.core.cache.eval_memo import propagate_eval_memo
+from podpac.core.managers.profiler import span
 
 COMMON_DOC = COMMON_NODE_DOC.copy()
 
@@ -72,6 +75,23 @@ class Algorithm(BaseAlgorithm):
         """
         raise NotImplementedError
 
+    async def _prefetch_async(self, coordinates, memo):
+        # the inputs are evaluated at the requested coordinates, unless eval is overridden
+        if type(self).eval is not Algorithm.eval:
+            return
+
+        nodes = list(self.inputs.values())
+        outputs = await asyncio.gather(*[node.eval_async(coordinates) for node in nodes])
+        for node, output in zip(nodes, outputs):
+            memo.add(node, coordinates, output)
+
+    def _plan_inputs(self, coordinates):
+        # the inputs are evaluated at the requested coordinates, unless eval is overridden
+        if type(self).eval is not Algorithm.eval:
+            return super(Algorithm, self)._plan_inputs(coordinates)
+
+        return [(node, coordinates) for node in self.inputs.values()]
+
     @common_doc(COMMON_DOC)
     @node_eval
     def eval(self, coordinates, output=None):
@@ -102,6 +122,7 @@ class Algorithm(BaseAlgorithm):
 
         if settings["MULTITHREADING"] and n_threads > 1:
             # Create a function for each thread to execute asynchronously
+            @propagate_eval_memo
             def f(node):
                 return node.eval(coordinates)
 
@@ -131,7 +152,8 @@ class Algorithm(BaseAlgorithm):
         coords_list = [Coordinates.from_xarray(a.coords, crs=a.attrs.get("crs")) for a in inputs.values()]
         output_coordinates = union([coordinates] + coords_list)
 
-        result = self.algorithm(inputs)
+        with span("algorithm", "phase", node=self):
+            result = self.algorithm(inputs)
         if isinstance(result, UnitsDataArray):
             if output is None:
                 output = result
@@ -144,7 +166,7 @@ class Algorithm(BaseAlgorithm):
                 )
             else:
                 output[:] = result.data
-        elif isinstance(result, np.ndarray):
+        elif isinstance(result, np.ndarray) or is_lazy(result):
             if output is None:
                 output = self.create_output_array(output_coordinates, data=result)
             else:
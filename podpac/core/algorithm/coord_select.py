@@ -14,6 +14,7 @@ from podpac.core.coordinates import make_coord_value, make_coord_delta, add_coor
 from podpac.core.node import Node, COMMON_NODE_DOC
 from podpac.core.algorithm.algorithm import UnaryAlgorithm
 from podpac.core.utils import common_doc, NodeTrait
+from podpac.core.managers.eval_context import EvalState, with_eval_context
 
 COMMON_DOC = COMMON_NODE_DOC.copy()
 
@@ -39,13 +40,14 @@ class ModifyCoordinates(UnaryAlgorithm):
     alt = tl.List().tag(attr=True)
     substitute_eval_coords = tl.Bool(False).tag(attr=True)
 
-    _modified_coordinates = tl.Instance(Coordinates, allow_none=True)
+    _modified_coordinates = EvalState("_modified_coordinates")
 
     @tl.default("coordinates_source")
     def _default_coordinates_source(self):
         return self.source
 
     @common_doc(COMMON_DOC)
+    @with_eval_context
     def eval(self, coordinates, output=None):
         """Evaluates this nodes using the supplied coordinates.
 
@@ -66,15 +68,7 @@ class ModifyCoordinates(UnaryAlgorithm):
         """
 
         self._requested_coordinates = coordinates
-        self._modified_coordinates = Coordinates(
-            [self.get_modified_coordinates1d(coordinates, dim) for dim in coordinates.dims],
-            crs=coordinates.crs,
-            validate_crs=False,
-        )
-
-        for dim in self._modified_coordinates.udims:
-            if self._modified_coordinates[dim].size == 0:
-                raise ValueError("Modified coordinates do not intersect with source data (dim '%s')" % dim)
+        self._modified_coordinates = self.get_modified_coordinates(coordinates)
 
         outputs = {}
         outputs["source"] = self.source.eval(self._modified_coordinates, output=output)
@@ -96,6 +90,40 @@ class ModifyCoordinates(UnaryAlgorithm):
             self._output = output
         return output
 
+    def _plan_inputs(self, coordinates):
+        return [(self.source, self.get_modified_coordinates(coordinates))]
+
+    def get_modified_coordinates(self, coordinates):
+        """Returns the modified coordinates at which the source is evaluated.
+
+        Parameters
+        ----------
+        coordinates : Coordinates
+            The requested input coordinates
+
+        Returns
+        -------
+        Coordinates
+            Modified coordinates
+
+        Raises
+        ------
+        ValueError
+            If the modified coordinates are empty in any dimension
+        """
+
+        modified_coordinates = Coordinates(
+            [self.get_modified_coordinates1d(coordinates, dim) for dim in coordinates.dims],
+            crs=coordinates.crs,
+            validate_crs=False,
+        )
+
+        for dim in modified_coordinates.udims:
+            if modified_coordinates[dim].size == 0:
+                raise ValueError("Modified coordinates do not intersect with source data (dim '%s')" % dim)
+
+        return modified_coordinates
+
 
 class ExpandCoordinates(ModifyCoordinates):
     """Evaluate a source node with expanded coordinates.
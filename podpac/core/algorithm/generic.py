@@ -19,7 +19,7 @@ ne = lazy_module("numexpr")
 # Internal dependencies
 from podpac import settings
 from podpac.core.node import Node
-from podpac.core.utils import NodeTrait
+from podpac.core.utils import NodeTrait, is_lazy
 from podpac.core.algorithm.algorithm import Algorithm
 
 if sys.version_info.major == 2:
@@ -66,6 +66,7 @@ class Arithmetic(GenericInputs):
     params = tl.Dict().tag(attr=True)
 
     _repr_keys = ["eqn"]
+    _pointwise = True
 
     def init(self):
         if not settings.allow_unsafe_eval:
@@ -109,6 +110,11 @@ class Arithmetic(GenericInputs):
         res = xr.broadcast(*[inputs[f] for f in fields])
         f_locals = dict(zip(fields, res))
 
+        if any(is_lazy(r) for r in res):
+            # numexpr would compute lazy inputs, xarray operations on dask arrays are lazy
+            result = eval(eqn, f_locals)
+            return res[0].copy(data=getattr(result, "data", result))
+
         try:
             from numexpr import evaluate  # Needed for some systems to get around lazy_module issues
 
@@ -212,6 +218,7 @@ class Mask(Algorithm):
     in_place = tl.Bool(False).tag(attr=True)
 
     _repr_keys = ["source", "mask"]
+    _pointwise = True
 
     def algorithm(self, inputs):
         """ Sets the values in inputs['source'] to self.masked_val using (inputs['mask'] <self.bool_op> <self.bool_val>)
@@ -253,6 +260,8 @@ class Combine(GenericInputs):
     If not output names are specified, the keyword argument names will be used.
     """
 
+    _pointwise = True
+
     @tl.default("outputs")
     def _default_outputs(self):
         input_keys = list(self.inputs.keys())
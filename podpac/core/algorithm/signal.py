@@ -109,6 +109,55 @@ class Convolution(UnaryAlgorithm):
         -------
         {eval_return}
         """
+        full_kernel, expanded_coordinates, exp_slice = self._expand_coordinates(coordinates)
+
+        if settings["DEBUG"]:
+            self._expanded_coordinates = expanded_coordinates
+
+        # evaluate source using expanded coordinates, convolve, and then slice out original coordinates
+        source = self.source.eval(expanded_coordinates)
+
+        if np.any(np.isnan(source)):
+            method = "direct"
+        else:
+            method = "auto"
+
+        if "output" not in source.dims:
+            result = scipy.signal.convolve(source, full_kernel, mode="same", method=method)
+        else:
+            # source with multiple outputs
+            result = np.array([scipy.signal.convolve(src, full_kernel, mode="same", method=method) for src in source])
+        result = result[exp_slice]
+
+        if output is None:
+            output = self.create_output_array(coordinates, data=result)
+        else:
+            output[:] = result
+
+        return output
+
+    def _plan_inputs(self, coordinates):
+        _, expanded_coordinates, _ = self._expand_coordinates(coordinates)
+        return [(self.source, expanded_coordinates)]
+
+    def _expand_coordinates(self, coordinates):
+        """Expand the requested coordinates by the kernel size to avoid edge effects.
+
+        Parameters
+        ----------
+        coordinates : podpac.Coordinates
+            Requested coordinates.
+
+        Returns
+        -------
+        full_kernel : np.ndarray
+            The dimensionally full convolution kernel
+        expanded_coordinates : podpac.Coordinates
+            Coordinates at which the source is evaluated.
+        exp_slice : tuple
+            Slices of the requested coordinates in the expanded coordinates.
+        """
+
         # This should be aligned with coordinates' dimension order
         # The size of this kernel is used to figure out the expanded size
         full_kernel = self._get_full_kernel(coordinates)
@@ -145,30 +194,7 @@ class Convolution(UnaryAlgorithm):
         exp_slice = tuple(exp_slice)
         expanded_coordinates = Coordinates(exp_coords, crs=coordinates.crs, validate_crs=False)
 
-        if settings["DEBUG"]:
-            self._expanded_coordinates = expanded_coordinates
-
-        # evaluate source using expanded coordinates, convolve, and then slice out original coordinates
-        source = self.source.eval(expanded_coordinates)
-
-        if np.any(np.isnan(source)):
-            method = "direct"
-        else:
-            method = "auto"
-
-        if "output" not in source.dims:
-            result = scipy.signal.convolve(source, full_kernel, mode="same", method=method)
-        else:
-            # source with multiple outputs
-            result = np.array([scipy.signal.convolve(src, full_kernel, mode="same", method=method) for src in source])
-        result = result[exp_slice]
-
-        if output is None:
-            output = self.create_output_array(coordinates, data=result)
-        else:
-            output[:] = result
-
-        return output
+        return full_kernel, expanded_coordinates, exp_slice
 
     @staticmethod
     def _make_kernel(kernel_type, ndim):
@@ -22,6 +22,7 @@ from podpac.core.node import Node
 from podpac.core.algorithm.algorithm import UnaryAlgorithm, Algorithm
 from podpac.core.utils import common_doc, NodeTrait
 from podpac.core.node import COMMON_NODE_DOC, node_eval
+from podpac.core.managers.eval_context import EvalState
 
 COMMON_DOC = COMMON_NODE_DOC.copy()
 
@@ -42,8 +43,8 @@ class Reduce(UnaryAlgorithm):
 
     dims = tl.List().tag(attr=True)
 
-    _reduced_coordinates = tl.Instance(Coordinates, allow_none=True)
-    _dims = tl.List(trait_type=str)
+    _reduced_coordinates = EvalState("_reduced_coordinates")
+    _dims = EvalState("_dims")
 
     def _first_init(self, **kwargs):
         if "dims" in kwargs and isinstance(kwargs["dims"], string_types):
@@ -193,6 +194,19 @@ class Reduce(UnaryAlgorithm):
 
         return output
 
+    def _plan_inputs(self, coordinates):
+        if self.dims:
+            self._dims = [dim for dim in self.dims if dim in coordinates.dims]
+        else:
+            self._dims = list(coordinates.dims)
+
+        # the source is evaluated in chunks when the node implements a chunked reduce
+        chunked = type(self).reduce_chunked is not Reduce.reduce_chunked
+        if chunked and self.chunk_size and self.chunk_size < reduce(mul, coordinates.shape, 1):
+            return [(self.source, chunk) for chunk in coordinates.iterchunks(self._get_chunk_shape(coordinates))]
+
+        return [(self.source, coordinates)]
+
     def reduce(self, x):
         """
         Reduce a full array, e.g. x.mean(dims).
@@ -915,6 +929,9 @@ class GroupReduce(UnaryAlgorithm):
 
         return output
 
+    def _plan_inputs(self, coordinates):
+        return [(self.source, coordinates)]
+
     @property
     def base_ref(self):
         """
@@ -1009,6 +1026,9 @@ class ResampleReduce(UnaryAlgorithm):
 
         return output
 
+    def _plan_inputs(self, coordinates):
+        return [(self.source, coordinates)]
+
     @property
     def base_ref(self):
         """
@@ -1,5 +1,7 @@
 from __future__ import division, unicode_literals, print_function, absolute_import
 
+import asyncio
+import threading
 import warnings
 from collections import OrderedDict
 
@@ -10,7 +12,7 @@ import xarray as xr
 
 import podpac
 from podpac.core.utils import NodeTrait
-from podpac.core.node import Node, NodeException
+from podpac.core.node import Node, NodeException, node_eval
 from podpac.core.data.array_source import Array
 from podpac.core.algorithm.utility import Arange
 from podpac.core.algorithm.generic import Arithmetic
@@ -226,6 +228,49 @@ class TestAlgorithm(object):
         assert result.dims == ("lat", "lon")
         np.testing.assert_array_equal(result, xout * 2)
 
+    def test_eval_async(self):
+        # each input waits for the others, so the evaluation only completes if the inputs are evaluated concurrently
+        barrier = threading.Barrier(3, timeout=10)
+
+        class SlowSource(Node):
+            evals = 0
+            value = tl.Float().tag(attr=True)
+
+            @node_eval
+            def eval(self, coordinates, output=None):
+                SlowSource.evals += 1
+                barrier.wait()
+                return self.create_output_array(coordinates, data=self.value)
+
+        class MySum(Algorithm):
+            a = NodeTrait().tag(attr=True)
+            b = NodeTrait().tag(attr=True)
+            c = NodeTrait().tag(attr=True)
+
+            def algorithm(self, inputs):
+                return inputs["a"] + inputs["b"] + inputs["c"]
+
+        coords = podpac.Coordinates([[0, 1, 2], [10, 20]], dims=["lat", "lon"])
+        node = MySum(
+            a=SlowSource(value=1, cache_output=False),
+            b=SlowSource(value=2, cache_output=False),
+            c=SlowSource(value=3, cache_output=False),
+            cache_output=False,
+        )
+
+        with podpac.settings:
+            podpac.settings["MULTITHREADING"] = False
+            loop = asyncio.new_event_loop()
+            try:
+                output = loop.run_until_complete(node.eval_async(coords))
+            finally:
+                loop.close()
+
+        np.testing.assert_array_equal(output, 6)
+
+        # the inputs are evaluated concurrently, once each
+        assert SlowSource.evals == 3
+
 
 class TestUnaryAlgorithm(object):
     source = Array(coordinates=podpac.Coordinates([[0, 1, 2], [10, 20]], dims=["lat", "lon"]))
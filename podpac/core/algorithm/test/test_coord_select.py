@@ -65,6 +65,13 @@ class TestExpandCoordinates(object):
         node = ExpandCoordinates(source=MyDataSource(), time=("-144,M", "0,D", "13,M"))
         o = node.eval(coords)
 
+    def test_plan(self):
+        # the source is read at the expanded coordinates
+        node = ExpandCoordinates(source=MyDataSource(cache_output=False), time=("-15,D", "0,D"), cache_output=False)
+        reads = node.plan(coords)
+        assert len(reads) == 1
+        assert reads[0][1]["time"].size > 1
+
     def test_spatial_expansion_ultiple_outputs(self):
         multi = Array(source=np.random.random(coords.shape + (2,)), coordinates=coords, outputs=["a", "b"])
         node = ExpandCoordinates(source=multi, lat=(-1, 1, 0.1))
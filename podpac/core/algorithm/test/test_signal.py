@@ -61,6 +61,22 @@ class TestConvolution(object):
         with pytest.raises(ValueError, match="Cannot evaluate coordinates, kernel and coordinates ndims mismatch"):
             node2d.eval(Coordinates([lat, lon, time]))
 
+    def test_plan(self):
+        coords = Coordinates([clinspace(0, 10, 11), clinspace(0, 10, 11)], dims=["lat", "lon"])
+        source = Array(source=np.ones(coords.shape), coordinates=coords)
+        node = Convolution(source=source, kernel=[[1, 2, 1]], cache_output=False)
+
+        # the source is read at the expanded coordinates
+        reads = node.plan(Coordinates([clinspace(2, 8, 7), clinspace(2, 8, 7)], dims=["lat", "lon"]))
+        assert len(reads) == 1
+        assert reads[0][0] is source
+        assert reads[0][1].shape == (7, 10)
+        assert reads[0][1]["lon"].bounds == (0, 9)
+
+        # no data sources
+        node = Convolution(source=Arange(), kernel=[[1, 2, 1]], cache_output=False)
+        assert node.plan(coords) == []
+
     def test_eval_multiple_outputs(self):
 
         lat = clinspace(45, 66, 30, name="lat")
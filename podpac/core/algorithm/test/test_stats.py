@@ -69,6 +69,23 @@ class TestReduce(object):
             # should be the same
             xr.testing.assert_allclose(output, output_chunked)
 
+    def test_plan(self):
+        with podpac.settings:
+            podpac.settings["CACHE_NODE_OUTPUT_DEFAULT"] = False
+            node = Mean(source=source, dims="time")
+
+            podpac.settings["CHUNK_SIZE"] = None
+            reads = node.plan(coords)
+            assert len(reads) == 1
+            assert reads[0][1].shape == (10, 10, 10)
+
+            # the source is read in chunks
+            podpac.settings["CHUNK_SIZE"] = 500
+            reads = node.plan(coords)
+            assert len(reads) == 2
+            assert all(read[0] is source for read in reads)
+            assert all(read[1].shape == (10, 10, 5) for read in reads)
+
 
 class BaseTests(object):
     """ Common tests for Reduce subclasses """
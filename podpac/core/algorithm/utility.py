@@ -71,6 +71,8 @@ class SinCoords(Algorithm):
     """A simple test node that creates a data based on coordinates and trigonometric (sin) functions. 
     """
 
+    _pointwise = True
+
     def algorithm(self, inputs):
         """Computes sinusoids of all the coordinates. 
         
@@ -1,5 +1,7 @@
 from podpac.core.cache.utils import CacheException
 from podpac.core.cache.cache_ctrl import CacheCtrl, get_default_cache_ctrl, make_cache_ctrl, clear_cache
+from podpac.core.cache.cache_ctrl import get_tier_stats, reset_tier_stats
+from podpac.core.cache.cache_stats import stats, reset_stats
 from podpac.core.cache.ram_cache_store import RamCacheStore
 from podpac.core.cache.disk_cache_store import DiskCacheStore
 from podpac.core.cache.s3_cache_store import S3CacheStore
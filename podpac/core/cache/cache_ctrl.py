@@ -1,5 +1,7 @@
 from __future__ import division, print_function, absolute_import
 
+import copy
+
 import six
 
 import podpac
@@ -8,6 +10,10 @@ from podpac.core.cache.utils import CacheWildCard, CacheException
 from podpac.core.cache.ram_cache_store import RamCacheStore
 from podpac.core.cache.disk_cache_store import DiskCacheStore
 from podpac.core.cache.s3_cache_store import S3CacheStore
+from podpac.core.cache.coordinates_index import _index as _coordinates_index
+from podpac.core.cache.cache_writer import _writer
+from podpac.core.cache.cache_stats import _stats
+from podpac.core.cache.negative_cache import _negative_cache
 
 
 _CACHE_STORES = {"ram": RamCacheStore, "disk": DiskCacheStore, "s3": S3CacheStore}
@@ -17,6 +23,31 @@ _CACHE_NAMES = {RamCacheStore: "ram", DiskCacheStore: "disk", S3CacheStore: "s3"
 _CACHE_MODES = ["ram", "disk", "network", "all"]
 
 
+def get_tier_stats():
+    """
+    Get the cache hit, miss, and promotion counts for each type of cache store, e.g. ``{'ram': {'hits': 10, 'misses':
+    2, 'promotions': 1}, 'disk': {...}}``. Hits and misses are counted when cached data is retrieved, and promotions
+    are counted when data found in a later cache store is copied into an earlier one.
+
+    The counts are a summary of the cache operation statistics, see :func:`podpac.core.cache.cache_stats.stats`.
+
+    Returns
+    -------
+    stats : dict
+        counts for each type of cache store
+    """
+
+    return _stats.get_tiers()
+
+
+def reset_tier_stats():
+    """
+    Reset the cache hit, miss, and promotion counts, along with the rest of the cache operation statistics.
+    """
+
+    _stats.reset()
+
+
 def get_default_cache_ctrl():
     """
     Get the default CacheCtrl according to the settings.
@@ -76,6 +107,15 @@ class CacheCtrl(object):
 
     """Objects of this class are used to manage multiple CacheStore objects of different types
     (e.g. RAM, local disk, s3) and serve as the interface to the caching module.
+
+    When data is retrieved from a cache store, it is also copied into the earlier cache stores that did not have it
+    (e.g. from s3 to disk and RAM), according to the ``promote`` policy of each cache store (see
+    settings.RAM_CACHE_PROMOTE, settings.DISK_CACHE_PROMOTE, and settings.S3_CACHE_PROMOTE).
+
+    If settings.CACHE_WRITE_BEHIND is True, puts to the disk and s3 cache stores are written by background threads.
+    Data waiting to be written is still found by `has` and `get`. Use `flush` to wait for pending writes.
+
+    Cache operations are counted and timed for each cache store, see `podpac.core.cache.stats`.
     """
 
     def __init__(self, cache_stores=[]):
@@ -137,7 +177,10 @@ class CacheCtrl(object):
             raise ValueError("Invalid key ('*' is reserved)")
 
         for c in self._get_cache_stores_by_mode(mode):
-            c.put(node=node, data=data, key=key, coordinates=coordinates, update=update)
+            self._put(c, node, data, key, coordinates, update)
+
+        if coordinates is not None:
+            _coordinates_index.add(node, key, coordinates)
 
     def get(self, node, key, coordinates=None, mode="all"):
         """Get cached data for this node.
@@ -179,9 +222,25 @@ class CacheCtrl(object):
         if key == "*":
             raise ValueError("Invalid key ('*' is reserved)")
 
+        missed = []
         for c in self._get_cache_stores_by_mode(mode):
-            if c.has(node=node, key=key, coordinates=coordinates):
-                return c.get(node=node, key=key, coordinates=coordinates)
+            try:
+                data = self._get(c, node, key, coordinates)
+            except CacheException:
+                _stats.increment("misses", c, node, key)
+                missed.append(c)
+                continue
+
+            _stats.increment("hits", c, node, key)
+
+            # promote to the earlier cache stores
+            for m in missed:
+                if m.promote:
+                    self._put(m, node, copy.deepcopy(data), key, coordinates, True)
+                    _stats.promoted(m)
+
+            return data
+
         raise CacheException("Requested data is not in any cache stores.")
 
     def has(self, node, key, coordinates=None, mode="all"):
@@ -220,11 +279,83 @@ class CacheCtrl(object):
             raise ValueError("Invalid key ('*' is reserved)")
 
         for c in self._get_cache_stores_by_mode(mode):
-            if c.has(node=node, key=key, coordinates=coordinates):
+            with _stats.timed("has", c, node, key):
+                has = _writer.has(c, node=node, key=key, coordinates=coordinates) or c.has(
+                    node=node, key=key, coordinates=coordinates
+                )
+            if has:
                 return True
 
         return False
 
+    def _put(self, store, node, data, key, coordinates, update):
+        with _stats.timed("put", store, node, key):
+            if settings["CACHE_WRITE_BEHIND"] and update and store.cache_mode != "ram":
+                _writer.submit(store, node=node, data=data, key=key, coordinates=coordinates)
+            else:
+                store.put(node=node, data=data, key=key, coordinates=coordinates, update=update)
+
+    def _get(self, store, node, key, coordinates):
+        with _stats.timed("get", store, node, key):
+            if _writer.has(store, node=node, key=key, coordinates=coordinates):
+                try:
+                    return _writer.get(store, node=node, key=key, coordinates=coordinates)
+                except CacheException:
+                    pass  # written in the meantime
+
+            if not store.has(node=node, key=key, coordinates=coordinates):
+                raise CacheException("Cache miss. Requested data not found.")
+
+            return store.get(node=node, key=key, coordinates=coordinates)
+
+    def find_superset(self, node, key, coordinates, mode="all"):
+        """Find cached data for this node whose coordinates contain the requested coordinates.
+
+        The cached coordinates must have the same dimensions and crs as the requested coordinates, and the requested
+        coordinates must be a contiguous sub-slice of the cached coordinates in each dimension (with the same spacing).
+        Only data cached by this process is found.
+
+        Parameters
+        ------------
+        node : Node
+            node requesting storage.
+        key : str
+            Cached object key, e.g. 'output'.
+        coordinates : :class:`podpac.Coordinates`
+            Requested coordinates.
+        mode : str
+            determines what types of the `CacheStore` are affected. Options: 'ram', 'disk', 'network', 'all'. Default 'all'.
+
+        Returns
+        -------
+        cached_coordinates : :class:`podpac.Coordinates`
+            Coordinates of the cached data, or None if no cached data contains the requested coordinates.
+        indices : dict
+            Slice in each dimension of the cached coordinates that selects the requested coordinates, or None.
+        """
+
+        if not isinstance(node, podpac.Node):
+            raise TypeError("Invalid node (must be of type Node, not '%s')" % type(node))
+
+        if not isinstance(key, six.string_types):
+            raise TypeError("Invalid key (must be a string, not '%s')" % (type(key)))
+
+        if not isinstance(coordinates, podpac.Coordinates):
+            raise TypeError("Invalid coordinates (must be of type 'Coordinates', not '%s')" % type(coordinates))
+
+        if mode not in _CACHE_MODES:
+            raise ValueError("Invalid mode (must be one of %s, not '%s')" % (_CACHE_MODES, mode))
+
+        for cached_coordinates, indices in _coordinates_index.find(node, key, coordinates):
+            if self.has(node, key, coordinates=cached_coordinates, mode=mode):
+                return cached_coordinates, indices
+
+            # the cached data has since been removed from the cache stores
+            if mode == "all":
+                _coordinates_index.remove(node, key=key, coordinates=cached_coordinates)
+
+        return None, None
+
     def rem(self, node, key, coordinates=None, mode="all"):
         """Delete cached data for this node.
         
@@ -258,9 +389,19 @@ class CacheCtrl(object):
         if coordinates == "*":
             coordinates = CacheWildCard()
 
+        # pending writes must complete first so that they are removed as well
+        self.flush()
+
         for c in self._get_cache_stores_by_mode(mode):
             c.rem(node=node, key=key, coordinates=coordinates)
 
+        if mode == "all" and coordinates is not None:
+            _coordinates_index.remove(
+                node,
+                key=None if isinstance(key, CacheWildCard) else key,
+                coordinates=None if isinstance(coordinates, CacheWildCard) else coordinates,
+            )
+
     def clear(self, mode="all"):
         """
         Clear all cached data.
@@ -274,5 +415,26 @@ class CacheCtrl(object):
         if mode not in _CACHE_MODES:
             raise ValueError("Invalid mode (must be one of %s, not '%s')" % (_CACHE_MODES, mode))
 
+        self.flush()
+
         for c in self._get_cache_stores_by_mode(mode):
             c.clear()
+
+        if mode == "all":
+            _coordinates_index.clear()
+            _negative_cache.clear()
+
+    def flush(self):
+        """
+        Wait for pending background (write-behind) cache writes to complete.
+        """
+
+        _writer.flush()
+
+    def close(self):
+        """
+        Wait for pending background (write-behind) cache writes to complete and stop the background writer threads.
+        The threads are restarted as needed by subsequent writes.
+        """
+
+        _writer.close()
@@ -0,0 +1,236 @@
+"""
+Process-wide instrumentation of cache operations.
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import time
+import bisect
+import logging
+import threading
+from contextlib import contextmanager
+
+from podpac.core.settings import settings
+
+_log = logging.getLogger(__name__)
+
+# upper bounds (in seconds) of the latency histogram buckets
+HISTOGRAM_BUCKETS = [1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, 10.0, float("inf")]
+
+OPERATIONS = ["has", "get", "put"]
+
+
+def _new_timing():
+    return {"count": 0, "total": 0.0, "min": None, "max": None, "histogram": [0] * len(HISTOGRAM_BUCKETS)}
+
+
+def _new_entry():
+    entry = {op: _new_timing() for op in OPERATIONS}
+    entry.update({"hits": 0, "misses": 0, "bytes_read": 0, "bytes_written": 0, "serialize_time": 0.0})
+    return entry
+
+
+def _copy_timing(timing):
+    d = dict(timing)
+    d["histogram"] = dict(zip(HISTOGRAM_BUCKETS, timing["histogram"]))
+    return d
+
+
+def _format_bytes(n):
+    units = ["B", "KB", "MB", "GB", "TB"]
+    for unit in units:
+        if n < 1024 or unit == units[-1]:
+            break
+        n /= 1024.0
+    return "%.1f %s" % (n, unit) if unit != "B" else "%d B" % n
+
+
+class CacheStats(object):
+    """Process-wide counters and timing histograms for cache operations.
+
+    Operations are recorded for each cache store type, node class, and cache key. Evictions and promotions are recorded
+    for each cache store type. If settings.CACHE_STATS_LOG_INTERVAL is set, a summary is logged (at the INFO level) at most
+    once per interval, when operations are recorded.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._evictions = {}
+        self._promotions = {}
+        self._last_log = time.time()
+
+    def _entry(self, store, node, key):
+        k = (store.cache_mode, node.__class__.__name__, key)
+        entry = self._entries.get(k)
+        if entry is None:
+            entry = self._entries[k] = _new_entry()
+        return entry
+
+    def record(self, op, store, node, key, seconds):
+        """Record the duration of a has, get, or put operation."""
+
+        with self._lock:
+            timing = self._entry(store, node, key)[op]
+            timing["count"] += 1
+            timing["total"] += seconds
+            timing["min"] = seconds if timing["min"] is None else min(timing["min"], seconds)
+            timing["max"] = seconds if timing["max"] is None else max(timing["max"], seconds)
+            timing["histogram"][bisect.bisect_left(HISTOGRAM_BUCKETS, seconds)] += 1
+        self._maybe_log()
+
+    @contextmanager
+    def timed(self, op, store, node, key):
+        """Context manager that records the duration of a has, get, or put operation."""
+
+        t0 = time.time()
+        try:
+            yield
+        finally:
+            self.record(op, store, node, key, time.time() - t0)
+
+    def increment(self, counter, store, node, key, value=1):
+        """Increment a counter, one of 'hits', 'misses', 'bytes_read', 'bytes_written', or 'serialize_time'."""
+
+        with self._lock:
+            self._entry(store, node, key)[counter] += value
+
+    def evicted(self, store, n=1):
+        """Record entries removed from a cache store to make room for new entries or because they expired."""
+
+        if not n:
+            return
+        with self._lock:
+            self._evictions[store.cache_mode] = self._evictions.get(store.cache_mode, 0) + n
+
+    def promoted(self, store):
+        """Record an entry found in a later cache store and copied into this cache store."""
+
+        with self._lock:
+            self._promotions[store.cache_mode] = self._promotions.get(store.cache_mode, 0) + 1
+
+    def get(self):
+        with self._lock:
+            d = {}
+            for (mode, cls, key), entry in self._entries.items():
+                store = d.setdefault(mode, {"evictions": 0, "promotions": 0, "nodes": {}})
+                e = dict(entry)
+                for op in OPERATIONS:
+                    e[op] = _copy_timing(entry[op])
+                store["nodes"].setdefault(cls, {})[key] = e
+            for mode, n in self._evictions.items():
+                d.setdefault(mode, {"evictions": 0, "promotions": 0, "nodes": {}})["evictions"] = n
+            for mode, n in self._promotions.items():
+                d.setdefault(mode, {"evictions": 0, "promotions": 0, "nodes": {}})["promotions"] = n
+            return d
+
+    def get_tiers(self):
+        """Hit, miss, and promotion counts for each cache store type, summed over the node classes and keys."""
+
+        tiers = {}
+        for mode, store in self.get().items():
+            entries = [e for keys in store["nodes"].values() for e in keys.values()]
+            tiers[mode] = {
+                "hits": sum(e["hits"] for e in entries),
+                "misses": sum(e["misses"] for e in entries),
+                "promotions": store["promotions"],
+            }
+        return tiers
+
+    def reset(self):
+        with self._lock:
+            self._entries.clear()
+            self._evictions.clear()
+            self._promotions.clear()
+
+    def summary(self):
+        """Human-readable summary of the recorded operations, with one line for each store, node class, and key."""
+
+        lines = []
+        for mode, store in sorted(self.get().items()):
+            lines.append("%s: %d evictions" % (mode, store["evictions"]))
+            for cls, keys in sorted(store["nodes"].items()):
+                for key, e in sorted(keys.items()):
+                    ops = ", ".join(
+                        "%s %d (%.3f ms avg)" % (op, e[op]["count"], 1000 * e[op]["total"] / e[op]["count"])
+                        for op in OPERATIONS
+                        if e[op]["count"]
+                    )
+                    lines.append(
+                        "  %s %s: %d hits, %d misses, %s read, %s written, %.3f s serializing; %s"
+                        % (
+                            cls,
+                            key,
+                            e["hits"],
+                            e["misses"],
+                            _format_bytes(e["bytes_read"]),
+                            _format_bytes(e["bytes_written"]),
+                            e["serialize_time"],
+                            ops,
+                        )
+                    )
+        return "\n".join(lines)
+
+    def _maybe_log(self):
+        interval = settings.get("CACHE_STATS_LOG_INTERVAL")
+        if interval is None:
+            return
+
+        now = time.time()
+        with self._lock:
+            if now - self._last_log < interval:
+                return
+            self._last_log = now
+
+        _log.info("Cache stats:\n%s" % self.summary())
+
+
+_stats = CacheStats()
+
+
+def stats():
+    """
+    Get cache operation statistics, for each cache store type, node class, and cache key::
+
+        {
+            'ram': {
+                'evictions': 3,
+                'promotions': 1,
+                'nodes': {
+                    'Arange': {
+                        'output': {
+                            'has': {'count': 4, 'total': 0.001, 'min': ..., 'max': ..., 'histogram': {1e-05: 1, ...}},
+                            'get': {...},
+                            'put': {...},
+                            'hits': 2,
+                            'misses': 1,
+                            'bytes_read': 1024,
+                            'bytes_written': 512,
+                            'serialize_time': 0.0,
+                        }
+                    }
+                }
+            },
+            'disk': {...}
+        }
+
+    Times are in seconds. The histogram maps the upper bound of each latency bucket (see `HISTOGRAM_BUCKETS`) to the
+    number of operations in the bucket. Hits and misses are counted when cached data is retrieved, and promotions are
+    counted when data found in a later cache store is copied into an earlier one. Serialization time includes
+    compression and deserialization.
+
+    Returns
+    -------
+    stats : dict
+        cache operation statistics
+    """
+
+    return _stats.get()
+
+
+def reset_stats():
+    """
+    Reset the cache operation statistics.
+    """
+
+    _stats.reset()
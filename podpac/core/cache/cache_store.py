@@ -15,6 +15,7 @@ class CacheStore(object):
 
     cache_modes = []
     _limit_setting = None
+    _promote_setting = None
 
     def __init__(self, *args, **kwargs):
         raise NotImplementedError
@@ -23,6 +24,11 @@ class CacheStore(object):
     def max_size(self):
         return settings.get(self._limit_setting)
 
+    @property
+    def promote(self):
+        """Whether data found in a later (slower) cache store should be copied into this cache store."""
+        return bool(settings.get(self._promote_setting, False))
+
     @property
     def size(self):
         """Return size of cache store in bytes"""
@@ -0,0 +1,167 @@
+"""
+Background writer for asynchronous (write-behind) cache puts.
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import copy
+import atexit
+import logging
+import threading
+
+from six.moves import queue
+
+from podpac.core.settings import settings
+from podpac.core.cache.utils import CacheException
+
+_log = logging.getLogger(__name__)
+
+_POLICIES = ["block", "drop", "sync"]
+
+
+def _get_pending_key(store, node, key, coordinates):
+    return (store.cache_mode, node.hash, key, coordinates.hash if coordinates is not None else None)
+
+
+class CacheWriter(object):
+    """Process-wide pool of background threads that write data to cache stores.
+
+    Data is copied when it is submitted, so that the caller may continue to use (and modify) it. Until it is written,
+    submitted data is available from the writer as pending data, so that reads from the cache see previous writes.
+
+    The number of writer threads, the maximum number of queued writes, and the policy when the queue is full are
+    set by settings.CACHE_WRITE_BEHIND_THREADS, settings.CACHE_WRITE_BEHIND_QUEUE_SIZE, and
+    settings.CACHE_WRITE_BEHIND_POLICY. The threads are started on the first write.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._queue = None
+        self._threads = []
+        self._pending = {}
+        self.dropped = 0
+
+    def _start(self):
+        with self._lock:
+            if self._queue is not None:
+                return self._queue
+            self._queue = queue.Queue(maxsize=settings["CACHE_WRITE_BEHIND_QUEUE_SIZE"] or 0)
+            self._threads = [
+                threading.Thread(target=self._run, args=(self._queue,), name="podpac-cache-writer-%d" % i)
+                for i in range(settings["CACHE_WRITE_BEHIND_THREADS"])
+            ]
+            for thread in self._threads:
+                thread.daemon = True
+                thread.start()
+            return self._queue
+
+    def _run(self, q):
+        while True:
+            item = q.get()
+            try:
+                if item is None:
+                    return
+                self._write(*item)
+            finally:
+                q.task_done()
+
+    def _write(self, pending_key, store, node, data, key, coordinates):
+        try:
+            store.put(node=node, data=data, key=key, coordinates=coordinates, update=True)
+        except Exception:
+            _log.exception("Cache write failed (node=%s, key=%s)" % (node.base_ref, key))
+        finally:
+            with self._lock:
+                if self._pending.get(pending_key, (None,))[0] is data:
+                    del self._pending[pending_key]
+
+    def submit(self, store, node, data, key, coordinates=None):
+        """Write data to a cache store in the background.
+
+        Parameters
+        ----------
+        store : CacheStore
+            cache store to write to
+        node : Node
+            node requesting storage
+        data : any
+            Data to cache. The data is copied.
+        key : str
+            Cached object key, e.g. 'output'.
+        coordinates : :class:`podpac.Coordinates`, optional
+            Coordinates for which the data is cached.
+
+        Returns
+        -------
+        submitted : bool
+            False if the write was dropped because the queue is full.
+        """
+
+        policy = settings["CACHE_WRITE_BEHIND_POLICY"]
+        if policy not in _POLICIES:
+            raise ValueError("Invalid CACHE_WRITE_BEHIND_POLICY '%s' (must be one of %s)" % (policy, _POLICIES))
+
+        q = self._start()
+
+        pending_key = _get_pending_key(store, node, key, coordinates)
+        data = copy.deepcopy(data)
+        item = (pending_key, store, node, data, key, coordinates)
+
+        with self._lock:
+            self._pending[pending_key] = (data,)
+
+        try:
+            q.put(item, block=policy == "block")
+        except queue.Full:
+            if policy == "sync":
+                self._write(*item)
+                return True
+
+            with self._lock:
+                del self._pending[pending_key]
+                self.dropped += 1
+            _log.debug("Cache write dropped, the write-behind queue is full (node=%s, key=%s)" % (node.base_ref, key))
+            return False
+
+        return True
+
+    def has(self, store, node, key, coordinates=None):
+        if not self._pending:
+            return False
+        with self._lock:
+            return _get_pending_key(store, node, key, coordinates) in self._pending
+
+    def get(self, store, node, key, coordinates=None):
+        if not self._pending:
+            raise CacheException("Cache miss. Requested data is not pending.")
+        with self._lock:
+            pending = self._pending.get(_get_pending_key(store, node, key, coordinates))
+        if pending is None:
+            raise CacheException("Cache miss. Requested data is not pending.")
+        return copy.deepcopy(pending[0])
+
+    def flush(self):
+        """Wait for all queued writes to complete."""
+
+        q = self._queue
+        if q is not None:
+            q.join()
+
+    def close(self):
+        """Wait for all queued writes to complete and stop the writer threads."""
+
+        with self._lock:
+            q, threads = self._queue, self._threads
+            self._queue, self._threads = None, []
+
+        if q is None:
+            return
+
+        for _ in threads:
+            q.put(None)
+        for thread in threads:
+            thread.join()
+
+
+_writer = CacheWriter()
+atexit.register(_writer.close)
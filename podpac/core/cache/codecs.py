@@ -0,0 +1,166 @@
+"""
+Compression codecs for serialized cache entries.
+
+The codec used for an entry is recorded as an extra extension of the cached file, e.g. ``<name>.npy.zstd``, so that
+entries can be read regardless of the current codec settings.
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import zlib
+import warnings
+import importlib
+
+
+class Codec(object):
+    """Compression codec.
+
+    Attributes
+    ----------
+    name : str
+        codec name, also used as the file extension
+    module : str
+        name of the optional python module required by the codec, or None
+    """
+
+    name = None
+    module = None
+
+    # Note: the optional modules are imported when used rather than with lazy_module, whose placeholder modules in
+    # sys.modules make other packages (e.g. pandas) think that they are installed.
+    def _import(self):
+        return importlib.import_module(self.module)
+
+    @property
+    def available(self):
+        if self.module is None:
+            return True
+        try:
+            self._import()
+        except ImportError:
+            return False
+        return True
+
+    def compress(self, s, typesize=1):
+        """Compress serialized data.
+
+        Parameters
+        ----------
+        s : bytes
+            serialized data
+        typesize : int, optional
+            size in bytes of the elements of the serialized data (e.g. the itemsize of a serialized numpy array), used
+            by codecs that shuffle the bytes of each element. Default 1.
+
+        Returns
+        -------
+        compressed : bytes
+            compressed data
+        """
+        raise NotImplementedError
+
+    def decompress(self, s):
+        raise NotImplementedError
+
+
+class ZlibCodec(Codec):
+    name = "zlib"
+
+    def compress(self, s, typesize=1):
+        return zlib.compress(s)
+
+    def decompress(self, s):
+        return zlib.decompress(s)
+
+
+class ZstdCodec(Codec):
+    name = "zstd"
+    module = "zstandard"
+
+    def compress(self, s, typesize=1):
+        return self._import().ZstdCompressor().compress(s)
+
+    def decompress(self, s):
+        return self._import().ZstdDecompressor().decompress(s)
+
+
+class Lz4Codec(Codec):
+    name = "lz4"
+    module = "lz4.frame"
+
+    def compress(self, s, typesize=1):
+        return self._import().compress(s)
+
+    def decompress(self, s):
+        return self._import().decompress(s)
+
+
+class BloscCodec(Codec):
+    """Blosc (lz4) with byte shuffle of the elements of the serialized data."""
+
+    name = "blosc"
+    module = "blosc"
+
+    def compress(self, s, typesize=1):
+        blosc = self._import()
+        return blosc.compress(s, typesize=typesize, cname="lz4", shuffle=blosc.SHUFFLE)
+
+    def decompress(self, s):
+        return self._import().decompress(s)
+
+
+CODECS = {codec.name: codec for codec in [ZlibCodec(), ZstdCodec(), Lz4Codec(), BloscCodec()]}
+
+
+def get_codec(name):
+    """Get the codec to use for writing cache entries.
+
+    Parameters
+    ----------
+    name : str, None
+        codec name, one of 'zlib', 'zstd', 'lz4', 'blosc', or None for no compression.
+
+    Returns
+    -------
+    codec : Codec, None
+        The codec, or None for no compression. If the python package required for the codec is not installed, the
+        zlib codec is used instead.
+    """
+
+    if name is None:
+        return None
+
+    if name not in CODECS:
+        raise ValueError("Unknown cache codec '%s', options are %s" % (name, sorted(CODECS)))
+
+    codec = CODECS[name]
+    if not codec.available:
+        warnings.warn(
+            "The '%s' cache codec requires the '%s' module, which is not installed. Using 'zlib' instead."
+            % (codec.name, codec.module)
+        )
+        codec = CODECS["zlib"]
+
+    return codec
+
+
+def split_codec(path):
+    """Get the codec used for a cached file from its path.
+
+    Parameters
+    ----------
+    path : str
+        cached file path
+
+    Returns
+    -------
+    path : str
+        the path without the codec extension
+    codec : Codec, None
+        The codec, or None if the file is not compressed.
+    """
+
+    root, _, ext = path.rpartition(".")
+    if root and ext in CODECS:
+        return root, CODECS[ext]
+    return path, None
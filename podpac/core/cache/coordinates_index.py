@@ -0,0 +1,243 @@
+"""
+Index of the coordinates of cached node outputs, used to serve cache hits from cached supersets of the requested
+coordinates.
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from podpac.core.coordinates import StackedCoordinates
+
+# relative tolerance (with respect to the coordinate spacing) for matching float coordinate values
+_RTOL = 1e-6
+
+
+def _get_slice(cached, requested):
+    """Get the slice of cached 1d or stacked coordinates that matches the requested coordinates.
+
+    Parameters
+    ----------
+    cached : :class:`Coordinates1d`, :class:`StackedCoordinates`
+        cached coordinates
+    requested : :class:`Coordinates1d`, :class:`StackedCoordinates`
+        requested coordinates, with the same dimensions
+
+    Returns
+    -------
+    index : slice or None
+        Slice of the cached coordinates that matches the requested coordinates, or None if the requested coordinates
+        are not a contiguous sub-slice of the cached coordinates.
+    """
+
+    if requested.size > cached.size:
+        return None
+
+    if isinstance(cached, StackedCoordinates):
+        # stacked coordinates must match exactly
+        index = cached.coordinates.get_indexer(requested.coordinates)
+    else:
+        c = pd.Index(np.asarray(cached.coordinates))
+        r = np.asarray(requested.coordinates)
+        if c.dtype.kind == "f" and cached.size > 1 and (c.is_monotonic_increasing or c.is_monotonic_decreasing):
+            tolerance = _RTOL * np.abs(np.diff(c.values)).min()
+            index = c.get_indexer(r, method="nearest", tolerance=tolerance)
+        elif c.is_unique:
+            index = c.get_indexer(r)
+        else:
+            return None
+
+    if index.size == 0 or (index < 0).any():
+        return None
+
+    # the requested coordinates must be a contiguous run of the cached coordinates (same spacing and order)
+    start = index[0]
+    if not np.array_equal(index, np.arange(start, start + index.size)):
+        return None
+
+    return slice(start, start + index.size)
+
+
+def _contains(cached_bounds, bounds):
+    lo, hi = bounds
+    clo, chi = cached_bounds
+    if np.issubdtype(np.asarray(lo).dtype, np.floating):
+        # allow for floating point differences at the boundaries
+        slack = _RTOL * (chi - clo)
+        return lo >= clo - slack and hi <= chi + slack
+    return lo >= clo and hi <= chi
+
+
+def get_subset_indices(cached, requested):
+    """Get the indices of the cached coordinates that select the requested coordinates.
+
+    Parameters
+    ----------
+    cached : :class:`podpac.Coordinates`
+        cached coordinates
+    requested : :class:`podpac.Coordinates`
+        requested coordinates
+
+    Returns
+    -------
+    indices : dict or None
+        slice in each dimension of the cached coordinates that selects the requested coordinates, or None if the
+        requested coordinates are not a sub-slice of the cached coordinates (same dimensions, crs, and spacing).
+    """
+
+    if cached.dims != requested.dims or cached.crs.lower() != requested.crs.lower():
+        return None
+
+    # check the bounds first, which is much faster than matching the coordinate values
+    cached_bounds = cached.bounds
+    for dim, bounds in requested.bounds.items():
+        if not _contains(cached_bounds[dim], bounds):
+            return None
+
+    indices = OrderedDict()
+    for dim in requested.dims:
+        index = _get_slice(cached[dim], requested[dim])
+        if index is None:
+            return None
+        indices[dim] = index
+    return indices
+
+
+class CoordinatesIndex(object):
+    """Process-wide index of the coordinates of cached data, by node and key.
+
+    The index only records which coordinates have been cached in this process. The entries are not necessarily still
+    available in the cache stores and must be checked before use.
+
+    The index is bounded: it keeps the most recently cached ``max_entries_per_key`` coordinates for each node and key
+    (so that finding a superset is a short scan), and the most recently cached ``max_entries`` coordinates in total.
+
+    Attributes
+    ----------
+    max_entries : int
+        maximum number of coordinates in the index
+    max_entries_per_key : int
+        maximum number of coordinates in the index for each node and key
+    """
+
+    def __init__(self, max_entries=1024, max_entries_per_key=16):
+        self.max_entries = max_entries
+        self.max_entries_per_key = max_entries_per_key
+        self._lock = threading.Lock()
+        # (node hash, key) -> OrderedDict(coordinates hash -> coordinates), least recently cached first
+        self._entries = OrderedDict()
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def add(self, node, key, coordinates):
+        node_key = (node.hash, key)
+        with self._lock:
+            entries = self._entries.pop(node_key, OrderedDict())
+            self._entries[node_key] = entries
+            if entries.pop(coordinates.hash, None) is None:
+                self._size += 1
+            entries[coordinates.hash] = coordinates
+
+            if len(entries) > self.max_entries_per_key:
+                entries.popitem(last=False)
+                self._size -= 1
+
+            while self._size > self.max_entries:
+                oldest_key, oldest = next(iter(self._entries.items()))
+                oldest.popitem(last=False)
+                self._size -= 1
+                if not oldest:
+                    del self._entries[oldest_key]
+
+    def remove(self, node, key=None, coordinates=None):
+        """Remove entries from the index.
+
+        Parameters
+        ----------
+        node : Node
+            node
+        key : str, optional
+            Remove only entries with this key. Default all keys.
+        coordinates : :class:`podpac.Coordinates`, optional
+            Remove only entries for these coordinates. Default all coordinates.
+        """
+
+        node_hash = node.hash
+        coordinates_hash = None if coordinates is None else coordinates.hash
+        with self._lock:
+            for node_key in list(self._entries):
+                if node_key[0] != node_hash or (key is not None and node_key[1] != key):
+                    continue
+                self._discard(node_key, coordinates_hash)
+
+    def discard(self, node_hash, key, coordinates_hash):
+        """Remove an entry from the index by hash, e.g. when it is evicted from a cache store.
+
+        Parameters
+        ----------
+        node_hash : str
+            node hash
+        key : str
+            Cached object key, e.g. 'output'.
+        coordinates_hash : str
+            coordinates hash
+        """
+
+        with self._lock:
+            self._discard((node_hash, key), coordinates_hash)
+
+    def _discard(self, node_key, coordinates_hash):
+        entries = self._entries.get(node_key)
+        if entries is None:
+            return
+
+        if coordinates_hash is None:
+            self._size -= len(entries)
+            entries.clear()
+        elif entries.pop(coordinates_hash, None) is not None:
+            self._size -= 1
+
+        if not entries:
+            del self._entries[node_key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def find(self, node, key, coordinates):
+        """Find cached coordinates that contain the requested coordinates.
+
+        Parameters
+        ----------
+        node : Node
+            node
+        key : str
+            Cached object key, e.g. 'output'.
+        coordinates : :class:`podpac.Coordinates`
+            requested coordinates
+
+        Yields
+        ------
+        cached : :class:`podpac.Coordinates`
+            Cached coordinates that contain the requested coordinates, most recently cached first.
+        indices : dict
+            slice in each dimension of the cached coordinates that selects the requested coordinates
+        """
+
+        with self._lock:
+            candidates = list(self._entries.get((node.hash, key), {}).values())
+
+        for cached in reversed(candidates):
+            indices = get_subset_indices(cached, coordinates)
+            if indices is not None:
+                yield cached, indices
+
+
+_index = CoordinatesIndex()
@@ -1,21 +1,311 @@
 from __future__ import division, print_function, absolute_import
 
 import os
+import re
 import glob
+import json
+import time
 import shutil
+import sqlite3
+import tempfile
+import threading
+
+import six
+import numpy as np
+import pandas as pd
+import xarray as xr
 
 import podpac
 from podpac.core.settings import settings
+from podpac.core.utils import JSONEncoder
 from podpac.core.cache.utils import CacheException, CacheWildCard
-from podpac.core.cache.file_cache_store import FileCacheStore
+from podpac.core.cache.cache_stats import _stats
+from podpac.core.cache.file_cache_store import FileCacheStore, _hash_string
+
+
+def _encode_values(values):
+    values = np.asarray(values)
+    d = {"dtype": values.dtype.str}
+    if values.dtype.kind in "mM":
+        d["values"] = values.view("int64").tolist()
+    else:
+        d["values"] = values.tolist()
+    return d
+
+
+def _decode_values(d):
+    dtype = np.dtype(d["dtype"])
+    if dtype.kind in "mM":
+        return np.array(d["values"], dtype="int64").view(dtype)
+    return np.array(d["values"], dtype=dtype)
+
+
+def _get_metadata(data):
+    """Get a json-serializable description of a DataArray, excluding its data."""
+
+    # stacked dimensions are stored as separate coordinates and restored on load
+    stacked = {}
+    for dim in data.dims:
+        if dim in data.indexes and isinstance(data.indexes[dim], pd.MultiIndex):
+            stacked[dim] = list(data.indexes[dim].names)
+            data = data.reset_index(dim)
+
+    attrs = data.attrs.copy()
+    if isinstance(data, podpac.core.units.UnitsDataArray):
+        if attrs.get("units"):
+            attrs["units"] = str(attrs["units"])
+        if attrs.get("layer_style") and not isinstance(attrs["layer_style"], six.string_types):
+            attrs["layer_style"] = attrs["layer_style"].json
+
+    d = {}
+    d["name"] = data.name
+    d["dims"] = list(data.dims)
+    d["coords"] = {name: dict(dims=list(c.dims), **_encode_values(c.values)) for name, c in data.coords.items()}
+    d["stacked"] = stacked
+    d["attrs"] = attrs
+    return d
+
+
+def _from_metadata(d, values, cls):
+    coords = {name: (c["dims"], _decode_values(c)) for name, c in d["coords"].items()}
+    data = cls(values, coords=coords, dims=d["dims"], name=d["name"], attrs=d["attrs"])
+    if d["stacked"]:
+        data = data.set_index(**d["stacked"])
+    return data
+
+
+# number of least recently used entries queried at a time when evicting entries
+_EVICT_BATCH_SIZE = 16
+
+_FILENAME_PATTERN = re.compile(
+    r"^.*_(?P<node>[0-9a-f]+)_(?P<key>[0-9a-f]+)_(?P<coordinates>[0-9a-f]+|None)\.(?P<format>.+)$"
+)
+
+
+class _DiskCacheIndex(object):
+    """SQLite index of the entries in a disk cache directory.
+
+    Each entry is keyed by node hash, key hash, and coordinates hash, and records the path (relative to the cache
+    directory), size in bytes, format, creation time, and last access time of the cached file. The total size of the
+    entries is kept up to date by triggers.
+
+    The schema version is stored in the ``user_version`` pragma. The index is rebuilt from the cached filenames if it is
+    missing or if it was created with a different schema version.
+
+    There is one index for each cache directory, see `_get_index`. Each thread keeps one connection to the index, and
+    the schema is checked when the connection is opened. The connection is opened again if the index file is removed
+    or replaced (e.g. when the cache is cleared).
+
+    Concurrent access to the index relies on SQLite file locking, which is unreliable on network file systems (e.g.
+    NFS), see the ``DISK_CACHE_INDEX`` setting.
+    """
+
+    filename = "index.sqlite"
+    schema_version = 1
+
+    _schema = [
+        "CREATE TABLE entries ("
+        "node TEXT, key TEXT, coordinates TEXT, path TEXT, size INTEGER, format TEXT, created REAL, accessed REAL, "
+        "PRIMARY KEY (node, key, coordinates))",
+        "CREATE INDEX entries_path ON entries (path)",
+        "CREATE INDEX entries_created ON entries (created)",
+        "CREATE INDEX entries_accessed ON entries (accessed)",
+        "CREATE TABLE totals (size INTEGER)",
+        "INSERT INTO totals VALUES (0)",
+        "CREATE TRIGGER entries_insert AFTER INSERT ON entries BEGIN UPDATE totals SET size = size + NEW.size; END",
+        "CREATE TRIGGER entries_delete AFTER DELETE ON entries BEGIN UPDATE totals SET size = size - OLD.size; END",
+    ]
+
+    def __init__(self, root):
+        self.root = root
+        self.path = os.path.join(root, self.filename)
+        self._local = threading.local()
+
+    def _connect(self):
+        """ connection of the current thread, opened again if the index file was removed or replaced """
+
+        conn = getattr(self._local, "conn", None)
+        try:
+            inode = os.stat(self.path).st_ino
+        except OSError:
+            inode = None
+
+        if conn is not None and inode is not None and inode == self._local.inode:
+            return conn
+
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+        if not os.path.exists(self.root):
+            os.makedirs(self.root)
+
+        conn = sqlite3.connect(self.path, timeout=60)
+        (version,) = conn.execute("PRAGMA user_version").fetchone()
+        if version != self.schema_version:
+            self._migrate(conn)
+
+        self._local.conn = conn
+        self._local.inode = os.stat(self.path).st_ino
+        return conn
+
+    def _migrate(self, conn):
+        """ (re)create the schema and rebuild the index from the cached filenames """
+
+        # explicit transaction, so that the schema statements are not committed implicitly
+        conn.isolation_level = None
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # another process may have migrated the index in the meantime
+                (version,) = conn.execute("PRAGMA user_version").fetchone()
+                if version != self.schema_version:
+                    conn.execute("DROP TABLE IF EXISTS entries")
+                    conn.execute("DROP TABLE IF EXISTS totals")
+                    for statement in self._schema:
+                        conn.execute(statement)
+                    self._rebuild(conn)
+                    conn.execute("PRAGMA user_version = %d" % self.schema_version)
+            except:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.isolation_level = ""
+
+    def _rebuild(self, conn):
+        for path, size, created, accessed in _scan_entries(self.root):
+            self._insert(conn, path, size, created, accessed)
+
+    def _insert(self, conn, path, size, created, accessed):
+        m = _FILENAME_PATTERN.match(os.path.basename(path))
+
+        # replaced rows do not fire the delete trigger, so they are deleted explicitly
+        conn.execute(
+            "DELETE FROM entries WHERE node = ? AND key = ? AND coordinates = ?",
+            (m.group("node"), m.group("key"), m.group("coordinates")),
+        )
+        conn.execute(
+            "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                m.group("node"),
+                m.group("key"),
+                m.group("coordinates"),
+                os.path.relpath(path, self.root),
+                size,
+                m.group("format"),
+                created,
+                accessed,
+            ),
+        )
+
+    def add(self, path, size):
+        now = time.time()
+        conn = self._connect()
+        with conn:
+            self._insert(conn, path, size, now, now)
+
+    def remove(self, path):
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM entries WHERE path = ?", (os.path.relpath(path, self.root),))
+
+    def touch(self, path):
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "UPDATE entries SET accessed = ? WHERE path = ?", (time.time(), os.path.relpath(path, self.root))
+            )
+
+    def search(self, node, key=None, coordinates=None):
+        query = "SELECT path FROM entries WHERE node = ?"
+        params = [node]
+        if key is not None:
+            query += " AND key = ?"
+            params.append(key)
+        if coordinates is not None:
+            query += " AND coordinates = ?"
+            params.append(coordinates)
+
+        conn = self._connect()
+        return [os.path.join(self.root, path) for (path,) in conn.execute(query, params)]
+
+    def entries(self):
+        conn = self._connect()
+        rows = conn.execute("SELECT path, size, created, accessed FROM entries").fetchall()
+        return [(os.path.join(self.root, path), size, created, accessed) for (path, size, created, accessed) in rows]
+
+    def expired(self, before):
+        """ (path, size) of the entries created before the given time """
+
+        conn = self._connect()
+        rows = conn.execute("SELECT path, size FROM entries WHERE created < ?", (before,)).fetchall()
+        return [(os.path.join(self.root, path), size) for (path, size) in rows]
+
+    def least_recently_used(self, limit):
+        """ (path, size) of the least recently used entries, up to the given number of entries """
+
+        conn = self._connect()
+        rows = conn.execute("SELECT path, size FROM entries ORDER BY accessed LIMIT ?", (limit,)).fetchall()
+        return [(os.path.join(self.root, path), size) for (path, size) in rows]
+
+    def created(self, path):
+        conn = self._connect()
+        row = conn.execute("SELECT created FROM entries WHERE path = ?", (os.path.relpath(path, self.root),)).fetchone()
+        return row[0] if row else None
+
+    def size(self):
+        conn = self._connect()
+        (size,) = conn.execute("SELECT size FROM totals").fetchone()
+        return size
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def _get_index(root):
+    """ the index of a cache directory, shared by the disk cache stores that use the directory """
+
+    root = os.path.abspath(root)
+    with _indexes_lock:
+        if root not in _indexes:
+            _indexes[root] = _DiskCacheIndex(root)
+        return _indexes[root]
+
+
+def _scan_entries(root):
+    """ (path, size, created, accessed) of the cached entries in a cache directory, from the cached filenames """
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in dirnames + filenames:
+            path = os.path.join(dirpath, name)
+            if _FILENAME_PATTERN.match(name) and dirpath != root:
+                yield path, _get_path_size(path), os.path.getmtime(path), os.path.getatime(path)
+        # entries in the memory-mappable format are directories, which should not be walked
+        dirnames[:] = [name for name in dirnames if not _FILENAME_PATTERN.match(name)]
+
+
+def _get_path_size(path):
+    if os.path.isdir(path):
+        return sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+    return os.path.getsize(path)
 
 
 class DiskCacheStore(FileCacheStore):
-    """Cache that uses a folder on a local disk file system."""
+    """Cache that uses a folder on a local disk file system.
+
+    Entries are looked up in a SQLite index of the cache directory (see `_DiskCacheIndex`). If
+    ``settings["DISK_CACHE_INDEX"]`` is False (e.g. for a cache directory on a network file system), entries are found
+    by scanning the cache directory instead, and the last access times are the file access times.
+    """
 
     cache_mode = "disk"
     cache_modes = set(["disk", "all"])
     _limit_setting = "DISK_CACHE_MAX_BYTES"
+    _promote_setting = "DISK_CACHE_PROMOTE"
+    _codec_setting = "DISK_CACHE_CODEC"
+    _ttl_setting = "DISK_CACHE_TTL"
 
     def __init__(self):
         """Initialize a cache that uses a folder on a local disk file system."""
@@ -24,6 +314,7 @@ class DiskCacheStore(FileCacheStore):
             raise CacheException("Disk cache is disabled in the podpac settings.")
 
         self._root_dir_path = settings.cache_path
+        self._index = _get_index(self._root_dir_path) if settings["DISK_CACHE_INDEX"] else None
 
     # -----------------------------------------------------------------------------------------------------------------
     # public cache API
@@ -31,20 +322,35 @@ class DiskCacheStore(FileCacheStore):
 
     @property
     def size(self):
-        total_size = 0
-        for dirpath, dirnames, filenames in os.walk(self._root_dir_path):
-            for f in filenames:
-                fp = os.path.join(dirpath, f)
-                total_size += os.path.getsize(fp)
-        return total_size
+        if self._index is None:
+            return sum(size for path, size, created, accessed in _scan_entries(self._root_dir_path))
+        return self._index.size()
 
     # -----------------------------------------------------------------------------------------------------------------
     # helper methods
     # -----------------------------------------------------------------------------------------------------------------
 
+    def _use_mmap(self, data):
+        return settings["DISK_CACHE_MMAP"] and isinstance(data, (xr.DataArray, np.ndarray)) and not data.dtype.hasobject
+
     def search(self, node, key=CacheWildCard(), coordinates=CacheWildCard()):
-        match_path = self._path_join(self._get_node_dir(node), self._match_filename(node, key, coordinates))
-        return glob.glob(match_path)
+        if self._index is None:
+            match_path = self._path_join(self._get_node_dir(node), self._match_filename(node, key, coordinates))
+            return glob.glob(match_path)
+
+        if isinstance(key, CacheWildCard):
+            key_hash = None
+        else:
+            key_hash = _hash_string(key)
+
+        if isinstance(coordinates, CacheWildCard):
+            coordinates_hash = None
+        elif coordinates is None:
+            coordinates_hash = "None"
+        else:
+            coordinates_hash = coordinates.hash
+
+        return self._index.search(node.hash, key=key_hash, coordinates=coordinates_hash)
 
     # -----------------------------------------------------------------------------------------------------------------
     # file storage abstraction
@@ -53,10 +359,20 @@ class DiskCacheStore(FileCacheStore):
     def _save(self, path, s):
         with open(path, "wb") as f:
             f.write(s)
+        self._index_add(path, len(s))
 
     def _load(self, path):
+        self._check_exists(path)
         with open(path, "rb") as f:
-            return f.read()
+            s = f.read()
+        self._touch(path)
+        return s
+
+    def _check_exists(self, path):
+        # the index may be out of date if the cached file was removed externally
+        if not os.path.exists(path):
+            self._index_remove(path)
+            raise CacheException("Cache miss. Cached file '%s' not found." % path)
 
     def _path_join(self, path, *paths):
         return os.path.join(path, *paths)
@@ -64,8 +380,95 @@ class DiskCacheStore(FileCacheStore):
     def _basename(self, path):
         return os.path.basename(path)
 
+    def _save_mmap(self, path, data):
+        # write to a temporary directory and then move it into place, so that partial entries are never visible
+        tmp_path = tempfile.mkdtemp(dir=os.path.dirname(path))
+        try:
+            if isinstance(data, xr.DataArray):
+                np.save(os.path.join(tmp_path, "data.npy"), data.data)
+                with open(os.path.join(tmp_path, "meta.json"), "w") as f:
+                    json.dump(_get_metadata(data), f, cls=JSONEncoder)
+            else:
+                np.save(os.path.join(tmp_path, "data.npy"), data)
+            os.rename(tmp_path, path)
+        except:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            raise
+        self._index_add(path, _get_path_size(path))
+
+    def _load_mmap(self, path):
+        self._check_exists(path)
+        self._touch(path)
+
+        # copy-on-write: the returned arrays can be modified without changing the cached data
+        values = np.load(os.path.join(path, "data.npy"), mmap_mode="c")
+
+        if path.endswith(".npy.mmap"):
+            return values
+
+        with open(os.path.join(path, "meta.json"), "r") as f:
+            d = json.load(f)
+
+        if path.endswith(".uda.mmap"):
+            return _from_metadata(d, values, podpac.core.units.UnitsDataArray)
+        elif path.endswith(".xrda.mmap"):
+            return _from_metadata(d, values, xr.DataArray)
+        else:
+            raise RuntimeError("Unexpected cached file type '%s'" % self._basename(path))
+
     def _remove(self, path):
-        os.remove(path)
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        elif os.path.exists(path):
+            os.remove(path)
+        self._index_remove(path)
+
+    def _index_add(self, path, size):
+        if self._index is not None:
+            self._index.add(path, size)
+
+    def _index_remove(self, path):
+        if self._index is not None:
+            self._index.remove(path)
+
+    def _touch(self, path):
+        if self._index is None:
+            # record the access time, keeping the modification time as the creation time
+            os.utime(path, (time.time(), os.path.getmtime(path)))
+        else:
+            self._index.touch(path)
+
+    def _list_entries(self):
+        if self._index is None:
+            return list(_scan_entries(self._root_dir_path))
+        return self._index.entries()
+
+    def _evict(self, nbytes):
+        if self._index is None:
+            return super(DiskCacheStore, self)._evict(nbytes)
+
+        # the index tracks the total size, so that only the entries to remove are queried
+        if self.ttl is not None:
+            for path, size in self._index.expired(time.time() - self.ttl):
+                self._remove(path)
+                _stats.evicted(self)
+
+        total = self._index.size()
+        while total + nbytes > self.max_size:
+            entries = self._index.least_recently_used(_EVICT_BATCH_SIZE)
+            if not entries:
+                break
+            for path, size in entries:
+                self._remove(path)
+                _stats.evicted(self)
+                total -= size
+                if total + nbytes <= self.max_size:
+                    break
+
+    def _get_created(self, path):
+        if self._index is None:
+            return os.path.getmtime(path) if os.path.exists(path) else None
+        return self._index.created(path)
 
     def _exists(self, path):
         return os.path.exists(path)
@@ -0,0 +1,161 @@
+"""
+Per-evaluation memoization of shared sub-nodes (common subexpression elimination).
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import copy
+import functools
+import threading
+
+import numpy as np
+
+import podpac
+
+_local = threading.local()
+
+
+def _get_inputs(node):
+    """nodes used as inputs of a node (see Node._base_definition, which includes e.g. the inputs of Arithmetic nodes)"""
+
+    inputs = []
+    for value in node._base_definition.get("inputs", {}).values():
+        if isinstance(value, podpac.Node):
+            inputs.append(value)
+        elif isinstance(value, (list, tuple, np.ndarray)):
+            inputs.extend(elem for elem in value if isinstance(elem, podpac.Node))
+        elif isinstance(value, dict):
+            inputs.extend(elem for elem in value.values() if isinstance(elem, podpac.Node))
+    return inputs
+
+
+def get_shared(node):
+    """Get the hashes of the nodes that are used as an input more than once in the pipeline of a node.
+
+    Parameters
+    ----------
+    node : Node
+        top-level node
+
+    Returns
+    -------
+    shared : set
+        node hashes
+    """
+
+    counts = {}
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        counts[n.hash] = counts.get(n.hash, 0) + 1
+        if counts[n.hash] == 1:
+            stack.extend(_get_inputs(n))
+    return set(h for h, count in counts.items() if count > 1)
+
+
+class EvalMemo(object):
+    """Outputs of shared sub-nodes for a single top-level evaluation.
+
+    Only the outputs of nodes that are used more than once in the pipeline are kept, keyed by node hash and
+    coordinates hash. Outputs are copied when they are stored and when they are retrieved.
+
+    When evaluating a group of coordinates (see :meth:`podpac.Node.eval_group`), the memo also holds the source reads
+    planned for the group members and the reads that are shared by the group members, keyed by node hash.
+
+    When evaluating asynchronously (see :meth:`podpac.Node.eval_async`), the memo also holds the inputs evaluated and the
+    resources (e.g. downloaded files) fetched ahead of time, so that they are not kept on the nodes.
+    """
+
+    def __init__(self, shared, group_reads=None):
+        self._lock = threading.Lock()
+        self._shared = shared
+        self._outputs = {}
+        self.group_reads = group_reads
+        self._reads = {}
+        self._read_locks = {}
+        self._prefetched = {}
+
+    def is_shared(self, node):
+        return node.hash in self._shared
+
+    def get(self, node, coordinates):
+        with self._lock:
+            data = self._outputs.get((node.hash, coordinates.hash))
+        return copy.deepcopy(data) if data is not None else None
+
+    def put(self, node, coordinates, data):
+        data = copy.deepcopy(data)
+        with self._lock:
+            self._outputs[(node.hash, coordinates.hash)] = data
+
+    def add(self, node, coordinates, data):
+        """Add an output that was evaluated ahead of time (e.g. asynchronously), whether or not the node is shared."""
+
+        coordinates = coordinates.transpose(*sorted(coordinates.dims))
+        with self._lock:
+            self._shared.add(node.hash)
+            self._outputs[(node.hash, coordinates.hash)] = data
+
+    def add_prefetched(self, node, key, value):
+        """Add a resource that was fetched ahead of time (e.g. asynchronously) for a node, see `pop_prefetched`."""
+
+        with self._lock:
+            self._prefetched[(node.hash, key)] = value
+
+    def pop_prefetched(self, node, key):
+        """Get and remove a resource that was fetched ahead of time for a node, or None if there is none."""
+
+        with self._lock:
+            return self._prefetched.pop((node.hash, key), None)
+
+    def get_read(self, node, fn):
+        """Get the read shared by the group members for a node, calling ``fn()`` to read it the first time."""
+
+        with self._lock:
+            lock = self._read_locks.setdefault(node.hash, threading.Lock())
+
+        with lock:
+            if node.hash not in self._reads:
+                self._reads[node.hash] = fn()
+            return self._reads[node.hash]
+
+    def __len__(self):
+        return len(self._outputs)
+
+
+def get_eval_memo():
+    """The evaluation memo of the current thread, or None if there is no top-level evaluation in progress."""
+
+    return getattr(_local, "memo", None)
+
+
+def set_eval_memo(memo):
+    _local.memo = memo
+
+
+def propagate_eval_memo(fn):
+    """Wrap a function so that it uses the evaluation memo of the calling thread when it is run in another thread.
+
+    Parameters
+    ----------
+    fn : callable
+        function to run in another thread, e.g. in a thread pool
+
+    Returns
+    -------
+    wrapped : callable
+        wrapped function
+    """
+
+    memo = get_eval_memo()
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        previous = get_eval_memo()
+        set_eval_memo(memo)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            set_eval_memo(previous)
+
+    return wrapper
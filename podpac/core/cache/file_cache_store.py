@@ -5,6 +5,7 @@ import io
 import warnings
 import re
 import hashlib
+import time
 
 try:
     import cPickle as pickle  # python 2
@@ -19,6 +20,8 @@ from podpac.core.settings import settings
 from podpac.core.utils import is_json_serializable
 from podpac.core.cache.utils import CacheException, CacheWildCard
 from podpac.core.cache.cache_store import CacheStore
+from podpac.core.cache.codecs import get_codec, split_codec
+from podpac.core.cache.cache_stats import _stats
 
 
 def _hash_string(s):
@@ -31,6 +34,8 @@ class FileCacheStore(CacheStore):
 
     cache_mode = ""
     cache_modes = ["all"]
+    _codec_setting = None
+    _ttl_setting = None
 
     # -----------------------------------------------------------------------------------------------------------------
     # public cache API methods
@@ -62,7 +67,17 @@ class FileCacheStore(CacheStore):
         # serialize
         path_root = self._path_join(self._get_node_dir(node), self._get_filename(node, key, coordinates))
 
-        if isinstance(data, podpac.core.units.UnitsDataArray):
+        t0 = time.time()
+        s = None
+        if self._use_mmap(data):
+            if isinstance(data, podpac.core.units.UnitsDataArray):
+                path = path_root + ".uda.mmap"
+            elif isinstance(data, xr.DataArray):
+                path = path_root + ".xrda.mmap"
+            else:
+                path = path_root + ".npy.mmap"
+            nbytes = data.nbytes
+        elif isinstance(data, podpac.core.units.UnitsDataArray):
             path = path_root + ".uda.nc"
             s = data.to_netcdf()
         elif isinstance(data, xr.DataArray):
@@ -93,22 +108,36 @@ class FileCacheStore(CacheStore):
             path = path_root + ".pkl"
             s = pickle.dumps(data)
 
+        if s is not None:
+            codec = get_codec(settings.get(self._codec_setting))
+            if codec is not None:
+                # the elements of numpy data are shuffled by their itemsize
+                typesize = data.dtype.itemsize if isinstance(data, (np.ndarray, xr.DataArray)) else 1
+                s = codec.compress(s, typesize=typesize)
+                path = path + "." + codec.name
+            nbytes = len(s)
+        _stats.increment("serialize_time", self, node, key, time.time() - t0)
+
         # check size
-        if self.max_size is not None and self.size + len(s) > self.max_size:
-            # TODO removal policy
-            warnings.warn(
-                "Warning: {cache_mode} cache is full. No longer caching. Consider increasing the limit in "
-                "settings.{cache_limit_setting} or try clearing the cache (e.g. podpac.utils.clear_cache(, "
-                "mode='{cache_mode}') to clear ALL cached results in {cache_mode} cache)".format(
-                    cache_mode=self.cache_mode, cache_limit_setting=self._limit_setting
-                ),
-                UserWarning,
-            )
-            return False
+        if self.max_size is not None:
+            if nbytes > self.max_size:
+                warnings.warn(
+                    "Warning: Object size (%d bytes) exceeds the limit in settings.%s. Not caching. Consider "
+                    "increasing this limit." % (nbytes, self._limit_setting),
+                    UserWarning,
+                )
+                return False
+
+            # remove expired and least recently used entries
+            self._evict(nbytes)
 
         # save
         self._make_node_dir(node)
-        self._save(path, s)
+        if s is None:
+            self._save_mmap(path, data)
+        else:
+            self._save(path, s)
+        _stats.increment("bytes_written", self, node, key, nbytes)
         return True
 
     def get(self, node, key, coordinates=None):
@@ -138,8 +167,21 @@ class FileCacheStore(CacheStore):
         if path is None:
             raise CacheException("Cache miss. Requested data not found.")
 
+        # memory-mapped arrays
+        if path.endswith(".mmap"):
+            data = self._load_mmap(path)
+            _stats.increment("bytes_read", self, node, key, data.nbytes)
+            return data
+
         # read
         s = self._load(path)
+        _stats.increment("bytes_read", self, node, key, len(s))
+
+        # decompress
+        t0 = time.time()
+        path, codec = split_codec(path)
+        if codec is not None:
+            s = codec.decompress(s)
 
         # deserialize
         if path.endswith("uda.nc"):
@@ -162,6 +204,7 @@ class FileCacheStore(CacheStore):
             data = pickle.loads(s)
         else:
             raise RuntimeError("Unexpected cached file type '%s'" % self._basename(path))
+        _stats.increment("serialize_time", self, node, key, time.time() - t0)
 
         return data
 
@@ -235,10 +278,38 @@ class FileCacheStore(CacheStore):
         if len(paths) == 0:
             return None
         elif len(paths) == 1:
+            if self.ttl is not None and self._is_expired(paths[0]):
+                self._remove(paths[0])
+                _stats.evicted(self)
+                return None
             return paths[0]
         elif len(paths) > 1:
             return RuntimeError("Too many cached files matching '%s'" % rootpath)
 
+    @property
+    def ttl(self):
+        """Maximum age of cached entries in seconds, or None for no limit."""
+        return settings.get(self._ttl_setting)
+
+    def _is_expired(self, path):
+        created = self._get_created(path)
+        return created is not None and time.time() - created > self.ttl
+
+    def _evict(self, nbytes):
+        """Remove expired entries, and then least recently used entries until there is room for `nbytes` more bytes."""
+
+        entries = self._list_entries()
+        total = sum(size for path, size, created, accessed in entries)
+
+        now = time.time()
+        for path, size, created, accessed in sorted(entries, key=lambda entry: entry[3]):
+            expired = self.ttl is not None and now - created > self.ttl
+            if not expired and total + nbytes <= self.max_size:
+                continue
+            self._remove(path)
+            _stats.evicted(self)
+            total -= size
+
     def _get_node_dir(self, node):
         fullclass = str(node.__class__)[8:-2]
         subdirs = fullclass.split(".")
@@ -271,6 +342,10 @@ class FileCacheStore(CacheStore):
     def _sanitize(self, s):
         return re.sub("[_:<>/\\\\*]+", "-", s)  # replaces _:<>/\*
 
+    def _use_mmap(self, data):
+        """ Whether to cache the data in the memory-mappable format, using `_save_mmap` and `_load_mmap`. """
+        return False
+
     # -----------------------------------------------------------------------------------------------------------------
     # file storage abstraction
     # -----------------------------------------------------------------------------------------------------------------
@@ -281,6 +356,12 @@ class FileCacheStore(CacheStore):
     def _load(self, path):
         raise NotImplementedError
 
+    def _save_mmap(self, path, data):
+        raise NotImplementedError
+
+    def _load_mmap(self, path):
+        raise NotImplementedError
+
     def _path_join(self, path, *paths):
         raise NotImplementedError
 
@@ -290,6 +371,14 @@ class FileCacheStore(CacheStore):
     def _remove(self, path):
         raise NotImplementedError
 
+    def _list_entries(self):
+        """List the cached entries as (path, size, created, accessed) tuples, with times in seconds since the epoch."""
+        raise NotImplementedError
+
+    def _get_created(self, path):
+        """Get the time (in seconds since the epoch) that the cached entry was created, or None if it is not found."""
+        raise NotImplementedError
+
     def _exists(self, path):
         raise NotImplementedError
 
@@ -0,0 +1,174 @@
+"""
+Process-wide cache of negative results, i.e. requests that are known to produce no data.
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import time
+import errno
+import threading
+from collections import OrderedDict
+
+from podpac.core.settings import settings
+
+
+class NegativeCache(object):
+    """Bounded cache of requests that are known to produce no data.
+
+    Two kinds of negative results are stored:
+
+     * missing sources, i.e. sources that raised a not found error when accessed (a missing file or an HTTP 404),
+       which apply to all requested coordinates. Other errors (e.g. network or permission errors) are not stored.
+     * empty requests, e.g. requested coordinates that do not intersect a data source.
+
+    Entries are keyed by node hash and coordinates hash, kept in least recently used order up to
+    settings.NEGATIVE_CACHE_MAX_ENTRIES, and expire after settings.NEGATIVE_CACHE_TTL seconds.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    @property
+    def enabled(self):
+        return bool(settings["NEGATIVE_CACHE_ENABLED"])
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+
+            ttl = settings["NEGATIVE_CACHE_TTL"]
+            if ttl is not None and time.time() - entry[0] > ttl:
+                return None
+
+            # mark as most recently used
+            self._entries[key] = entry
+            return entry
+
+    def _add(self, key, error):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.time(), error)
+
+            max_entries = settings["NEGATIVE_CACHE_MAX_ENTRIES"]
+            while max_entries is not None and len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def add_missing(self, node, error):
+        """Record that the source for a node is missing, if the error raised when accessing it is a not found error.
+
+        Parameters
+        ----------
+        node : Node
+            node with a missing source
+        error : Exception
+            error raised when accessing the source
+        """
+
+        if self.enabled and is_not_found(error):
+            self._add((node.hash, None), error)
+
+    def get_missing(self, node):
+        """Get the error for a node whose source is known to be missing.
+
+        Parameters
+        ----------
+        node : Node
+            node
+
+        Returns
+        -------
+        error : Exception, None
+            A new error like the error raised when the source was accessed, or None if the source is not known to be
+            missing.
+        """
+
+        if not self.enabled:
+            return None
+        entry = self._get((node.hash, None))
+        if entry is None:
+            return None
+
+        # the stored error is not raised again, since raising it would accumulate tracebacks across calls
+        error = entry[1]
+        try:
+            return type(error)(*error.args)
+        except Exception:
+            return IOError(str(error))
+
+    def add_empty(self, node, coordinates):
+        """Record that a node produces no data for the requested coordinates.
+
+        Parameters
+        ----------
+        node : Node
+            node
+        coordinates : :class:`podpac.Coordinates`
+            requested coordinates
+        """
+
+        if self.enabled:
+            self._add((node.hash, coordinates.hash), None)
+
+    def is_empty(self, node, coordinates):
+        """Check if a node is known to produce no data for the requested coordinates.
+
+        Parameters
+        ----------
+        node : Node
+            node
+        coordinates : :class:`podpac.Coordinates`
+            requested coordinates
+
+        Returns
+        -------
+        empty : bool
+            True if the node is known to produce no data for the requested coordinates.
+        """
+
+        if not self.enabled:
+            return False
+        return self._get((node.hash, coordinates.hash)) is not None
+
+    def rem(self, node):
+        """Remove all entries for a node."""
+
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == node.hash]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def is_not_found(error):
+    """Check if an error raised when accessing a source means that the source does not exist.
+
+    Parameters
+    ----------
+    error : Exception
+        error raised when accessing a source
+
+    Returns
+    -------
+    not_found : bool
+        True for missing files and HTTP 404 errors.
+    """
+
+    if isinstance(error, FileNotFoundError) or getattr(error, "errno", None) == errno.ENOENT:
+        return True
+
+    # requests.HTTPError, urllib.error.HTTPError
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    if status is None:
+        status = getattr(error, "code", None)
+    return status == 404
+
+
+_negative_cache = NegativeCache()
@@ -1,16 +1,95 @@
 from __future__ import division, print_function, absolute_import
 
+import sys
+import json
 import threading
 import copy
 import warnings
-import os
-import psutil
+from collections import OrderedDict, namedtuple
 
+import numpy as np
+import xarray as xr
+
+import podpac
 from podpac.core.settings import settings
 from podpac.core.cache.utils import CacheException, CacheWildCard
 from podpac.core.cache.cache_store import CacheStore
+from podpac.core.cache.cache_stats import _stats
+from podpac.core.cache.coordinates_index import _index as _coordinates_index
+
+_RamCacheEntry = namedtuple("_RamCacheEntry", ["data", "nbytes"])
+
+
+def _get_nbytes(data):
+    """Approximate number of bytes used by an object stored in the RAM cache.
+
+    Parameters
+    ----------
+    data : any
+        cached object
+
+    Returns
+    -------
+    nbytes : int
+        size of the object in bytes. Arrays report the size of their data (and coordinates), podpac objects and other
+        json-serializable objects report the size of their json serialization.
+    """
+
+    if isinstance(data, np.ndarray):
+        return data.nbytes
+    elif isinstance(data, xr.DataArray):
+        return data.nbytes + sum(c.nbytes for c in data.coords.values())
+    elif isinstance(data, xr.Dataset):
+        return sum(v.nbytes for v in data.variables.values())
+    elif isinstance(data, (podpac.Coordinates, podpac.Node)):
+        return len(data.json)
+
+    try:
+        return len(json.dumps(data))
+    except (TypeError, ValueError):
+        return sys.getsizeof(data)
+
+
+def _read_only(data):
+    """Read-only view of a cached object, without copying the underlying array data.
+
+    Parameters
+    ----------
+    data : any
+        cached object
+
+    Returns
+    -------
+    view : any
+        numpy arrays and xarray objects are returned as shallow copies with the writeable flag of the data cleared,
+        other objects are deep copied.
+    """
+
+    if isinstance(data, np.ndarray):
+        view = data.view()
+        view.flags.writeable = False
+        return view
+    elif isinstance(data, xr.DataArray):
+        return data.copy(deep=False, data=_read_only(data.data))
+    elif isinstance(data, xr.Dataset):
+        return data.copy(deep=False, data={k: _read_only(v.data) for k, v in data.data_vars.items()})
+
+    return copy.deepcopy(data)
+
+
+class _RamCache(object):
+    """Process-wide storage for the RAM cache, shared by all threads.
 
-_thread_local = threading.local()
+    Entries are kept in least recently used order. All access must hold the `lock`.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.entries = OrderedDict()
+        self.nbytes = 0
+
+
+_cache = _RamCache()
 
 
 class RamCacheStore(CacheStore):
@@ -19,13 +98,19 @@ class RamCacheStore(CacheStore):
 
     Notes
     -----
-     * the cache is thread-safe, but not yet accessible across separate processes
-     * there is not yet a max RAM usage setting or a removal policy.
+     * the cache is shared by all threads in the process and is thread-safe.
+     * the cache is not shared between separate processes. Processes started with `fork` (e.g. the `Process` node on
+       linux) start with a copy of the cache contents of the parent process, but additions are not shared.
+     * by default, cached objects are deep copied when retrieved. If settings.RAM_CACHE_READ_ONLY is True, arrays are
+       instead returned as read-only views of the cached data.
+     * the size of each cached object is tracked, and the least recently used entries are removed as necessary to keep
+       the total size of the cached objects under the limit in settings.RAM_CACHE_MAX_BYTES.
     """
 
     cache_mode = "ram"
     cache_modes = set(["ram", "all"])
     _limit_setting = "RAM_CACHE_MAX_BYTES"
+    _promote_setting = "RAM_CACHE_PROMOTE"
 
     def __init__(self, max_size=None, use_settings_limit=True):
         """Summary
@@ -48,12 +133,29 @@ class RamCacheStore(CacheStore):
         super(CacheStore, self).__init__()
 
     def _get_full_key(self, node, key, coordinates):
-        return (node.json, key, coordinates.json if coordinates is not None else None)
+        # the node and coordinates hashes are computed once per object
+        return (node.hash, key, coordinates.hash if coordinates is not None else None)
 
     @property
     def size(self):
-        process = psutil.Process(os.getpid())
-        return process.memory_info().rss  # this is actually the total size of the process
+        """Return total size of the cached objects in bytes"""
+        return _cache.nbytes
+
+    def _add(self, full_key, data, nbytes):
+        _cache.entries[full_key] = _RamCacheEntry(data, nbytes)
+        _cache.nbytes += nbytes
+
+    def _remove(self, full_key):
+        entry = _cache.entries.pop(full_key)
+        _cache.nbytes -= entry.nbytes
+
+    def _evict(self, nbytes):
+        """Remove least recently used entries until there is room for `nbytes` more bytes."""
+        while _cache.entries and _cache.nbytes + nbytes > self.max_size:
+            full_key = next(iter(_cache.entries))
+            self._remove(full_key)
+            _coordinates_index.discard(*full_key)
+            _stats.evicted(self)
 
     def put(self, node, data, key, coordinates=None, update=True):
         """Cache data for specified node.
@@ -72,26 +174,31 @@ class RamCacheStore(CacheStore):
             If True existing data in cache will be updated with `data`, If False, error will be thrown if attempting put something into the cache with the same node, key, coordinates of an existing entry.
         """
 
-        if not hasattr(_thread_local, "cache"):
-            _thread_local.cache = {}
-
         full_key = self._get_full_key(node, key, coordinates)
+        nbytes = _get_nbytes(data)
+
+        with _cache.lock:
+            if not update and full_key in _cache.entries:
+                raise CacheException("Cache entry already exists. Use update=True to overwrite.")
 
-        if not update and full_key in _thread_local.cache:
-            raise CacheException("Cache entry already exists. Use update=True to overwrite.")
+            if full_key in _cache.entries:
+                self._remove(full_key)
 
-        self.rem(node, key, coordinates)
+            if self.max_size is not None:
+                if nbytes > self.max_size:
+                    warnings.warn(
+                        "Warning: Object size (%d bytes) exceeds the limit in settings.RAM_CACHE_MAX_BYTES. "
+                        "Not caching. Consider increasing this limit." % nbytes,
+                        UserWarning,
+                    )
+                    return False
 
-        if self.max_size is not None and self.size >= self.max_size:
-            #     # TODO removal policy
-            warnings.warn(
-                "Warning: Process is using more RAM than the specified limit in settings.RAM_CACHE_MAX_BYTES. No longer caching. Consider increasing this limit or try clearing the cache (e.g. podpac.utils.clear_cache(mode='RAM') to clear ALL cached results in RAM)",
-                UserWarning,
-            )
-            return False
+                # remove least recently used entries
+                self._evict(nbytes)
 
-        # TODO include insert date, last retrieval date, and/or # retrievals for use in a removal policy
-        _thread_local.cache[full_key] = data
+            self._add(full_key, data, nbytes)
+        _stats.increment("bytes_written", self, node, key, nbytes)
+        return True
 
     def get(self, node, key, coordinates=None):
         """Get cached data for this node.
@@ -108,7 +215,8 @@ class RamCacheStore(CacheStore):
         Returns
         -------
         data : any
-            The cached data.
+            The cached data. If settings.RAM_CACHE_READ_ONLY is True, arrays are returned as read-only views of the
+            cached data, otherwise a copy of the cached data is returned.
         
         Raises
         -------
@@ -116,15 +224,20 @@ class RamCacheStore(CacheStore):
             If the data is not in the cache.
         """
 
-        if not hasattr(_thread_local, "cache"):
-            _thread_local.cache = {}
-
         full_key = self._get_full_key(node, key, coordinates)
 
-        if full_key not in _thread_local.cache:
-            raise CacheException("Cache miss. Requested data not found.")
+        with _cache.lock:
+            if full_key not in _cache.entries:
+                raise CacheException("Cache miss. Requested data not found.")
 
-        return copy.deepcopy(_thread_local.cache[full_key])
+            # mark as most recently used
+            entry = _cache.entries.pop(full_key)
+            _cache.entries[full_key] = entry
+        _stats.increment("bytes_read", self, node, key, entry.nbytes)
+
+        if settings["RAM_CACHE_READ_ONLY"]:
+            return _read_only(entry.data)
+        return copy.deepcopy(entry.data)
 
     def has(self, node, key, coordinates=None):
         """Check for cached data for this node
@@ -144,11 +257,9 @@ class RamCacheStore(CacheStore):
              True if there as a cached object for this node for the given key and coordinates.
         """
 
-        if not hasattr(_thread_local, "cache"):
-            _thread_local.cache = {}
-
         full_key = self._get_full_key(node, key, coordinates)
-        return full_key in _thread_local.cache
+        with _cache.lock:
+            return full_key in _cache.entries
 
     def rem(self, node, key=CacheWildCard(), coordinates=CacheWildCard()):
         """Delete cached data for this node.
@@ -163,28 +274,28 @@ class RamCacheStore(CacheStore):
             Delete only cached objects for these coordinates.
         """
 
-        if not hasattr(_thread_local, "cache"):
-            _thread_local.cache = {}
-
-        node_key = node.json
+        node_key = node.hash
 
         if not isinstance(coordinates, CacheWildCard):
-            coordinates_key = coordinates.json if coordinates is not None else None
+            coordinates_key = coordinates.hash if coordinates is not None else None
 
-        # loop through keys looking for matches
-        rem_keys = []
-        for nk, k, ck in _thread_local.cache.keys():
-            if nk != node_key:
-                continue
-            if not isinstance(key, CacheWildCard) and k != key:
-                continue
-            if not isinstance(coordinates, CacheWildCard) and ck != coordinates_key:
-                continue
+        with _cache.lock:
+            # loop through keys looking for matches
+            rem_keys = []
+            for nk, k, ck in _cache.entries.keys():
+                if nk != node_key:
+                    continue
+                if not isinstance(key, CacheWildCard) and k != key:
+                    continue
+                if not isinstance(coordinates, CacheWildCard) and ck != coordinates_key:
+                    continue
 
-            rem_keys.append((nk, k, ck))
+                rem_keys.append((nk, k, ck))
 
-        for k in rem_keys:
-            del _thread_local.cache[k]
+            for k in rem_keys:
+                self._remove(k)
 
     def clear(self):
-        _thread_local.cache = {}
+        with _cache.lock:
+            _cache.entries.clear()
+            _cache.nbytes = 0
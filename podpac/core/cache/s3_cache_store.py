@@ -1,9 +1,11 @@
 from __future__ import division, print_function, absolute_import
 
 import fnmatch
+import calendar
 from lazy_import import lazy_module
 
 boto3 = lazy_module("boto3")
+botocore = lazy_module("botocore")
 
 import podpac
 from podpac.core.settings import settings
@@ -11,11 +13,18 @@ from podpac.core.cache.utils import CacheException, CacheWildCard
 from podpac.core.cache.file_cache_store import FileCacheStore
 
 
+def _timestamp(dt):
+    return calendar.timegm(dt.utctimetuple())
+
+
 class S3CacheStore(FileCacheStore):  # pragma: no cover
 
     cache_mode = "s3"
     cache_modes = set(["s3", "all"])
     _limit_setting = "S3_CACHE_MAX_BYTES"
+    _promote_setting = "S3_CACHE_PROMOTE"
+    _codec_setting = "S3_CACHE_CODEC"
+    _ttl_setting = "S3_CACHE_TTL"
     _delim = "/"
 
     def __init__(self, s3_bucket=None, aws_region_name=None, aws_access_key_id=None, aws_secret_access_key=None):
@@ -140,6 +149,23 @@ class S3CacheStore(FileCacheStore):  # pragma: no cover
     def _remove(self, path):
         self._s3_client.delete_object(Bucket=self._s3_bucket, Key=path)
 
+    def _list_entries(self):
+        # S3 does not record access times, so the last modified time is used for both
+        paginator = self._s3_client.get_paginator("list_objects_v2")
+        entries = []
+        for page in paginator.paginate(Bucket=self._s3_bucket, Prefix=self._root_dir_path):
+            for obj in page.get("Contents", []):
+                modified = _timestamp(obj["LastModified"])
+                entries.append((obj["Key"], obj["Size"], modified, modified))
+        return entries
+
+    def _get_created(self, path):
+        try:
+            response = self._s3_client.head_object(Bucket=self._s3_bucket, Key=path)
+        except botocore.exceptions.ClientError:
+            return None
+        return _timestamp(response["LastModified"])
+
     def _exists(self, path):
         response = self._s3_client.list_objects_v2(Bucket=self._s3_bucket, Prefix=path)
         obj_count = response["KeyCount"]
@@ -0,0 +1,97 @@
+"""
+Coalescing of concurrent identical node evaluations.
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import copy
+import threading
+
+
+class _Flight(object):
+    def __init__(self):
+        self.thread = threading.current_thread()
+        self.done = threading.Event()
+        self.waiters = 0
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """Process-wide registry of in-flight evaluations.
+
+    The first thread to request a key computes the result, and other threads requesting the same key while it is in
+    flight wait for the result instead of computing it themselves. Waiting threads receive a copy of the result, or the
+    exception raised by the computing thread. Nested requests for a key from the computing thread are computed
+    directly.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+
+    def do(self, key, fn):
+        """Compute ``fn()``, or wait for the result of an identical in-flight computation.
+
+        Parameters
+        ----------
+        key : hashable
+            key identifying the computation
+        fn : callable
+            function that computes the result
+
+        Returns
+        -------
+        result : any
+            The result, a copy of the result if it was computed by another thread.
+        shared : bool
+            True if the result was computed by another thread.
+        """
+
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                leader = True
+            elif flight.thread is threading.current_thread():
+                flight = None
+                leader = False
+            else:
+                flight.waiters += 1
+                leader = False
+
+        # nested request from the computing thread
+        if flight is None:
+            return fn(), False
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.result), True
+
+        try:
+            result = fn()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            # no more threads can wait on the flight once it is removed
+            with self._lock:
+                del self._flights[key]
+
+            # the computing thread may modify its result, so waiting threads copy from a snapshot
+            if flight.error is None and flight.waiters:
+                flight.result = copy.deepcopy(result)
+            flight.done.set()
+
+        return result, False
+
+    def in_flight(self):
+        """Number of keys currently being computed."""
+
+        with self._lock:
+            return len(self._flights)
+
+
+_single_flight = SingleFlight()
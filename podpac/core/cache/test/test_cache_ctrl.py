@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 
 import podpac
 
@@ -7,6 +8,9 @@ from podpac.core.cache.ram_cache_store import RamCacheStore
 from podpac.core.cache.disk_cache_store import DiskCacheStore
 from podpac.core.cache.cache_ctrl import CacheCtrl
 from podpac.core.cache.cache_ctrl import get_default_cache_ctrl, make_cache_ctrl, clear_cache
+from podpac.core.cache.cache_ctrl import get_tier_stats, reset_tier_stats
+from podpac.core.cache.cache_writer import _writer
+from podpac.core.cache.cache_stats import stats, reset_stats, _stats, _format_bytes
 
 
 class CacheCtrlTestNode(podpac.Node):
@@ -87,6 +91,105 @@ class TestCacheCtrl(object):
         assert ctrl._cache_stores[1].get(NODE, "key") == 10
         assert ctrl.get(NODE, "key") == 10
 
+    def test_promote(self):
+        ctrl = CacheCtrl(cache_stores=[RamCacheStore(), DiskCacheStore()])
+        ctrl.clear()
+        reset_tier_stats()
+
+        # put only in disk, get promotes to ram
+        ctrl._cache_stores[1].put(NODE, 10, "key")
+        assert ctrl.get(NODE, "key") == 10
+        assert ctrl._cache_stores[0].has(NODE, "key")
+        assert get_tier_stats() == {
+            "ram": {"hits": 0, "misses": 1, "promotions": 1},
+            "disk": {"hits": 1, "misses": 0, "promotions": 0},
+        }
+
+        # the tier counts are a view of the cache operation statistics
+        assert stats()["ram"]["promotions"] == 1
+        assert stats()["ram"]["nodes"]["CacheCtrlTestNode"]["key"]["misses"] == 1
+
+        # subsequent gets are served from ram
+        assert ctrl.get(NODE, "key") == 10
+        assert get_tier_stats()["ram"]["hits"] == 1
+        assert get_tier_stats()["disk"]["hits"] == 1
+
+        # no promotion
+        with podpac.settings:
+            podpac.settings["RAM_CACHE_PROMOTE"] = False
+            ctrl._cache_stores[1].put(NODE, 20, "key2")
+            assert ctrl.get(NODE, "key2") == 20
+            assert not ctrl._cache_stores[0].has(NODE, "key2")
+
+        # miss
+        reset_tier_stats()
+        with pytest.raises(CacheException):
+            ctrl.get(NODE, "key3")
+        assert get_tier_stats() == {
+            "ram": {"hits": 0, "misses": 1, "promotions": 0},
+            "disk": {"hits": 0, "misses": 1, "promotions": 0},
+        }
+
+        ctrl.clear()
+
+    def test_stats(self):
+        ctrl = CacheCtrl(cache_stores=[RamCacheStore(), DiskCacheStore()])
+        ctrl.clear()
+        reset_stats()
+
+        ctrl.put(NODE, np.ones(10), "key")
+        assert ctrl.has(NODE, "key")
+        ctrl.get(NODE, "key")
+        with pytest.raises(CacheException):
+            ctrl.get(NODE, "key2")
+
+        s = stats()
+        assert set(s) == {"ram", "disk"}
+        ram = s["ram"]["nodes"]["CacheCtrlTestNode"]
+        disk = s["disk"]["nodes"]["CacheCtrlTestNode"]
+        assert ram["key"]["put"]["count"] == 1
+        assert ram["key"]["has"]["count"] == 1
+        assert ram["key"]["get"]["count"] == 1
+        assert sum(ram["key"]["get"]["histogram"].values()) == 1
+        assert ram["key"]["hits"] == 1
+        assert ram["key"]["bytes_written"] == 80
+        assert ram["key"]["bytes_read"] == 80
+        assert ram["key2"]["misses"] == 1
+        assert disk["key"]["put"]["count"] == 1
+        assert disk["key"]["get"]["count"] == 0
+        assert disk["key"]["bytes_written"] == 80
+        assert disk["key"]["serialize_time"] >= 0
+        assert disk["key2"]["misses"] == 1
+
+        # evictions
+        with podpac.settings:
+            podpac.settings["RAM_CACHE_MAX_BYTES"] = 100
+            ctrl.put(NODE, np.ones(10), "key3")
+        assert stats()["ram"]["evictions"] == 1
+
+        # summary
+        assert "CacheCtrlTestNode key" in _stats.summary()
+
+        reset_stats()
+        assert stats() == {}
+        ctrl.clear()
+
+    def test_stats_log(self, caplog):
+        ctrl = CacheCtrl(cache_stores=[RamCacheStore()])
+        with podpac.settings:
+            podpac.settings["CACHE_STATS_LOG_INTERVAL"] = 0
+            with caplog.at_level("INFO", logger="podpac.core.cache.cache_stats"):
+                ctrl.put(NODE, 10, "key")
+        assert "Cache stats" in caplog.text
+        ctrl.clear()
+
+    def test_stats_format_bytes(self):
+        assert _format_bytes(10) == "10 B"
+        assert _format_bytes(1536) == "1.5 KB"
+        assert _format_bytes(3 * 1024 ** 3) == "3.0 GB"
+        assert _format_bytes(2 * 1024 ** 4) == "2.0 TB"
+        assert _format_bytes(2048 * 1024 ** 4) == "2048.0 TB"
+
     def test_get_cache_miss(self):
         ctrl = CacheCtrl(cache_stores=[RamCacheStore(), DiskCacheStore()])
         ctrl.clear()
@@ -94,6 +197,93 @@ class TestCacheCtrl(object):
         with pytest.raises(CacheException, match="Requested data is not in any cache stores"):
             ctrl.get(NODE, "key")
 
+    def test_find_superset(self):
+        ctrl = CacheCtrl(cache_stores=[RamCacheStore(), DiskCacheStore()])
+        ctrl.clear()
+
+        coords = podpac.Coordinates([[0, 1, 2, 3], [10, 20]], dims=["lat", "lon"])
+        requested = podpac.Coordinates([[1, 2], [10, 20]], dims=["lat", "lon"])
+        other = podpac.Coordinates([[1, 3], [10, 20]], dims=["lat", "lon"])
+
+        assert ctrl.find_superset(NODE, "key", requested) == (None, None)
+
+        ctrl.put(NODE, 10, "key", coordinates=coords)
+        cached, indices = ctrl.find_superset(NODE, "key", requested)
+        assert cached == coords
+        assert indices == {"lat": slice(1, 3), "lon": slice(0, 2)}
+        assert ctrl.find_superset(NODE, "key", other) == (None, None)
+        assert ctrl.find_superset(NODE, "other", requested) == (None, None)
+
+        # removed
+        ctrl.rem(NODE, "key", coordinates=coords, mode="ram")
+        assert ctrl.find_superset(NODE, "key", requested, mode="ram") == (None, None)
+        assert ctrl.find_superset(NODE, "key", requested)[0] == coords
+
+        ctrl.rem(NODE, "key", coordinates=coords)
+        assert ctrl.find_superset(NODE, "key", requested) == (None, None)
+
+    def test_write_behind(self):
+        ctrl = CacheCtrl(cache_stores=[RamCacheStore(), DiskCacheStore()])
+        ctrl.clear()
+
+        data = np.zeros(3)
+        with podpac.settings:
+            podpac.settings["CACHE_WRITE_BEHIND"] = True
+            ctrl.put(NODE, data, "key")
+
+            # pending writes are available before they are written
+            data[:] = 1
+            assert ctrl.has(NODE, "key", mode="disk")
+            np.testing.assert_array_equal(ctrl.get(NODE, "key", mode="disk"), [0, 0, 0])
+
+            ctrl.flush()
+            assert ctrl._cache_stores[0].has(NODE, "key")
+            assert ctrl._cache_stores[1].has(NODE, "key")
+            np.testing.assert_array_equal(ctrl._cache_stores[1].get(NODE, "key"), [0, 0, 0])
+
+            # rem waits for pending writes
+            ctrl.put(NODE, data, "key2")
+            ctrl.rem(NODE, "*")
+            assert not ctrl.has(NODE, "key")
+            assert not ctrl.has(NODE, "key2")
+
+            ctrl.close()
+
+    def test_write_behind_policy(self):
+        ctrl = CacheCtrl(cache_stores=[DiskCacheStore()])
+        ctrl.clear()
+        ctrl.close()
+
+        with podpac.settings:
+            podpac.settings["CACHE_WRITE_BEHIND"] = True
+            podpac.settings["CACHE_WRITE_BEHIND_THREADS"] = 0
+            podpac.settings["CACHE_WRITE_BEHIND_QUEUE_SIZE"] = 1
+
+            # the first write is queued (but never written without writer threads)
+            podpac.settings["CACHE_WRITE_BEHIND_POLICY"] = "drop"
+            ctrl.put(NODE, 10, "key1")
+            assert ctrl.has(NODE, "key1")
+
+            # the queue is full
+            ctrl.put(NODE, 10, "key2")
+            assert not ctrl.has(NODE, "key2")
+
+            podpac.settings["CACHE_WRITE_BEHIND_POLICY"] = "sync"
+            ctrl.put(NODE, 10, "key3")
+            assert ctrl._cache_stores[0].has(NODE, "key3")
+
+            podpac.settings["CACHE_WRITE_BEHIND_POLICY"] = "other"
+            with pytest.raises(ValueError, match="Invalid CACHE_WRITE_BEHIND_POLICY"):
+                ctrl.put(NODE, 10, "key4")
+
+            # discard the queued write
+            _writer._queue.get()
+            _writer._queue.task_done()
+            _writer._pending.clear()
+            ctrl.close()
+
+        ctrl.clear()
+
     def test_put_rem(self):
         ctrl = CacheCtrl(cache_stores=[RamCacheStore(), DiskCacheStore()])
 
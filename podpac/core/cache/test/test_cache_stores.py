@@ -2,6 +2,10 @@ import os
 import shutil
 import copy
 import tempfile
+import threading
+import time
+import sqlite3
+from contextlib import closing
 
 import pytest
 import xarray as xr
@@ -219,8 +223,14 @@ class BaseCacheStoreTests(object):
 
         store.put(NODE1, "11111111", "mykey1")
 
-        with pytest.warns(UserWarning, match="Warning: .* cache is full"):
-            store.put(NODE1, "11111111", "mykey2")
+        # least recently used entries are removed
+        store.put(NODE1, "11111111", "mykey2")
+        assert not store.has(NODE1, "mykey1")
+        assert store.has(NODE1, "mykey2")
+
+        with pytest.warns(UserWarning, match="exceeds the limit"):
+            store.put(NODE1, "111111111111", "mykey3")
+        assert not store.has(NODE1, "mykey3")
 
 
 class FileCacheStoreTests(BaseCacheStoreTests):
@@ -287,27 +297,100 @@ class TestRamCacheStore(BaseCacheStoreTests):
 
     def setup_method(self):
         super(TestRamCacheStore, self).setup_method()
-
-        from podpac.core.cache.ram_cache_store import _thread_local
-
-        if hasattr(_thread_local, "cache"):
-            delattr(_thread_local, "cache")
+        RamCacheStore().clear()
 
     def teardown_method(self):
         super(TestRamCacheStore, self).teardown_method()
+        RamCacheStore().clear()
+
+    def test_size(self):
+        store = self.Store()
+        assert store.size == 0
 
-        from podpac.core.cache.ram_cache_store import _thread_local
+        store.put(NODE1, 10, "mykey1")
+        assert store.size == 2
 
-        if hasattr(_thread_local, "cache"):
-            delattr(_thread_local, "cache")
+        store.put(NODE1, np.zeros(10), "mykey2")
+        assert store.size == 82
 
-    @pytest.mark.skip(reason="not testable")
-    def test_size(self):
-        pass
+        store.put(NODE1, podpac.core.units.UnitsDataArray.create(COORDS2), "mykey3")
+        assert store.size == 82 + 9 * 8 + 3 * 8 + 3 * 8
+
+        store.rem(NODE1, "mykey2")
+        assert store.size == 2 + 9 * 8 + 3 * 8 + 3 * 8
+
+        store.clear()
+        assert store.size == 0
 
-    @pytest.mark.skip(reason="not testable")
     def test_limit(self):
-        super(TestRamCacheStore, self).test_size()
+        podpac.settings[self.limit_setting] = 20
+        store = self.Store()
+
+        store.put(NODE1, "11111111", "mykey1")
+        store.put(NODE1, "11111111", "mykey2")
+        assert store.size == 20
+
+        # least recently used entries are removed
+        store.get(NODE1, "mykey1")
+        store.put(NODE1, "11111111", "mykey3")
+        assert store.has(NODE1, "mykey1")
+        assert not store.has(NODE1, "mykey2")
+        assert store.has(NODE1, "mykey3")
+        assert store.size == 20
+
+        # objects larger than the limit are not cached
+        with pytest.warns(UserWarning, match="exceeds the limit"):
+            assert store.put(NODE1, "1" * 20, "mykey4") is False
+        assert not store.has(NODE1, "mykey4")
+        assert store.has(NODE1, "mykey1")
+        assert store.has(NODE1, "mykey3")
+
+    def test_read_only(self):
+        store = self.Store()
+
+        data = podpac.core.units.UnitsDataArray.create(COORDS2, data=0)
+        store.put(NODE1, data, "mykey1")
+        store.put(NODE1, np.zeros(3), "mykey2")
+        store.put(NODE1, [1, 2, 3], "mykey3")
+
+        # copies by default
+        cached = store.get(NODE1, "mykey1")
+        assert not np.shares_memory(cached.data, data.data)
+        cached[:] = 1
+
+        # read-only views
+        podpac.settings["RAM_CACHE_READ_ONLY"] = True
+        cached = store.get(NODE1, "mykey1")
+        assert isinstance(cached, podpac.core.units.UnitsDataArray)
+        assert np.shares_memory(cached.data, data.data)
+        with pytest.raises(ValueError):
+            cached[:] = 1
+        np.testing.assert_array_equal(store.get(NODE1, "mykey1"), 0)
+
+        cached.attrs["layer_style"] = "mystyle"
+        assert "layer_style" not in store.get(NODE1, "mykey1").attrs
+
+        cached = store.get(NODE1, "mykey2")
+        with pytest.raises(ValueError):
+            cached[:] = 1
+
+        cached = store.get(NODE1, "mykey3")
+        cached.append(4)
+        assert store.get(NODE1, "mykey3") == [1, 2, 3]
+
+    def test_shared_between_threads(self):
+        store = self.Store()
+        store.put(NODE1, 10, "mykey1")
+
+        def f():
+            assert store.get(NODE1, "mykey1") == 10
+            store.put(NODE1, 20, "mykey2")
+
+        thread = threading.Thread(target=f)
+        thread.start()
+        thread.join()
+
+        assert store.get(NODE1, "mykey2") == 20
 
 
 class TestDiskCacheStore(FileCacheStoreTests):
@@ -358,9 +441,316 @@ class TestDiskCacheStore(FileCacheStoreTests):
 
         p1 = store.find(NODE1, "mykey1", None)
         p2 = store.find(NODE1, "mykey2", None)
-        expected_size = os.path.getsize(p1) + os.path.getsize(p2)
+        expected_size = os.path.getsize(p1) + sum(os.path.getsize(os.path.join(p2, f)) for f in os.listdir(p2))
         assert store.size == expected_size
 
+    def test_mmap(self):
+        store = self.Store()
+
+        # units data array
+        data = podpac.core.units.UnitsDataArray.create(COORDS1, data=np.random.random(COORDS1.shape))
+        data.attrs["units"] = podpac.core.units.ureg.m
+        store.put(NODE1, data, "mykey1")
+        assert store.find(NODE1, "mykey1").endswith(".uda.mmap")
+        cached = store.get(NODE1, "mykey1")
+        assert isinstance(cached, podpac.core.units.UnitsDataArray)
+        assert isinstance(cached.data.base, np.memmap)
+        xr.testing.assert_identical(cached, data)
+
+        # stacked coordinates
+        coords = podpac.Coordinates([[[0, 1, 2], [10, 20, 30]]], dims=["lat_lon"])
+        data = podpac.core.units.UnitsDataArray.create(coords, data=np.array([1.0, 2.0, 3.0]))
+        store.put(NODE1, data, "mykey2")
+        cached = store.get(NODE1, "mykey2")
+        xr.testing.assert_identical(cached, data)
+
+        # xarray and numpy
+        data = xr.DataArray([1, 2, 3], dims=["x"], coords={"x": [4, 5, 6]}, name="a", attrs={"b": "c"})
+        store.put(NODE1, data, "mykey3")
+        assert store.find(NODE1, "mykey3").endswith(".xrda.mmap")
+        xr.testing.assert_identical(store.get(NODE1, "mykey3"), data)
+
+        data = np.array([1, 2, 3])
+        store.put(NODE1, data, "mykey4")
+        assert store.find(NODE1, "mykey4").endswith(".npy.mmap")
+        np.testing.assert_equal(store.get(NODE1, "mykey4"), data)
+
+        # copy-on-write
+        cached = store.get(NODE1, "mykey4")
+        cached[:] = 0
+        np.testing.assert_equal(store.get(NODE1, "mykey4"), data)
+
+        # remove
+        store.rem(NODE1, "mykey1")
+        assert not store.has(NODE1, "mykey1")
+
+    def test_mmap_disabled(self):
+        podpac.settings["DISK_CACHE_MMAP"] = False
+        store = self.Store()
+
+        data = podpac.core.units.UnitsDataArray([1, 2, 3], attrs={"units": "m"})
+        store.put(NODE1, data, "mykey")
+        assert store.find(NODE1, "mykey").endswith(".uda.nc")
+
+        # entries are readable regardless of the setting
+        podpac.settings["DISK_CACHE_MMAP"] = True
+        xr.testing.assert_identical(store.get(NODE1, "mykey"), data)
+
+    @pytest.mark.parametrize("codec", ["zlib", "zstd", "lz4", "blosc"])
+    def test_codec(self, codec):
+        if codec != "zlib":
+            pytest.importorskip({"zstd": "zstandard", "lz4": "lz4", "blosc": "blosc"}[codec])
+
+        podpac.settings["DISK_CACHE_MMAP"] = False
+        podpac.settings["DISK_CACHE_CODEC"] = codec
+        store = self.Store()
+
+        data = podpac.core.units.UnitsDataArray(np.zeros((3, 4)), dims=["lat", "lon"], attrs={"units": "m"})
+        store.put(NODE1, data, "mykey1")
+        store.put(NODE1, np.zeros(1000), "mykey2")
+        store.put(NODE1, 10, "mykey3")
+        assert store.find(NODE1, "mykey1").endswith(".uda.nc." + codec)
+        assert store.find(NODE1, "mykey2").endswith(".npy." + codec)
+        assert store.find(NODE1, "mykey3").endswith(".json." + codec)
+        assert store.size < 8000
+
+        # entries are readable regardless of the codec setting
+        podpac.settings["DISK_CACHE_CODEC"] = None
+        xr.testing.assert_identical(store.get(NODE1, "mykey1"), data)
+        np.testing.assert_array_equal(store.get(NODE1, "mykey2"), np.zeros(1000))
+        assert store.get(NODE1, "mykey3") == 10
+
+        store.put(NODE1, 10, "mykey3")
+        assert store.find(NODE1, "mykey3").endswith(".json")
+
+    def test_codec_typesize(self, monkeypatch):
+        from podpac.core.cache.codecs import CODECS
+
+        typesizes = []
+        compress = CODECS["zlib"].compress
+
+        def recorded(s, typesize=1):
+            typesizes.append(typesize)
+            return compress(s, typesize=typesize)
+
+        monkeypatch.setattr(CODECS["zlib"], "compress", recorded)
+        podpac.settings["DISK_CACHE_MMAP"] = False
+        podpac.settings["DISK_CACHE_CODEC"] = "zlib"
+        store = self.Store()
+
+        # numpy data is shuffled by itemsize, other data by byte
+        store.put(NODE1, np.zeros(10, dtype="float32"), "mykey1")
+        store.put(NODE1, podpac.core.units.UnitsDataArray(np.zeros(3, dtype="int16"), dims=["lat"]), "mykey2")
+        store.put(NODE1, 10, "mykey3")
+        assert typesizes == [4, 2, 1]
+
+    def test_codec_invalid(self):
+        podpac.settings["DISK_CACHE_CODEC"] = "other"
+        store = self.Store()
+        with pytest.raises(ValueError, match="Unknown cache codec"):
+            store.put(NODE1, 10, "mykey")
+
+    def test_codec_unavailable(self):
+        from podpac.core.cache.codecs import CODECS
+
+        podpac.settings["DISK_CACHE_CODEC"] = "zstd"
+        store = self.Store()
+        module = CODECS["zstd"].module
+        try:
+            CODECS["zstd"].module = "not_a_module"
+            with pytest.warns(UserWarning, match="Using 'zlib' instead"):
+                store.put(NODE1, 10, "mykey")
+        finally:
+            CODECS["zstd"].module = module
+        assert store.find(NODE1, "mykey").endswith(".json.zlib")
+        assert store.get(NODE1, "mykey") == 10
+
+    def test_lru(self):
+        podpac.settings[self.limit_setting] = 30
+        store = self.Store()
+
+        store.put(NODE1, "11111111", "mykey1")
+        store.put(NODE1, "11111111", "mykey2")
+        store.put(NODE1, "11111111", "mykey3")
+        store.get(NODE1, "mykey1")
+
+        store.put(NODE1, "11111111", "mykey4")
+        assert store.has(NODE1, "mykey1")
+        assert not store.has(NODE1, "mykey2")
+        assert store.has(NODE1, "mykey3")
+        assert store.has(NODE1, "mykey4")
+
+    def test_ttl(self):
+        podpac.settings["DISK_CACHE_TTL"] = 0.1
+        store = self.Store()
+
+        store.put(NODE1, 10, "mykey1")
+        assert store.has(NODE1, "mykey1")
+        time.sleep(0.2)
+        store.put(NODE1, 10, "mykey2")
+        assert not store.has(NODE1, "mykey1")
+        assert store.has(NODE1, "mykey2")
+        with pytest.raises(CacheException, match="Cache miss"):
+            store.get(NODE1, "mykey1")
+
+        # expired entries are removed to make room for new entries
+        podpac.settings["DISK_CACHE_TTL"] = None
+        store.put(NODE1, 10, "mykey1")
+        time.sleep(0.2)
+        podpac.settings["DISK_CACHE_TTL"] = 0.1
+        store.put(NODE1, 10, "mykey3")
+        assert len(store._list_entries()) == 1
+
+    def test_index(self):
+        store = self.Store()
+        store.put(NODE1, 10, "mykey1")
+        store.put(NODE1, np.zeros(10), "mykey2", COORDS1)
+        store.put(NODE2, 20, "mykey1")
+
+        assert os.path.exists(os.path.join(self.test_cache_dir, "index.sqlite"))
+        assert len(store.search(NODE1)) == 2
+        assert len(store.search(NODE1, key="mykey2")) == 1
+        assert len(store.search(NODE1, coordinates=COORDS1)) == 1
+        assert len(store.search(NODE1, coordinates=None)) == 1
+        assert len(store.search(NODE2)) == 1
+
+        store.rem(NODE1, key="mykey2")
+        assert len(store.search(NODE1)) == 1
+
+    def test_index_rebuild(self):
+        store = self.Store()
+        store.put(NODE1, 10, "mykey1")
+        store.put(NODE1, np.zeros(10), "mykey2", COORDS1)
+        size = store.size
+
+        # the index is rebuilt from the existing cache entries
+        os.remove(os.path.join(self.test_cache_dir, "index.sqlite"))
+        store = self.Store()
+        assert store.size == size
+        assert store.has(NODE1, "mykey1")
+        assert store.get(NODE1, "mykey1") == 10
+        np.testing.assert_array_equal(store.get(NODE1, "mykey2", COORDS1), np.zeros(10))
+
+    def test_index_stale(self):
+        store = self.Store()
+        store.put(NODE1, 10, "mykey1")
+
+        # cached file removed outside of the cache store
+        os.remove(store.find(NODE1, "mykey1"))
+        with pytest.raises(CacheException, match="Cache miss"):
+            store.get(NODE1, "mykey1")
+        assert not store.has(NODE1, "mykey1")
+
+    def test_index_migrate(self):
+        store = self.Store()
+        store.put(NODE1, 10, "mykey1")
+        store.put(NODE1, np.zeros(10), "mykey2", COORDS1)
+        size = store.size
+
+        # index created before the schema was versioned
+        path = os.path.join(self.test_cache_dir, "index.sqlite")
+        os.remove(path)
+        with closing(sqlite3.connect(path)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE entries (node TEXT, key TEXT, coordinates TEXT, path TEXT, size INTEGER, format TEXT, "
+                "accessed REAL, PRIMARY KEY (node, key, coordinates))"
+            )
+
+        # the index is rebuilt with the current schema
+        store = self.Store()
+        assert store.size == size
+        assert store.has(NODE1, "mykey1")
+        assert all(created is not None for path, size, created, accessed in store._list_entries())
+        with closing(sqlite3.connect(path)) as conn:
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == store._index.schema_version
+
+    def test_index_connection(self):
+        store = self.Store()
+        store.put(NODE1, 10, "mykey1")
+
+        # one connection per thread, reused for each operation
+        conn = store._index._connect()
+        assert store.has(NODE1, "mykey1")
+        assert store._index._connect() is conn
+
+        conns = []
+        t = threading.Thread(target=lambda: conns.append(store._index._connect()))
+        t.start()
+        t.join()
+        assert conns[0] is not conn
+
+        # the connection is opened again when the index file is removed
+        store.clear()
+        assert not store.has(NODE1, "mykey1")
+        assert store._index._connect() is not conn
+        store.put(NODE1, 10, "mykey1")
+        assert store.has(NODE1, "mykey1")
+        assert os.path.exists(os.path.join(self.test_cache_dir, "index.sqlite"))
+
+    def test_index_shared(self):
+        # the stores that use a cache directory share its index
+        store1 = self.Store()
+        store2 = self.Store()
+        assert store1._index is store2._index
+
+        store1.put(NODE1, 10, "mykey1")
+        assert store2.has(NODE1, "mykey1")
+
+    def test_evict_query(self):
+        podpac.settings["DISK_CACHE_MAX_BYTES"] = 10
+        store = self.Store()
+        store.put(NODE1, "11111111", "mykey1")
+
+        # the least recently used entries are queried from the index, without listing every entry
+        def _list_entries():
+            raise AssertionError("listed every entry")
+
+        store._list_entries = _list_entries
+        store.put(NODE1, "11111111", "mykey2")
+        assert not store.has(NODE1, "mykey1")
+        assert store.has(NODE1, "mykey2")
+        assert store.size == store._index.least_recently_used(1)[0][1]
+
+
+class TestDiskCacheStoreScan(FileCacheStoreTests):
+    Store = DiskCacheStore
+    enabled_setting = "DISK_CACHE_ENABLED"
+    limit_setting = "DISK_CACHE_MAX_BYTES"
+
+    def setup_method(self):
+        super(TestDiskCacheStoreScan, self).setup_method()
+
+        self.test_cache_dir = tempfile.mkdtemp(prefix="podpac-test-")
+        podpac.settings["DISK_CACHE_DIR"] = self.test_cache_dir
+        podpac.settings["DISK_CACHE_INDEX"] = False
+
+    def teardown_method(self):
+        super(TestDiskCacheStoreScan, self).teardown_method()
+
+        shutil.rmtree(self.test_cache_dir, ignore_errors=True)
+
+    def test_no_index(self):
+        store = self.Store()
+        store.put(NODE1, 10, "mykey1")
+        store.put(NODE1, np.zeros(10), "mykey2", COORDS1)
+
+        # entries are found by scanning the cache directory
+        assert not os.path.exists(os.path.join(self.test_cache_dir, "index.sqlite"))
+        assert len(store.search(NODE1)) == 2
+        assert len(store.search(NODE1, coordinates=COORDS1)) == 1
+        assert len(store._list_entries()) == 2
+        assert store.size == sum(size for path, size, created, accessed in store._list_entries())
+        assert store.get(NODE1, "mykey1") == 10
+
+    def test_ttl(self):
+        podpac.settings["DISK_CACHE_TTL"] = 0.1
+        store = self.Store()
+
+        store.put(NODE1, 10, "mykey1")
+        assert store.has(NODE1, "mykey1")
+        time.sleep(0.2)
+        assert not store.has(NODE1, "mykey1")
+
 
 @pytest.mark.aws
 class TestS3CacheStore(FileCacheStoreTests):
@@ -0,0 +1,134 @@
+import numpy as np
+
+import podpac
+from podpac.core.cache.coordinates_index import get_subset_indices, CoordinatesIndex
+
+
+class CoordinatesIndexTestNode(podpac.Node):
+    pass
+
+
+NODE = CoordinatesIndexTestNode()
+
+COORDS = podpac.Coordinates([podpac.clinspace(0, 10, 11), podpac.clinspace(20, 40, 21)], dims=["lat", "lon"])
+
+
+class TestGetSubsetIndices(object):
+    def test_subset(self):
+        requested = podpac.Coordinates([podpac.clinspace(2, 5, 4), podpac.clinspace(22, 30, 9)], dims=["lat", "lon"])
+        indices = get_subset_indices(COORDS, requested)
+        assert indices == {"lat": slice(2, 6), "lon": slice(2, 11)}
+
+        # identical
+        indices = get_subset_indices(COORDS, COORDS)
+        assert indices == {"lat": slice(0, 11), "lon": slice(0, 21)}
+
+        # single point
+        requested = podpac.Coordinates([5, 30], dims=["lat", "lon"])
+        indices = get_subset_indices(COORDS, requested)
+        assert indices == {"lat": slice(5, 6), "lon": slice(10, 11)}
+
+    def test_floating_point_tolerance(self):
+        requested = podpac.Coordinates([np.array([0.1, 0.2, 0.3]) * 10 + 1e-12, [20]], dims=["lat", "lon"])
+        indices = get_subset_indices(COORDS, requested)
+        assert indices == {"lat": slice(1, 4), "lon": slice(0, 1)}
+
+    def test_not_subset(self):
+        # outside the bounds
+        requested = podpac.Coordinates([podpac.clinspace(8, 12, 5), [20]], dims=["lat", "lon"])
+        assert get_subset_indices(COORDS, requested) is None
+
+        # different spacing
+        requested = podpac.Coordinates([podpac.clinspace(2, 5, 7), [20]], dims=["lat", "lon"])
+        assert get_subset_indices(COORDS, requested) is None
+
+        requested = podpac.Coordinates([podpac.clinspace(2, 6, 3), [20]], dims=["lat", "lon"])
+        assert get_subset_indices(COORDS, requested) is None
+
+        # different order
+        requested = podpac.Coordinates([podpac.clinspace(5, 2, 4), [20]], dims=["lat", "lon"])
+        assert get_subset_indices(COORDS, requested) is None
+
+        # different dims
+        requested = podpac.Coordinates([[5]], dims=["lat"])
+        assert get_subset_indices(COORDS, requested) is None
+
+        requested = podpac.Coordinates([[20], [5]], dims=["lon", "lat"])
+        assert get_subset_indices(COORDS, requested) is None
+
+        # different crs
+        requested = podpac.Coordinates([[5], [20]], dims=["lat", "lon"], crs="EPSG:3857")
+        assert get_subset_indices(COORDS, requested) is None
+
+    def test_stacked(self):
+        cached = podpac.Coordinates([[[0, 1, 2, 3], [10, 11, 12, 13]]], dims=["lat_lon"])
+
+        requested = podpac.Coordinates([[[1, 2], [11, 12]]], dims=["lat_lon"])
+        assert get_subset_indices(cached, requested) == {"lat_lon": slice(1, 3)}
+
+        requested = podpac.Coordinates([[[1, 2], [11, 13]]], dims=["lat_lon"])
+        assert get_subset_indices(cached, requested) is None
+
+    def test_time(self):
+        cached = podpac.Coordinates([["2018-01-01", "2018-01-02", "2018-01-03"]], dims=["time"])
+
+        requested = podpac.Coordinates([["2018-01-02", "2018-01-03"]], dims=["time"])
+        assert get_subset_indices(cached, requested) == {"time": slice(1, 3)}
+
+        requested = podpac.Coordinates([["2018-01-04"]], dims=["time"])
+        assert get_subset_indices(cached, requested) is None
+
+
+class TestCoordinatesIndex(object):
+    def test_find(self):
+        index = CoordinatesIndex()
+        requested = podpac.Coordinates([podpac.clinspace(2, 5, 4), [20]], dims=["lat", "lon"])
+        assert list(index.find(NODE, "output", requested)) == []
+
+        index.add(NODE, "output", COORDS)
+        ((cached, indices),) = list(index.find(NODE, "output", requested))
+        assert cached == COORDS
+        assert indices == {"lat": slice(2, 6), "lon": slice(0, 1)}
+
+        # other key
+        assert list(index.find(NODE, "other", requested)) == []
+
+    def test_remove(self):
+        index = CoordinatesIndex()
+        index.add(NODE, "output", COORDS)
+        index.remove(NODE, key="other")
+        assert len(list(index.find(NODE, "output", COORDS))) == 1
+        index.remove(NODE, key="output", coordinates=COORDS)
+        assert len(list(index.find(NODE, "output", COORDS))) == 0
+
+        index.add(NODE, "output", COORDS)
+        index.remove(NODE)
+        assert len(list(index.find(NODE, "output", COORDS))) == 0
+
+        index.add(NODE, "output", COORDS)
+        index.clear()
+        assert len(list(index.find(NODE, "output", COORDS))) == 0
+        assert len(index) == 0
+
+    def test_discard(self):
+        index = CoordinatesIndex()
+        index.add(NODE, "output", COORDS)
+        index.discard(NODE.hash, "output", COORDS.hash)
+        assert len(list(index.find(NODE, "output", COORDS))) == 0
+        assert len(index) == 0
+
+    def test_bounded(self):
+        index = CoordinatesIndex(max_entries=3, max_entries_per_key=2)
+        coords = [podpac.Coordinates([podpac.clinspace(0, 10, 11 + i)], dims=["lat"]) for i in range(4)]
+
+        # per key, most recently cached first
+        for c in coords:
+            index.add(NODE, "a", c)
+        assert len(index) == 2
+        assert [cached for cached, _ in index.find(NODE, "a", coords[0][:1])] == [coords[3], coords[2]]
+
+        # total
+        index.add(NODE, "b", coords[0])
+        index.add(NODE, "c", coords[0])
+        assert len(index) == 3
+        assert [cached for cached, _ in index.find(NODE, "a", coords[0][:1])] == [coords[3]]
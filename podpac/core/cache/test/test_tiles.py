@@ -0,0 +1,51 @@
+import numpy as np
+
+import podpac
+from podpac.core.cache.tiles import get_tiles
+
+
+class TestGetTiles(object):
+    def test_tiles(self):
+        coords = podpac.Coordinates([podpac.clinspace(0.3, 1.2, 10), podpac.clinspace(0, 1, 3)], dims=["lat", "lon"])
+        canonical, tiles = get_tiles(coords, 4)
+
+        # lat cells 3-12 are covered by tiles 0, 1, 2 (cells 0-11) and 3 (cells 12-15), lon cells 0-2 by tile 0
+        assert canonical.shape == (16, 4)
+        np.testing.assert_allclose(canonical["lat"].coordinates, np.arange(16) * 0.1)
+        np.testing.assert_allclose(canonical["lon"].coordinates, np.arange(4) * 0.5)
+        assert len(tiles) == 4
+        for i, (tile, index) in enumerate(tiles):
+            assert tile.dims == ("lat", "lon")
+            assert tile.shape == (4, 4)
+            assert index == {"lat": slice(4 * i, 4 * i + 4), "lon": slice(0, 4)}
+            np.testing.assert_allclose(tile["lat"].coordinates, canonical["lat"].coordinates[4 * i : 4 * i + 4])
+
+    def test_shared_tiles(self):
+        # shifted, differently sized, and reversed requests on the same grid share tiles
+        a = podpac.Coordinates([podpac.clinspace(0.3, 1.2, 10)], dims=["lat"])
+        b = podpac.Coordinates([podpac.clinspace(0.5, 1.1, 7)], dims=["lat"])
+        c = podpac.Coordinates([podpac.clinspace(1.1, 0.5, 7)], dims=["lat"])
+        hashes_a = [tile.hash for tile, index in get_tiles(a, 4)[1]]
+        hashes_b = [tile.hash for tile, index in get_tiles(b, 4)[1]]
+        hashes_c = [tile.hash for tile, index in get_tiles(c, 4)[1]]
+        assert hashes_b == hashes_a[1:3]
+        assert hashes_c == hashes_b
+
+        # different grid offset
+        d = podpac.Coordinates([podpac.clinspace(0.55, 1.15, 7)], dims=["lat"])
+        assert not set(tile.hash for tile, index in get_tiles(d, 4)[1]) & set(hashes_a)
+
+    def test_untiled_dims(self):
+        coords = podpac.Coordinates(
+            [[0, 1, 5], podpac.clinspace(0, 1, 3), ["2018-01-01", "2018-01-02"]], dims=["lat", "lon", "time"]
+        )
+        canonical, tiles = get_tiles(coords, 2)
+        assert canonical["lat"] == coords["lat"]
+        assert canonical["time"] == coords["time"]
+        assert canonical["lon"].size == 4
+        assert len(tiles) == 2
+
+        coords = podpac.Coordinates([[0, 1, 5], [[1, 2], [3, 4]]], dims=["time", "lat_lon"])
+        canonical, tiles = get_tiles(coords, 2)
+        assert canonical is None
+        assert tiles == []
@@ -0,0 +1,110 @@
+"""
+Canonical tiles for tile-aligned caching of node outputs.
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import itertools
+from collections import OrderedDict
+
+import numpy as np
+
+from podpac.core.coordinates import Coordinates, UniformCoordinates1d, clinspace
+
+# precision used to snap the grid step and offset, so that equivalent grids produce identical tiles
+_STEP_DIGITS = 12
+_OFFSET_DIGITS = 6
+
+
+def _get_grid(c):
+    """Get the canonical grid of uniform 1d coordinates.
+
+    Parameters
+    ----------
+    c : :class:`UniformCoordinates1d`
+        numerical uniform coordinates
+
+    Returns
+    -------
+    step : float
+        absolute grid step
+    offset : float
+        offset of the grid from 0, in [0, step)
+    start : int
+        index of the lowest coordinate in the grid
+    """
+
+    step = float("%.*g" % (_STEP_DIGITS, abs(c.step)))
+    lo = c.bounds[0] / step
+    start = int(np.floor(lo))
+    offset = round(lo - start, _OFFSET_DIGITS)
+    if offset == 1:
+        start += 1
+        offset = 0.0
+    return step, offset * step, start
+
+
+def _tileable(c):
+    return isinstance(c, UniformCoordinates1d) and c.size > 1 and np.issubdtype(c.dtype, np.number)
+
+
+def get_tiles(coordinates, tile_size):
+    """Get the canonical tiles that cover the given coordinates.
+
+    Uniformly-spaced numerical dimensions are divided into tiles of ``tile_size`` grid cells on a canonical grid
+    defined by the grid step and offset, so that requests on the same grid share tiles regardless of their extent.
+    Other dimensions are not tiled.
+
+    Parameters
+    ----------
+    coordinates : :class:`podpac.Coordinates`
+        requested coordinates
+    tile_size : int
+        number of grid cells per tile in each tiled dimension
+
+    Returns
+    -------
+    canonical : :class:`podpac.Coordinates`
+        coordinates covering all of the tiles (ascending in each tiled dimension), or None if no dimensions can be
+        tiled.
+    tiles : list
+        list of (tile_coordinates, index) tuples, where index is a dictionary of slices into the canonical coordinates
+        for each tiled dimension.
+    """
+
+    grids = OrderedDict()
+    for dim in coordinates.dims:
+        c = coordinates[dim]
+        if not _tileable(c):
+            continue
+        step, offset, start = _get_grid(c)
+        ks = range(start // tile_size, (start + c.size - 1) // tile_size + 1)
+        grids[dim] = (step, offset, ks)
+
+    if not grids:
+        return None, []
+
+    def _tile(dim, k, n=1):
+        step, offset, _ = grids[dim]
+        return clinspace(
+            offset + k * tile_size * step, offset + ((k + n) * tile_size - 1) * step, n * tile_size, name=dim
+        )
+
+    canonical = [coordinates[dim] for dim in coordinates.dims]
+    for i, dim in enumerate(coordinates.dims):
+        if dim in grids:
+            ks = grids[dim][2]
+            canonical[i] = _tile(dim, ks[0], len(ks))
+    canonical = Coordinates(canonical, crs=coordinates.crs)
+
+    tiles = []
+    for tile_ks in itertools.product(*[grids[dim][2] for dim in grids]):
+        tile = [coordinates[dim] for dim in coordinates.dims]
+        index = {}
+        for dim, k in zip(grids, tile_ks):
+            tile[coordinates.dims.index(dim)] = _tile(dim, k)
+            i = (k - grids[dim][2][0]) * tile_size
+            index[dim] = slice(i, i + tile_size)
+        tiles.append((Coordinates(tile, crs=coordinates.crs), index))
+
+    return canonical, tiles
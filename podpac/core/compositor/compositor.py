@@ -6,6 +6,7 @@ Compositor Summary
 from __future__ import division, unicode_literals, print_function, absolute_import
 
 import copy
+import asyncio
 
 import numpy as np
 import traitlets as tl
@@ -18,6 +19,8 @@ from podpac.core.node import COMMON_NODE_DOC, node_eval, Node
 from podpac.core.data.datasource import COMMON_DATA_DOC
 from podpac.core.interpolation.interpolation import InterpolationTrait
 from podpac.core.managers.multi_threading import thread_manager
+from podpac.core.cache.eval_memo import propagate_eval_memo
+from podpac.core.managers.profiler import span
 
 COMMON_COMPOSITOR_DOC = COMMON_DATA_DOC.copy()  # superset of COMMON_NODE_DOC
 
@@ -207,7 +210,7 @@ class BaseCompositor(Node):
             # evaluate nodes in parallel using thread pool
             self._multi_threaded = True
             pool = thread_manager.get_thread_pool(processes=n_threads)
-            outputs = pool.map(lambda src: src.eval(coordinates), sources)
+            outputs = pool.map(propagate_eval_memo(lambda src: src.eval(coordinates)), sources)
             pool.close()
             thread_manager.release_n_threads(n_threads)
             for output in outputs:
@@ -219,6 +222,35 @@ class BaseCompositor(Node):
             for src in sources:
                 yield src.eval(coordinates)
 
+    async def _prefetch_async(self, coordinates, memo):
+        # the sources are evaluated at the requested coordinates, unless iteroutputs is overridden
+        if type(self).iteroutputs is not BaseCompositor.iteroutputs:
+            return
+
+        # the sources are evaluated concurrently in batches, in order, until the prefetched outputs fill the output
+        sources = self.select_sources(coordinates)
+        n = settings["ASYNC_COMPOSITOR_PREFETCH"] or len(sources)
+        outputs = []
+        for i in range(0, len(sources), n):
+            batch = sources[i : i + n]
+            batch_outputs = await asyncio.gather(*[source.eval_async(coordinates) for source in batch])
+            for source, output in zip(batch, batch_outputs):
+                memo.add(source, coordinates, output)
+            outputs.extend(batch_outputs)
+            if self._prefetch_filled(coordinates, outputs):
+                break
+
+    def _prefetch_filled(self, coordinates, outputs):
+        """ True if the outputs of the first sources fill the output, so that the other sources are not needed """
+        return False
+
+    def _plan_inputs(self, coordinates):
+        # the sources are evaluated at the requested coordinates, unless iteroutputs is overridden
+        if type(self).iteroutputs is not BaseCompositor.iteroutputs:
+            return super(BaseCompositor, self)._plan_inputs(coordinates)
+
+        return [(source, coordinates) for source in self.select_sources(coordinates)]
+
     @node_eval
     @common_doc(COMMON_COMPOSITOR_DOC)
     def eval(self, coordinates, output=None):
@@ -238,7 +270,8 @@ class BaseCompositor(Node):
 
         self._requested_coordinates = coordinates
         outputs = self.iteroutputs(coordinates)
-        output = self.composite(coordinates, outputs, output)
+        with span("composite", "phase", node=self):
+            output = self.composite(coordinates, outputs, output)
         return output
 
     def find_coordinates(self):
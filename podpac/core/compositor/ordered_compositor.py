@@ -24,6 +24,8 @@ class OrderedCompositor(BaseCompositor):
         {interpolation}
     """
 
+    _pointwise = True
+
     @common_doc(COMMON_COMPOSITOR_DOC)
     def composite(self, coordinates, data_arrays, result=None):
         """Composites data_arrays in order that they appear. Once a request contains no nans, the result is returned.
@@ -62,6 +64,12 @@ class OrderedCompositor(BaseCompositor):
 
         return result
 
+    def _prefetch_filled(self, coordinates, outputs):
+        mask = UnitsDataArray.create(coordinates, outputs=self.outputs, data=0, dtype=bool)
+        for data in outputs:
+            mask.data |= np.isfinite(data.transpose(*mask.dims).data)
+        return bool(np.all(mask))
+
     @staticmethod
     def _composite(result, data, mask):
         source_mask = np.isfinite(data.data)
@@ -1,3 +1,5 @@
+import asyncio
+
 import numpy as np
 
 import podpac
@@ -104,6 +106,35 @@ class TestOrderedCompositor(object):
             assert node._multi_threaded == True
             assert podpac.core.managers.multi_threading.thread_manager._n_threads_used == n_threads_before
 
+    def test_composite_short_circuit_async(self):
+        evaluated = []
+
+        class MyArray(Array):
+            def get_data(self, coordinates, coordinates_index):
+                evaluated.append(self.source[0, 0])
+                return super(MyArray, self).get_data(coordinates, coordinates_index)
+
+        coords = podpac.Coordinates([[0, 1], [10, 20, 30]], dims=["lat", "lon"])
+        sources = [MyArray(source=np.full(coords.shape, i), coordinates=coords, cache_output=False) for i in range(5)]
+        node = OrderedCompositor(sources=sources, interpolation="bilinear")
+        loop = asyncio.new_event_loop()
+
+        # the sources are prefetched in order, in batches, until the output is full
+        with podpac.settings:
+            podpac.settings["ASYNC_COMPOSITOR_PREFETCH"] = 2
+            output = loop.run_until_complete(node.eval_async(coords))
+        np.testing.assert_array_equal(output, 0)
+        assert sorted(evaluated) == [0, 1]
+
+        # all sources
+        evaluated[:] = []
+        with podpac.settings:
+            podpac.settings["ASYNC_COMPOSITOR_PREFETCH"] = None
+            output = loop.run_until_complete(node.eval_async(coords))
+        np.testing.assert_array_equal(output, 0)
+        assert sorted(evaluated) == [0, 1, 2, 3, 4]
+        loop.close()
+
     def test_composite_into_result(self):
         coords = podpac.Coordinates([[0, 1], [10, 20, 30]], dims=["lat", "lon"])
         a = Array(source=np.ones(coords.shape), coordinates=coords)
@@ -158,3 +158,27 @@ class TestUniformTileCompositor(object):
         # np.testing.assert_array_equal(node.eval(c1), TODO)
         # np.testing.assert_array_equal(node.eval(c2), TODO)
         # np.testing.assert_array_equal(node.eval(c3), TODO)
+
+    def test_plan(self):
+        node = MockTileCompositor()
+        coords = node.coordinates[1, 2:6, 2:4]
+
+        # the tiles plan their own reads
+        reads = node.plan(coords)
+        assert [tile.tile for tile, _, _ in reads] == [(1, 0, 0), (1, 1, 0)]
+        assert reads[0][2] == (slice(None), slice(2, 4), slice(2, 4))
+        assert reads[1][2] == (slice(None), slice(0, 2), slice(2, 4))
+
+        # tiles with cached outputs need no reads
+        class CachedTile(MockTile):
+            def plan(self, coordinates):
+                return []
+
+        class MyTileCompositor(MockTileCompositor):
+            @cached_property
+            def sources(self):
+                return [
+                    CachedTile(tile=tile.tile, grid=self, x=tile.x) for tile in super(MyTileCompositor, self).sources
+                ]
+
+        assert MyTileCompositor().plan(coords) == []
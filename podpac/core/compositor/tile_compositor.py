@@ -49,6 +49,18 @@ class TileCompositor(DataSource):
 
         return output
 
+    @common_doc(COMMON_DATA_DOC)
+    def plan(self, coordinates):
+        """{plan}
+        """
+
+        # the tiles are read at the requested source coordinates of this node
+        reads = []
+        for _, rsc, _ in super(TileCompositor, self).plan(coordinates):
+            for source in self.sources:
+                reads.extend(source.plan(rsc))
+        return reads
+
 
 @common_doc(COMMON_DATA_DOC)
 class UniformTileCompositor(TileCompositor):
@@ -79,6 +79,9 @@ class Coordinates(tl.HasTraits):
 
     _coords = OrderedDictTrait(trait=tl.Instance(BaseCoordinates), default_value=OrderedDict())
 
+    # memoized hash, reset when the coordinates are modified
+    _hash = None
+
     def __init__(self, coords, dims=None, crs=None, validate_crs=True):
         """
         Create multidimensional coordinates.
@@ -181,6 +184,10 @@ class Coordinates(tl.HasTraits):
 
         return val
 
+    @tl.observe("_coords", "crs")
+    def _reset_hash(self, change):
+        self._hash = None
+
     @tl.default("crs")
     def _default_crs(self):
         return settings["DEFAULT_CRS"]
@@ -609,6 +616,7 @@ class Coordinates(tl.HasTraits):
             c = ArrayCoordinates1d(c)
 
         c._set_name(dim)
+        self._hash = None
 
         if dim in self.dims:
             d = self._coords.copy()
@@ -626,6 +634,7 @@ class Coordinates(tl.HasTraits):
             raise KeyError("Cannot delete dimension '%s' in Coordinates %s" % (dim, self.dims))
 
         del self._coords[dim]
+        self._hash = None
 
     def __len__(self):
         return len(self._coords)
@@ -833,11 +842,13 @@ class Coordinates(tl.HasTraits):
 
     @property
     def hash(self):
-        """:str: Coordinates hash value."""
-        # We can't use self.json for the hash because the CRS is not standardized.
-        # As such, we json.dumps the full definition.
-        json_d = json.dumps(self.full_definition, separators=(",", ":"), cls=podpac.core.utils.JSONEncoder)
-        return hash_alg(json_d.encode("utf-8")).hexdigest()
+        """:str: Coordinates hash value. The hash is computed once, and recomputed only if the coordinates are modified."""
+        if self._hash is None:
+            # We can't use self.json for the hash because the CRS is not standardized.
+            # As such, we json.dumps the full definition.
+            json_d = json.dumps(self.full_definition, separators=(",", ":"), cls=podpac.core.utils.JSONEncoder)
+            self._hash = hash_alg(json_d.encode("utf-8")).hexdigest()
+        return self._hash
 
     @property
     def geotransform(self):
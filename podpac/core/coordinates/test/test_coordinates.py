@@ -1423,6 +1423,27 @@ class TestCoordinatesSpecial(object):
         assert c1.hash != c2.hash
         assert c2.hash == deepcopy(c2).hash
 
+    def test_hash_modified(self):
+        c = Coordinates([[[0, 1, 2], [10, 20, 30]], ["2018-01-01", "2018-01-02"]], dims=["lat_lon", "time"])
+        h = c.hash
+        assert c.hash == h
+
+        # the memoized hash is reset when the coordinates are modified
+        c["time"] = ["2018-01-01", "2018-01-03"]
+        assert c.hash != h
+        c2 = Coordinates([[[0, 1, 2], [10, 20, 30]], ["2018-01-01", "2018-01-03"]], dims=["lat_lon", "time"])
+        assert c.hash == c2.hash
+
+        c["lat"] = [0, 1, 3]
+        c2 = Coordinates([[[0, 1, 3], [10, 20, 30]], ["2018-01-01", "2018-01-03"]], dims=["lat_lon", "time"])
+        assert c.hash == c2.hash
+
+        del c["time"]
+        assert c.hash == Coordinates([[[0, 1, 3], [10, 20, 30]]], dims=["lat_lon"]).hash
+
+        c.update(Coordinates([[0, 1]], dims=["alt"]))
+        assert c.hash == Coordinates([[[0, 1, 3], [10, 20, 30]], [0, 1]], dims=["lat_lon", "alt"]).hash
+
 
 class TestCoordinatesFunctions(object):
     def test_merge_dims(self):
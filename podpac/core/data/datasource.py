@@ -21,9 +21,13 @@ from podpac.core.units import UnitsDataArray
 from podpac.core.coordinates import Coordinates, Coordinates1d, StackedCoordinates
 from podpac.core.coordinates.utils import VALID_DIMENSION_NAMES, make_coord_delta, make_coord_delta_array
 from podpac.core.node import Node, NodeException
-from podpac.core.utils import common_doc
+from podpac.core.utils import common_doc, is_lazy
 from podpac.core.node import COMMON_NODE_DOC
-from podpac.core.node import node_eval
+from podpac.core.node import node_eval, _get_hash
+from podpac.core.cache.negative_cache import _negative_cache
+from podpac.core.cache.eval_memo import get_eval_memo
+from podpac.core.managers.eval_context import EvalState, with_eval_context
+from podpac.core.managers.profiler import span
 from podpac.core.interpolation.interpolation import Interpolation, InterpolationTrait
 
 log = logging.getLogger(__name__)
@@ -88,6 +92,24 @@ DATA_DOC = {
 
         Coordinates should be non-nan and non-repeating for best compatibility
         """,
+    "plan": """Get the data source reads needed to evaluate this node at the given coordinates, without reading data.
+
+        Parameters
+        ----------
+        coordinates : :class:`podpac.Coordinates`
+            The set of coordinates requested by a user.
+
+        Returns
+        -------
+        reads : list
+            (node, source_coordinates, source_coordinates_index) tuples of the data source reads. The list is empty if
+            the output is cached or the requested coordinates do not intersect the source coordinates.
+
+        Raises
+        ------
+        ValueError
+            Cannot evaluate these coordinates
+        """,
     "interpolation": """
         Interpolation definition for the data source.
         By default, the interpolation method is set to ``'nearest'`` for all dimensions.
@@ -164,20 +186,17 @@ class DataSource(Node):
     cache_output = tl.Bool()
 
     # privates
-    _interpolation = tl.Instance(Interpolation)
     _coordinates = tl.Instance(Coordinates, allow_none=True, default_value=None, read_only=True)
+    _pointwise = True
 
-    _original_requested_coordinates = tl.Instance(Coordinates, allow_none=True)
-    _requested_source_coordinates = tl.Instance(Coordinates)
-    _requested_source_coordinates_index = tl.Tuple()
-    _requested_source_data = tl.Instance(UnitsDataArray)
-    _evaluated_coordinates = tl.Instance(Coordinates)
-
-    # this adds a more helpful error message if user happens to try an inspect _interpolation before evaluate
-    @tl.default("_interpolation")
-    def _default_interpolation(self):
-        self._set_interpolation()
-        return self._interpolation
+    # request state, kept per call (see podpac.core.managers.eval_context)
+    _interpolation = EvalState("_interpolation")
+    _original_requested_coordinates = EvalState("_original_requested_coordinates")
+    _requested_source_coordinates = EvalState("_requested_source_coordinates")
+    _requested_source_coordinates_index = EvalState("_requested_source_coordinates_index")
+    _requested_source_data = EvalState("_requested_source_data")
+    _requested_source_boundary = EvalState("_requested_source_boundary")
+    _evaluated_coordinates = EvalState("_evaluated_coordinates")
 
     @tl.validate("boundary")
     def _validate_boundary(self, d):
@@ -228,6 +247,8 @@ class DataSource(Node):
             Interpolation class defined by DataSource `interpolation` definition
         """
 
+        if self._interpolation is None:
+            self._set_interpolation()
         return self._interpolation
 
     @property
@@ -242,7 +263,7 @@ class DataSource(Node):
             Key are tuple of unstacked dimensions, the value is the interpolator used to interpolate these dimensions
         """
 
-        if self._interpolation._last_interpolator_queue is not None:
+        if self._interpolation is not None and self._interpolation._last_interpolator_queue is not None:
             return self._interpolation._last_interpolator_queue
         else:
             return OrderedDict()
@@ -277,6 +298,89 @@ class DataSource(Node):
         else:
             self._interpolation = Interpolation(self.interpolation)
 
+    def _check_dims(self, coordinates):
+        """ raise a ValueError if the requested coordinates are missing dimensions of the source coordinates """
+
+        for c in self.coordinates.values():
+            if isinstance(c, Coordinates1d):
+                if c.name not in coordinates.udims:
+                    raise ValueError("Cannot evaluate these coordinates, missing dim '%s'" % c.name)
+            elif isinstance(c, StackedCoordinates):
+                if any(s.name not in coordinates.udims for s in c):
+                    raise ValueError("Cannot evaluate these coordinates, missing at least one dim in '%s'" % c.name)
+
+    def _remove_extra_dims(self, coordinates):
+        """ drop requested dimensions that are not in the source coordinates """
+
+        extra = []
+        for c in coordinates.values():
+            if isinstance(c, Coordinates1d):
+                if c.name not in self.coordinates.udims:
+                    extra.append(c.name)
+            elif isinstance(c, StackedCoordinates):
+                if all(dim not in self.coordinates.udims for dim in c.dims):
+                    extra.append(c.name)
+        return coordinates.drop(extra)
+
+    def _get_source_request(self, coordinates):
+        """ the source coordinates and index needed to interpolate the requested coordinates, in any crs """
+
+        coordinates = self._remove_extra_dims(coordinates)
+        if self.coordinates.crs.lower() != coordinates.crs.lower():
+            coordinates = coordinates.transform(self.coordinates.crs)
+        return self._select_source_coordinates(coordinates)
+
+    def _select_source_coordinates(self, coordinates):
+        """Get the source coordinates and index needed to interpolate the requested coordinates.
+
+        Parameters
+        ----------
+        coordinates : :class:`podpac.Coordinates`
+            Requested coordinates, in the source crs and without extra dimensions.
+
+        Returns
+        -------
+        rsc : :class:`podpac.Coordinates`
+            requested source coordinates, empty if the requested coordinates do not intersect the source coordinates
+        rsci : tuple
+            requested source coordinates index
+        """
+
+        # intersect the coordinates with requested coordinates to get coordinates within requested coordinates bounds
+        # TODO: support coordinate_index_type parameter to define other index types
+        (rsc, rsci) = self.coordinates.intersect(coordinates, outer=True, return_indices=True)
+        if rsc.size == 0:
+            return rsc, rsci
+
+        # reset interpolation
+        self._set_interpolation()
+
+        # interpolate requested coordinates before getting data
+        (rsc, rsci) = self._interpolation.select_coordinates(rsc, rsci, coordinates)
+
+        # Check the coordinate_index_type
+        if self.coordinate_index_type == "slice":  # Most restrictive
+            new_rsci = []
+            for I in rsci:
+                if isinstance(I, slice):
+                    new_rsci.append(I)
+                    continue
+
+                if len(I) > 1:
+                    mx, mn = np.max(I), np.min(I)
+                    df = np.diff(I)
+                    if np.all(df == df[0]):
+                        step = df[0]
+                    else:
+                        step = 1
+                    new_rsci.append(slice(mn, mx + 1, step))
+                else:
+                    new_rsci.append(slice(np.max(I), np.max(I) + 1))
+
+            rsci = tuple(new_rsci)
+
+        return rsc, rsci
+
     def _get_data(self):
         """Wrapper for `self.get_data` with pre and post processing
         
@@ -293,8 +397,23 @@ class DataSource(Node):
             Raised if get_data is not implemented by data source subclass
 
         """
+
+        # use the read shared by the members of a group evaluation, if possible
+        memo = get_eval_memo()
+        if memo is not None and memo.group_reads is not None and _get_hash(self) in memo.group_reads:
+            group_read = memo.get_read(self, lambda: self._read_group(memo.group_reads[self.hash]))
+            if group_read is not None:
+                data = self._subset_group_read(*group_read)
+                if data is not None:
+                    return data
+
+        return self._read_data(self._requested_source_coordinates, self._requested_source_coordinates_index)
+
+    def _read_data(self, coordinates, coordinates_index):
+        """ get data from the data source at the given source coordinates and index, with post processing """
+
         # get data from data source at requested source coordinates and requested source coordinates index
-        data = self.get_data(self._requested_source_coordinates, self._requested_source_coordinates_index)
+        data = self.get_data(coordinates, coordinates_index)
 
         # convert data into UnitsDataArray depending on format
         # TODO: what other processing needs to happen here?
@@ -302,9 +421,9 @@ class DataSource(Node):
             udata_array = data
         elif isinstance(data, xr.DataArray):
             # TODO: check order of coordinates here
-            udata_array = self.create_output_array(self._requested_source_coordinates, data=data.data)
-        elif isinstance(data, np.ndarray):
-            udata_array = self.create_output_array(self._requested_source_coordinates, data=data)
+            udata_array = self.create_output_array(coordinates, data=data.data)
+        elif isinstance(data, np.ndarray) or is_lazy(data):
+            udata_array = self.create_output_array(coordinates, data=data)
         else:
             raise ValueError(
                 "Unknown data type passed back from "
@@ -319,10 +438,57 @@ class DataSource(Node):
 
         # fill nan_vals in data array
         for nan_val in self.nan_vals:
-            udata_array.data[udata_array.data == nan_val] = np.nan
+            if is_lazy(udata_array):
+                udata_array.data = udata_array.data.map_blocks(_fill_nan, nan_val, dtype=udata_array.dtype)
+            else:
+                udata_array.data[udata_array.data == nan_val] = np.nan
 
         return udata_array
 
+    def _read_group(self, reads):
+        """Read the union of the source data needed by the members of a group evaluation.
+
+        Parameters
+        ----------
+        reads : list
+            (source_coordinates, source_coordinates_index) reads planned for the group members, see
+            :meth:`podpac.Node.plan`
+
+        Returns
+        -------
+        index : tuple
+            source coordinates index of the read, a slice for each dimension
+        data : podpac.core.units.UnitsDataArray
+            source data
+
+        None is returned if the read would not be shared, or if the union is larger than the separate reads.
+        """
+
+        indices = [rsci for rsc, rsci in reads]
+        size = sum(rsc.size for rsc, rsci in reads)
+        if len(indices) < 2:
+            return None
+
+        index = _union_index(indices, self.coordinates.shape)
+        coordinates = self.coordinates[index]
+        if coordinates.size > size:
+            return None
+
+        return index, self._read_data(coordinates, index)
+
+    def _subset_group_read(self, index, data):
+        """ the requested source data from a group read, or None if the group read does not contain it """
+
+        isel = {}
+        rsci = self._requested_source_coordinates_index
+        for dim, I, U, n in zip(self.coordinates.dims, rsci, index, self.coordinates.shape):
+            I = _index_array(I, n)
+            if I.size and (I.min() < U.start or I.max() >= U.stop):
+                return None
+            isel[dim] = I - U.start
+
+        return self.create_output_array(self._requested_source_coordinates, data=data.isel(isel).data)
+
     # ------------------------------------------------------------------------------------------------------------------
     # Methods
     # ------------------------------------------------------------------------------------------------------------------
@@ -372,82 +538,57 @@ class DataSource(Node):
         if settings["DEBUG"]:
             self._original_requested_coordinates = coordinates
 
+        # the requested coordinates are usually shared (e.g. by compositor sources), so their hash is only computed once
+        requested_coordinates = coordinates
+
+        # negative results are keyed by node hash, so they are not cached for nodes that cannot be hashed
+        negative_cache = _get_hash(self) is not None
+
+        # short-circuit sources that are known to be missing
+        error = _negative_cache.get_missing(self) if negative_cache else None
+        if error is not None:
+            raise error
+
+        try:
+            self.coordinates
+        except (IOError, OSError) as e:
+            if negative_cache:
+                _negative_cache.add_missing(self, e)
+            raise
+
         # check for missing dimensions
-        for c in self.coordinates.values():
-            if isinstance(c, Coordinates1d):
-                if c.name not in coordinates.udims:
-                    raise ValueError("Cannot evaluate these coordinates, missing dim '%s'" % c.name)
-            elif isinstance(c, StackedCoordinates):
-                if any(s.name not in coordinates.udims for s in c):
-                    raise ValueError("Cannot evaluate these coordinates, missing at least one dim in '%s'" % c.name)
+        self._check_dims(coordinates)
 
         # remove extra dimensions
-        extra = []
-        for c in coordinates.values():
-            if isinstance(c, Coordinates1d):
-                if c.name not in self.coordinates.udims:
-                    extra.append(c.name)
-            elif isinstance(c, StackedCoordinates):
-                if all(dim not in self.coordinates.udims for dim in c.dims):
-                    extra.append(c.name)
-        coordinates = coordinates.drop(extra)
+        coordinates = self._remove_extra_dims(coordinates)
 
         # store input coordinates to evaluated coordinates
         self._evaluated_coordinates = deepcopy(coordinates)
 
+        # short-circuit requests that are known not to intersect the source coordinates
+        if negative_cache and _negative_cache.is_empty(self, requested_coordinates):
+            return self._empty_output(output)
+
         # transform coordinates into native crs if different
         if self.coordinates.crs.lower() != coordinates.crs.lower():
             coordinates = coordinates.transform(self.coordinates.crs)
 
-        # intersect the coordinates with requested coordinates to get coordinates within requested coordinates bounds
-        # TODO: support coordinate_index_type parameter to define other index types
-        (rsc, rsci) = self.coordinates.intersect(coordinates, outer=True, return_indices=True)
+        # get the source coordinates and index needed to interpolate the requested coordinates
+        with span("intersect", "phase", node=self):
+            (rsc, rsci) = self._select_source_coordinates(coordinates)
         self._requested_source_coordinates = rsc
         self._requested_source_coordinates_index = rsci
 
         # if requested coordinates and coordinates do not intersect, shortcut with nan UnitsDataArary
         if self._requested_source_coordinates.size == 0:
-            if output is None:
-                output = self.create_output_array(self._evaluated_coordinates)
-                if "output" in output.dims and self.output is not None:
-                    output = output.sel(output=self.output)
-            else:
-                output[:] = np.nan
-            return output
-
-        # reset interpolation
-        self._set_interpolation()
-
-        # interpolate requested coordinates before getting data
-        (rsc, rsci) = self._interpolation.select_coordinates(
-            self._requested_source_coordinates, self._requested_source_coordinates_index, coordinates
-        )
-        self._requested_source_coordinates = rsc
-        self._requested_source_coordinates_index = rsci
-
-        # Check the coordinate_index_type
-        if self.coordinate_index_type == "slice":  # Most restrictive
-            new_rsci = []
-            for rsci in self._requested_source_coordinates_index:
-                if isinstance(rsci, slice):
-                    new_rsci.append(rsci)
-                    continue
-
-                if len(rsci) > 1:
-                    mx, mn = np.max(rsci), np.min(rsci)
-                    df = np.diff(rsci)
-                    if np.all(df == df[0]):
-                        step = df[0]
-                    else:
-                        step = 1
-                    new_rsci.append(slice(mn, mx + 1, step))
-                else:
-                    new_rsci.append(slice(np.max(rsci), np.max(rsci) + 1))
-
-            self._requested_source_coordinates_index = tuple(new_rsci)
+            if negative_cache:
+                _negative_cache.add_empty(self, requested_coordinates)
+            return self._empty_output(output)
 
         # get data from data source
-        self._requested_source_data = self._get_data()
+        with span("get_data", "phase", node=self) as trace:
+            self._requested_source_data = self._get_data()
+            trace["bytes_read"] = self._requested_source_data.nbytes
 
         # if not provided, create output using the evaluated coordinates, or
         # if provided, set the order of coordinates to match the output dims
@@ -477,9 +618,10 @@ class DataSource(Node):
         self._requested_source_boundary = self._get_boundary(self._requested_source_coordinates_index)
 
         # interpolate data into output
-        output = self._interpolation.interpolate(
-            self._requested_source_coordinates, self._requested_source_data, coordinates, output
-        )
+        with span("interpolate", "phase", node=self):
+            output = self._interpolation.interpolate(
+                self._requested_source_coordinates, self._requested_source_data, coordinates, output
+            )
 
         # Fill the output that was passed to eval with the new data
         if requested_dims is not None and requested_dims != output_dims:
@@ -497,6 +639,33 @@ class DataSource(Node):
 
         return output
 
+    def _empty_output(self, output):
+        """ nan output for requests that do not intersect the source coordinates """
+
+        if output is None:
+            output = self.create_output_array(self._evaluated_coordinates)
+            if "output" in output.dims and self.output is not None:
+                output = output.sel(output=self.output)
+        else:
+            output[:] = np.nan
+        return output
+
+    @common_doc(COMMON_DATA_DOC)
+    @with_eval_context
+    def plan(self, coordinates):
+        """{plan}
+        """
+
+        if self._plan_cached(coordinates):
+            return []
+
+        self._check_dims(coordinates)
+        (rsc, rsci) = self._get_source_request(coordinates)
+        if rsc.size == 0:
+            return []
+
+        return [(self, rsc, rsci)]
+
     def find_coordinates(self):
         """
         Get the available coordinates for the Node. For a DataSource, this is just the coordinates.
@@ -570,3 +739,63 @@ class DataSource(Node):
                 else:
                     boundary[dim] = self.boundary[dim]
         return boundary
+
+
+def _fill_nan(data, nan_val):
+    """ replace nan_val with nan in a block of lazy data """
+
+    return np.where(data == nan_val, np.nan, data)
+
+
+def _index_array(I, n):
+    """ integer index array for a slice, boolean array, or integer array index into a dimension of size n """
+
+    if isinstance(I, slice):
+        return np.arange(n)[I]
+    I = np.atleast_1d(I)
+    if I.dtype == bool:
+        (I,) = np.where(I)
+    return I
+
+
+def _index_bounds(I, n):
+    """ (start, stop) bounds of a non-empty index into a dimension of size n """
+
+    I = _index_array(I, n)
+    return I.min(), I.max() + 1
+
+
+def _union_index(indices, shape):
+    """ slices spanning the union of non-empty source coordinates indices """
+
+    bounds = [[_index_bounds(I, n) for I, n in zip(index, shape)] for index in indices]
+    return tuple(slice(min(b[0] for b in bs), max(b[1] for b in bs)) for bs in zip(*bounds))
+
+
+def merge_reads(reads):
+    """Merge the planned reads of each data source into a single read.
+
+    Reads of the same data source (by hash), e.g. from different branches of a pipeline, are merged into one read
+    of the union of their source coordinates indices.
+
+    Parameters
+    ----------
+    reads : list
+        (node, source_coordinates, source_coordinates_index) tuples, see :meth:`podpac.Node.plan`.
+
+    Returns
+    -------
+    reads : list
+        merged (node, source_coordinates, source_coordinates_index) tuples, in order of the first read of each data
+        source. The merged indices are a slice for each dimension.
+    """
+
+    indices = OrderedDict()
+    for node, _, index in reads:
+        indices.setdefault(node.hash, (node, []))[1].append(index)
+
+    merged = []
+    for node, node_indices in indices.values():
+        index = _union_index(node_indices, node.coordinates.shape)
+        merged.append((node, node.coordinates[index], index))
+    return merged
@@ -27,6 +27,8 @@ from podpac.core.utils import common_doc, cached_property
 from podpac.core.coordinates import Coordinates
 from podpac.core.authentication import S3Mixin
 from podpac.core.data.datasource import COMMON_DATA_DOC, DataSource
+from podpac.core.cache.eval_memo import get_eval_memo
+from podpac.core.managers.asynchronous import run_sync, get_url_async
 
 # TODO common doc
 _logger = logging.getLogger(__name__)
@@ -97,9 +99,12 @@ class LoadFileMixin(S3Mixin):
             with self.s3.open(self.source, "rb") as f:
                 return self._open(f)
         elif self.source.startswith("http://") or self.source.startswith("https://"):
-            _logger.info("Downloading: %s" % self.source)
-            response = requests.get(self.source)
-            with BytesIO(response.content) as f:
+            memo = get_eval_memo()
+            content = memo.pop_prefetched(self, "content") if memo is not None else None
+            if content is None:
+                _logger.info("Downloading: %s" % self.source)
+                content = requests.get(self.source).content
+            with BytesIO(content) as f:
                 return self._open(f)
         elif self.source.startswith("ftp://"):
             _logger.info("Downloading: %s" % self.source)
@@ -120,6 +125,18 @@ class LoadFileMixin(S3Mixin):
             f.seek(0)
         return self.open_dataset(f)
 
+    async def _prefetch_async(self, coordinates, memo):
+        # already opened
+        if hasattr(self, "_podpac_cached_property_dataset"):
+            return
+
+        if self.source.startswith("http://") or self.source.startswith("https://"):
+            if not (self.cache_dataset and self._dataset_caching_node.has_cache(key="dataset")):
+                _logger.info("Downloading: %s" % self.source)
+                memo.add_prefetched(self, "content", await get_url_async(self.source))
+        elif self.source.startswith("s3://"):
+            await run_sync(lambda: self.dataset)
+
     def open_dataset(self, f):
         """ TODO """
         raise NotImplementedError()
@@ -4,9 +4,11 @@ from lazy_import import lazy_module, lazy_class
 
 h5py = lazy_module("h5py")
 
+from podpac.core.settings import settings
 from podpac.core.utils import common_doc, cached_property
 from podpac.core.data.datasource import COMMON_DATA_DOC, DATA_DOC
 from podpac.core.data.file_source import BaseFileSource, FileKeysMixin
+from podpac.core.data.lazy import lazy_read, lazy_stack
 
 
 @common_doc(COMMON_DATA_DOC)
@@ -87,6 +89,13 @@ class H5PY(FileKeysMixin, BaseFileSource):
     def get_data(self, coordinates, coordinates_index):
         """{get_data}
         """
+        if settings["LAZY_EVAL"]:
+            if not isinstance(self.data_key, list):
+                return lazy_read(self.dataset[self.data_key], coordinates_index, lock=True)
+            return lazy_stack(
+                [lazy_read(self.dataset[key], coordinates_index, lock=True) for key in self.data_key], axis=-1
+            )
+
         data = self.create_output_array(coordinates)
         if not isinstance(self.data_key, list):
             data[:] = self.dataset[self.data_key][coordinates_index]
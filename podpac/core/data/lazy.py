@@ -0,0 +1,129 @@
+"""
+Lazy reads of data source arrays, see the ``LAZY_EVAL`` setting.
+
+In lazy evaluation mode, data sources that support it return dask arrays chunked like the source (zarr chunks, hdf5
+chunks, raster blocks) instead of reading the requested data. Algorithms compose the dask arrays lazily, and the data
+is only read and computed when the output is written, reduced, or computed (e.g. with ``output.compute()``), in
+parallel and with the memory bounded by the dask scheduler.
+"""
+
+from __future__ import division, unicode_literals, print_function, absolute_import
+
+import importlib
+
+import numpy as np
+from lazy_import import lazy_module
+
+rasterio = lazy_module("rasterio")
+
+
+def _import_dask_array():
+    """Import dask.array when it is used.
+
+    Note: dask.array is not imported with lazy_module, whose placeholder module in sys.modules makes other packages
+    (and :func:`podpac.core.utils.is_lazy`) think that dask is installed.
+    """
+
+    try:
+        return importlib.import_module("dask.array")
+    except ImportError:
+        raise ImportError("Lazy evaluation (the LAZY_EVAL setting) requires dask, e.g. `pip install podpac[lazy]`")
+
+
+def lazy_read(array, index, chunks=None, lock=False):
+    """Lazily read an array at an index.
+
+    Parameters
+    ----------
+    array : array-like
+        source array, with ``shape``, ``dtype``, ``ndim``, and slice indexing (e.g. a zarr array or h5py dataset)
+    index : tuple
+        index of the data to read, in the source array
+    chunks : tuple, optional
+        chunk shape, e.g. the chunks of the source array. By default, dask chooses the chunks.
+    lock : bool, optional
+        serialize reads of the source array, for sources that are not thread-safe (e.g. h5py). Default False.
+
+    Returns
+    -------
+    data : dask.array.Array
+        lazy data at the index
+    """
+
+    da = _import_dask_array()
+    if chunks is None:
+        chunks = "auto"
+    return da.from_array(array, chunks=chunks, lock=lock)[index]
+
+
+def lazy_stack(arrays, axis=-1):
+    """Stack lazy arrays along a new axis, e.g. the outputs of a multiple-output source.
+
+    Parameters
+    ----------
+    arrays : list
+        lazy arrays, see :func:`lazy_read`
+    axis : int, optional
+        axis of the stacked arrays. Default -1.
+
+    Returns
+    -------
+    data : dask.array.Array
+        lazy stacked data
+    """
+
+    return _import_dask_array().stack(arrays, axis=axis)
+
+
+class RasterioWindows(object):
+    """Array-like view of a rasterio dataset that reads the requested windows, for use with :func:`lazy_read`.
+
+    Attributes
+    ----------
+    dataset : rasterio.DatasetReader
+        open rasterio dataset
+    band : int, None
+        band to read, or None to read all bands (the bands are in the last axis)
+    """
+
+    def __init__(self, dataset, band=None):
+        self.dataset = dataset
+        self.band = band
+
+    @property
+    def shape(self):
+        if self.band is None:
+            return (self.dataset.height, self.dataset.width, self.dataset.count)
+        return (self.dataset.height, self.dataset.width)
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def dtype(self):
+        return np.dtype(self.dataset.dtypes[0])
+
+    @property
+    def chunks(self):
+        """ raster blocks """
+        block_shape = self.dataset.block_shapes[0]
+        if self.band is None:
+            return tuple(block_shape) + (self.dataset.count,)
+        return tuple(block_shape)
+
+    def __getitem__(self, index):
+        slices = [slice(*s.indices(n)) for s, n in zip(index, self.shape)]
+        window = rasterio.windows.Window.from_slices(
+            (slices[0].start, slices[0].stop), (slices[1].start, slices[1].stop)
+        )
+
+        if self.band is None:
+            data = np.moveaxis(self.dataset.read(window=window), 0, 2)
+        else:
+            data = self.dataset.read(self.band, window=window)
+
+        steps = tuple(slice(None, None, s.step) for s in slices[:2])
+        if self.band is None:
+            steps = steps + (slices[2],)
+        return data[steps]
@@ -15,6 +15,8 @@ from podpac.core.settings import settings
 from podpac.core.utils import common_doc, cached_property
 from podpac.core.data.datasource import COMMON_DATA_DOC, DataSource
 from podpac.core.coordinates import Coordinates, UniformCoordinates1d, ArrayCoordinates1d
+from podpac.core.cache.eval_memo import get_eval_memo
+from podpac.core.managers.asynchronous import get_url_async
 
 # Optional dependencies
 from lazy_import import lazy_module, lazy_class
@@ -79,6 +81,10 @@ class WCS(DataSource):
 
         return self.source + "?" + self._get_capabilities_qs.format(version=self.version, layer=self.layer_name)
 
+    async def _prefetch_async(self, coordinates, memo):
+        if not hasattr(self, "_podpac_cached_property_wcs_coordinates"):
+            memo.add_prefetched(self, "capabilities", (await get_url_async(self.capabilities_url)).decode())
+
     @cached_property
     def wcs_coordinates(self):
         """ Coordinates reported by the WCS service.
@@ -97,7 +103,14 @@ class WCS(DataSource):
             Raises this if the required dependencies are not installed.
         """
 
-        if requests is not None:
+        memo = get_eval_memo()
+        capabilities = memo.pop_prefetched(self, "capabilities") if memo is not None else None
+
+        if capabilities is not None:
+            # downloaded by eval_async
+            pass
+
+        elif requests is not None:
             capabilities = requests.get(self.capabilities_url)
             if capabilities.status_code != 200:
                 raise Exception("Could not get capabilities from WCS server")
@@ -17,6 +17,7 @@ from lazy_import import lazy_module, lazy_class
 from podpac.core import authentication
 from podpac.core.utils import common_doc, cached_property
 from podpac.core.data.datasource import COMMON_DATA_DOC, DataSource
+from podpac.core.managers.asynchronous import run_sync
 
 # Optional dependencies
 pydap = lazy_module("pydap")
@@ -88,6 +89,10 @@ class PyDAP(authentication.RequestsSessionMixin, DataSource):
     def _open_url(self):
         return pydap.client.open_url(self.source, session=self.session)
 
+    async def _prefetch_async(self, coordinates, memo):
+        # pydap requests are blocking, so the dataset is opened in the executor
+        await run_sync(lambda: self.dataset)
+
     @common_doc(COMMON_DATA_DOC)
     def get_data(self, coordinates, coordinates_index):
         """{get_data}
@@ -12,10 +12,12 @@ from lazy_import import lazy_module
 
 rasterio = lazy_module("rasterio")
 
+from podpac.core.settings import settings
 from podpac.core.utils import common_doc, cached_property
 from podpac.core.coordinates import UniformCoordinates1d, Coordinates
 from podpac.core.data.datasource import COMMON_DATA_DOC, DATA_DOC
 from podpac.core.data.file_source import BaseFileSource, LoadFileMixin
+from podpac.core.data.lazy import lazy_read, RasterioWindows
 
 
 @common_doc(COMMON_DATA_DOC)
@@ -99,6 +101,10 @@ class Rasterio(LoadFileMixin, BaseFileSource):
     def get_data(self, coordinates, coordinates_index):
         """{get_data}
         """
+        if settings["LAZY_EVAL"]:
+            band = None if self.outputs is not None else self.band
+            return lazy_read(RasterioWindows(self.dataset, band), coordinates_index, lock=True)
+
         data = self.create_output_array(coordinates)
         slc = coordinates_index
 
@@ -36,6 +36,9 @@ class ReprojectedSource(DataSource):
     # list of attribute names, used by __repr__ and __str__ to display minimal info about the node
     _repr_keys = ["source", "interpolation"]
 
+    # the source is evaluated at coordinates derived from the extent of the requested coordinates
+    _pointwise = False
+
     def _first_init(self, **kwargs):
         if "reprojected_coordinates" in kwargs:
             if isinstance(kwargs["reprojected_coordinates"], dict):
@@ -97,6 +100,15 @@ class ReprojectedSource(DataSource):
         coordinates.drop(drop_dims)
         return data
 
+    @common_doc(COMMON_DATA_DOC)
+    def plan(self, coordinates):
+        """{plan}
+        """
+
+        # the source is evaluated at the requested source coordinates of this node
+        reads = super(ReprojectedSource, self).plan(coordinates)
+        return [read for _, rsc, _ in reads for read in self.eval_source.plan(rsc)]
+
     @property
     def base_ref(self):
         return "{}_reprojected".format(self.source.base_ref)
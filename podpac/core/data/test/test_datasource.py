@@ -2,22 +2,28 @@
 Test podpac.core.data.datasource module
 """
 
+import time
+import errno
+import threading
 from collections import OrderedDict
 
 import pytest
+import requests
 
 import numpy as np
 import traitlets as tl
 import xarray as xr
 from xarray.core.coordinates import DataArrayCoordinates
 
+import podpac
 from podpac.core.units import UnitsDataArray
 from podpac.core.node import COMMON_NODE_DOC, NodeException
 from podpac.core.style import Style
 from podpac.core.coordinates import Coordinates, clinspace, crange
 from podpac.core.interpolation.interpolation import Interpolation, Interpolator
 from podpac.core.interpolation.interpolator import Interpolator
-from podpac.core.data.datasource import DataSource, COMMON_DATA_DOC, DATA_DOC
+from podpac.core.data.datasource import DataSource, COMMON_DATA_DOC, DATA_DOC, merge_reads
+from podpac.core.cache.negative_cache import _negative_cache, is_not_found
 
 
 class MockDataSource(DataSource):
@@ -418,6 +424,117 @@ class TestDataSource(object):
 
         assert np.all(np.isnan(output))
 
+    def test_evaluate_no_overlap_negative_cache(self, monkeypatch):
+        _negative_cache.clear()
+        calls = []
+        intersect = Coordinates.intersect
+
+        def counted_intersect(*args, **kwargs):
+            calls.append(1)
+            return intersect(*args, **kwargs)
+
+        monkeypatch.setattr(Coordinates, "intersect", counted_intersect)
+
+        node = MockDataSource(cache_output=False)
+        coords = Coordinates([clinspace(-55, -45, 20), clinspace(-55, -45, 20)], dims=["lat", "lon"])
+        output = node.eval(coords)
+        assert np.all(np.isnan(output))
+        assert len(calls) == 1
+
+        # repeated requests do not intersect the coordinates again
+        output = node.eval(coords)
+        assert np.all(np.isnan(output))
+        assert output.shape == (20, 20)
+        assert len(calls) == 1
+
+        # disabled
+        with podpac.settings:
+            podpac.settings["NEGATIVE_CACHE_ENABLED"] = False
+            node.eval(coords)
+        assert len(calls) == 2
+
+        _negative_cache.clear()
+
+    def test_evaluate_missing_source_negative_cache(self):
+        _negative_cache.clear()
+
+        class MissingDataSource(DataSource):
+            opens = 0
+
+            def get_coordinates(self):
+                MissingDataSource.opens += 1
+                raise FileNotFoundError("No such file")
+
+        node = MissingDataSource(cache_output=False)
+        coords = Coordinates([clinspace(-55, -45, 20), clinspace(-55, -45, 20)], dims=["lat", "lon"])
+        with pytest.raises(FileNotFoundError, match="No such file") as info:
+            node.eval(coords)
+        assert MissingDataSource.opens == 1
+
+        # repeated requests do not try to open the source again, and raise a new error
+        with pytest.raises(FileNotFoundError, match="No such file") as info2:
+            node.eval(coords)
+        assert MissingDataSource.opens == 1
+        assert info2.value is not info.value
+
+        # expired
+        with podpac.settings:
+            podpac.settings["NEGATIVE_CACHE_TTL"] = 0
+            time.sleep(0.01)
+            with pytest.raises(IOError, match="No such file"):
+                node.eval(coords)
+        assert MissingDataSource.opens == 2
+
+        _negative_cache.clear()
+
+    def test_evaluate_source_error_not_negative_cached(self):
+        _negative_cache.clear()
+
+        class FailingDataSource(DataSource):
+            opens = 0
+
+            def get_coordinates(self):
+                FailingDataSource.opens += 1
+                raise IOError("Connection reset")
+
+        # other errors may be transient, and are not remembered
+        node = FailingDataSource(cache_output=False)
+        coords = Coordinates([clinspace(-55, -45, 20), clinspace(-55, -45, 20)], dims=["lat", "lon"])
+        for _ in range(2):
+            with pytest.raises(IOError, match="Connection reset"):
+                node.eval(coords)
+        assert FailingDataSource.opens == 2
+        assert len(_negative_cache) == 0
+
+    def test_evaluate_unhashable(self):
+        _negative_cache.clear()
+
+        class MyDataSource(MockDataSource):
+            value = tl.Any().tag(attr=True)
+
+        # nodes that cannot be hashed are evaluated without the negative cache
+        node = MyDataSource(value=object(), cache_output=False)
+        with pytest.raises(TypeError):
+            node.hash
+
+        coords = Coordinates([clinspace(-25, 25, 11), clinspace(-25, 25, 11)], dims=["lat", "lon"])
+        np.testing.assert_array_equal(node.eval(coords), node.data)
+
+        coords = Coordinates([clinspace(-55, -45, 20), clinspace(-55, -45, 20)], dims=["lat", "lon"])
+        assert np.all(np.isnan(node.eval(coords)))
+        assert len(_negative_cache) == 0
+
+    def test_is_not_found(self):
+        class Response(object):
+            status_code = 404
+
+        assert is_not_found(FileNotFoundError("No such file"))
+        assert is_not_found(IOError(errno.ENOENT, "No such file"))
+        assert is_not_found(requests.HTTPError("Not Found", response=Response()))
+        assert not is_not_found(IOError("Connection reset"))
+        assert not is_not_found(IOError(errno.EACCES, "Permission denied"))
+        assert not is_not_found(requests.HTTPError("Server Error"))
+
     def test_evaluate_extract_output(self):
         class MyMultipleDataSource(DataSource):
             outputs = ["a", "b", "c"]
@@ -459,6 +576,153 @@ class TestDataSource(object):
         np.testing.assert_array_equal(o.dims, ["lat", "lon"])
         np.testing.assert_array_equal(o, 1)
 
+    def test_eval_group_shared_read(self):
+        class MySource(MockDataSource):
+            indices = []
+
+            def get_data(self, coordinates, coordinates_index):
+                MySource.indices.append(coordinates_index)
+                return super(MySource, self).get_data(coordinates, coordinates_index)
+
+        node = MySource(cache_output=False)
+        c1 = Coordinates([clinspace(-25, -5, 5), clinspace(-25, -5, 5)], dims=["lat", "lon"])
+        c2 = Coordinates([clinspace(-20, 0, 5), clinspace(-15, 5, 5)], dims=["lat", "lon"])
+        c3 = Coordinates([clinspace(-22, -12, 3), clinspace(-18, -8, 3)], dims=["lat", "lon"])
+        group = podpac.coordinates.GroupCoordinates([c1, c2, c3])
+
+        # the union of the member reads is read once
+        outputs = node.eval_group(group)
+        assert len(MySource.indices) == 1
+        assert MySource.indices[0] == (slice(0, 6), slice(0, 7))
+
+        # members are interpolated from the shared read
+        MySource.indices = []
+        with podpac.settings:
+            podpac.settings["EVAL_GROUP_SHARED_READS"] = False
+            expected = node.eval_group(group)
+        assert len(MySource.indices) == 3
+        for output, e in zip(outputs, expected):
+            np.testing.assert_array_equal(output, e)
+
+        # sparse members are read separately
+        MySource.indices = []
+        c4 = Coordinates([clinspace(15, 25, 3), clinspace(15, 25, 3)], dims=["lat", "lon"])
+        node.eval_group(podpac.coordinates.GroupCoordinates([c1, c4]))
+        assert len(MySource.indices) == 2
+
+    def test_eval_group_shared_read_planned(self):
+        from podpac.core.algorithm.signal import Convolution
+
+        class MySource(MockDataSource):
+            indices = []
+
+            def get_data(self, coordinates, coordinates_index):
+                MySource.indices.append(coordinates_index)
+                return super(MySource, self).get_data(coordinates, coordinates_index)
+
+        # the source is evaluated at the expanded coordinates of the convolution
+        node = Convolution(
+            source=MySource(cache_output=False), kernel_type="mean, 3", kernel_ndim=2, cache_output=False
+        )
+        c1 = Coordinates([clinspace(-20, -5, 4), clinspace(-20, -5, 4)], dims=["lat", "lon"])
+        c2 = Coordinates([clinspace(-15, 0, 4), clinspace(-10, 5, 4)], dims=["lat", "lon"])
+        c3 = Coordinates([clinspace(-15, -5, 3), clinspace(-15, -5, 3)], dims=["lat", "lon"])
+        group = podpac.coordinates.GroupCoordinates([c1, c2, c3])
+
+        # the union of the planned member reads is read once
+        outputs = node.eval_group(group)
+        assert len(MySource.indices) == 1
+        assert MySource.indices[0] == (slice(0, 7), slice(0, 8))
+
+        MySource.indices = []
+        with podpac.settings:
+            podpac.settings["EVAL_GROUP_SHARED_READS"] = False
+            expected = node.eval_group(group)
+        assert len(MySource.indices) == 3
+        for output, e in zip(outputs, expected):
+            np.testing.assert_array_equal(output, e)
+
+    def test_eval_group_multithreading(self):
+        node = MockDataSource(cache_output=False)
+        group = podpac.coordinates.GroupCoordinates(
+            [Coordinates([clinspace(-25, 25 - i * 5, 6), clinspace(-25, 25, 6)], dims=["lat", "lon"]) for i in range(6)]
+        )
+
+        expected = [node.eval(coords) for coords in group]
+        with podpac.settings:
+            podpac.settings["MULTITHREADING"] = True
+            podpac.settings["N_THREADS"] = 4
+            outputs = node.eval_group(group)
+
+        for output, e in zip(outputs, expected):
+            np.testing.assert_array_equal(output, e)
+
+    def test_eval_concurrent(self):
+        class SlowSource(MockDataSource):
+            def get_data(self, coordinates, coordinates_index):
+                time.sleep(0.01)
+                return super(SlowSource, self).get_data(coordinates, coordinates_index)
+
+        node = SlowSource(cache_output=False)
+        coords = [
+            Coordinates([clinspace(-25, 25 - i * 5, 6 - i), clinspace(-20 + i, 20, 5)], dims=["lat", "lon"])
+            for i in range(4)
+        ]
+        expected = [node.eval(c) for c in coords]
+
+        # one instance serves concurrent requests
+        outputs = {}
+
+        def f(i):
+            outputs[i] = node.eval(coords[i])
+
+        threads = [threading.Thread(target=f, args=(i,)) for i in range(len(coords))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for i, e in enumerate(expected):
+            xr.testing.assert_equal(outputs[i], e)
+
+    def test_plan(self):
+        node = MockDataSource(cache_output=False)
+
+        c = Coordinates([clinspace(-25, -5, 5), clinspace(-25, -5, 5)], dims=["lat", "lon"])
+        reads = node.plan(c)
+        assert len(reads) == 1
+        n, rsc, rsci = reads[0]
+        assert n is node
+        assert rsc.shape == (5, 5)
+        assert rsc["lat"].bounds == (-25, -5)
+        assert rsc["lon"].bounds == (-25, -5)
+
+        # extra dims are dropped
+        c = Coordinates([clinspace(-25, -5, 5), clinspace(-25, -5, 5), "2018-01-01"], dims=["lat", "lon", "time"])
+        reads = node.plan(c)
+        assert reads[0][1].shape == (5, 5)
+
+        # no intersection
+        c = Coordinates([clinspace(50, 60, 3), clinspace(50, 60, 3)], dims=["lat", "lon"])
+        assert node.plan(c) == []
+
+        # missing dims
+        with pytest.raises(ValueError, match="Cannot evaluate these coordinates"):
+            node.plan(Coordinates([clinspace(-25, -5, 5)], dims=["lat"]))
+
+    def test_merge_reads(self):
+        node = MockDataSource(cache_output=False)
+        other = MockDataSource(cache_output=False, interpolation="bilinear")
+        c1 = Coordinates([clinspace(-25, -5, 5), clinspace(-25, -5, 5)], dims=["lat", "lon"])
+        c2 = Coordinates([clinspace(-20, 0, 5), clinspace(-15, 5, 5)], dims=["lat", "lon"])
+
+        reads = merge_reads(node.plan(c1) + other.plan(c1) + node.plan(c2))
+        assert len(reads) == 2
+        assert reads[0][0] is node
+        assert reads[0][2] == (slice(0, 6), slice(0, 7))
+        assert reads[0][1] == node.coordinates[reads[0][2]]
+        assert reads[1][0] is other
+
     def test_nan_vals(self):
         """ evaluate note with nan_vals """
 
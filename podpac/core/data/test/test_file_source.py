@@ -1,10 +1,13 @@
 import os
+import asyncio
 
 import numpy as np
 import traitlets as tl
 import pytest
 
 import podpac
+from podpac.core.cache.eval_memo import EvalMemo, set_eval_memo
+from podpac.core.data import file_source
 from podpac.core.data.file_source import BaseFileSource
 from podpac.core.data.file_source import LoadFileMixin
 from podpac.core.data.file_source import FileKeysMixin
@@ -48,6 +51,11 @@ class MockLoadFile(LoadFileMixin, BaseFileSource):
         return None
 
 
+class MockReadFile(LoadFileMixin, BaseFileSource):
+    def open_dataset(self, f):
+        return f.read()
+
+
 class TestLoadFile(object):
     def test_open_dataset_not_implemented(self):
         node = LoadFileMixin()
@@ -97,6 +105,41 @@ class TestLoadFile(object):
             assert node2._dataset_caching_node.has_cache("dataset")
             node2.dataset
 
+    def test_prefetch_async(self, monkeypatch):
+        async def get_url_async(url):
+            return b"content"
+
+        def get(url):
+            raise AssertionError("already downloaded")
+
+        monkeypatch.setattr(file_source, "get_url_async", get_url_async)
+        monkeypatch.setattr(file_source.requests, "get", get)
+
+        node = MockReadFile(source="https://example.com/file")
+        memo = EvalMemo(set())
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(node._prefetch_async(None, memo))
+        finally:
+            loop.close()
+
+        # the download is passed through the evaluation memo
+        set_eval_memo(memo)
+        try:
+            assert node.dataset == b"content"
+        finally:
+            set_eval_memo(None)
+        assert memo.pop_prefetched(node, "content") is None
+
+        # not downloaded again once opened
+        memo = EvalMemo(set())
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(node._prefetch_async(None, memo))
+        finally:
+            loop.close()
+        assert memo.pop_prefetched(node, "content") is None
+
 
 # ---------------------------------------------------------------------------------------------------------------------
 # FileKeysMixin
@@ -1,3 +1,5 @@
+import asyncio
+
 import pydap
 import pytest
 import numpy as np
@@ -96,3 +98,15 @@ class TestPyDAP(object):
         node = MockPyDAP()
         output = node.eval(node.coordinates)
         np.testing.assert_array_equal(output.values, node.data)
+
+    def test_eval_async(self):
+        node = MockPyDAP(cache_output=False)
+        loop = asyncio.new_event_loop()
+        try:
+            output = loop.run_until_complete(node.eval_async(node.coordinates))
+        finally:
+            loop.close()
+
+        # the dataset is opened in the executor before the evaluation
+        assert hasattr(node, "_podpac_cached_property_dataset")
+        np.testing.assert_array_equal(output.values, node.data)
@@ -6,7 +6,9 @@ import rasterio
 import pytest
 from traitlets import TraitError
 
+import podpac
 from podpac.core.coordinates import Coordinates
+from podpac.core.utils import is_lazy
 from podpac.core.units import UnitsDataArray
 from podpac.core.data.rasterio_source import Rasterio
 
@@ -48,6 +50,19 @@ class TestRasterio(object):
         output = node.eval(node.coordinates)
         assert isinstance(output, UnitsDataArray)
 
+    def test_get_data_lazy(self):
+        pytest.importorskip("dask.array")
+
+        node = Rasterio(source=self.source, cache_output=False)
+        coords = node.coordinates[100:300:2, 50:250]
+        expected = node.eval(coords)
+
+        with podpac.settings:
+            podpac.settings["LAZY_EVAL"] = True
+            output = node.eval(coords)
+        assert is_lazy(output)
+        np.testing.assert_array_equal(output.compute(), expected)
+
     def test_band_count(self):
         """test band descriptions methods"""
         node = Rasterio(source=self.source)
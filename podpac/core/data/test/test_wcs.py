@@ -1,4 +1,5 @@
 import os
+import asyncio
 from six import string_types
 
 import pytest
@@ -6,6 +7,8 @@ import requests
 from traitlets import TraitError
 
 from podpac.core.coordinates import Coordinates, clinspace
+from podpac.core.cache.eval_memo import EvalMemo, set_eval_memo
+from podpac.core.data import ogc
 from podpac.core.data.ogc import WCS, WCS_DEFAULT_VERSION, WCS_DEFAULT_CRS
 
 
@@ -135,6 +138,40 @@ class TestWCS(object):
         podpac.core.data.ogc.urllib3 = urllib3
         podpac.core.data.ogc.lxml = lxml
 
+    def test_prefetch_async(self, monkeypatch):
+        """get wcs coordinates from capabilities downloaded asynchronously"""
+
+        async def get_url_async(url):
+            assert "REQUEST=DescribeCoverage" in url
+            return self.capabilities.encode("utf-8")
+
+        def get(url=None):
+            raise AssertionError("already downloaded")
+
+        monkeypatch.setattr(ogc, "get_url_async", get_url_async)
+        monkeypatch.setattr(ogc.requests, "get", get)
+
+        node = WCS(source=self.source)
+        memo = EvalMemo(set())
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(node._prefetch_async(None, memo))
+        finally:
+            loop.close()
+
+        # the capabilities are passed through the evaluation memo
+        set_eval_memo(memo)
+        try:
+            coordinates = node.wcs_coordinates
+        finally:
+            set_eval_memo(None)
+
+        assert isinstance(coordinates, Coordinates)
+        assert coordinates["lat"]
+        assert coordinates["lon"]
+        assert coordinates["time"]
+        assert memo.pop_prefetched(node, "capabilities") is None
+
     def test_coordinates(self):
         """get coordinates"""
 
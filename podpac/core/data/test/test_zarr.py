@@ -5,7 +5,9 @@ import pytest
 import numpy as np
 from traitlets import TraitError
 
+import podpac
 from podpac.core.coordinates import Coordinates
+from podpac.core.utils import is_lazy
 from podpac.core.data.zarr_source import Zarr
 
 
@@ -74,6 +76,24 @@ class TestZarr(object):
         assert out.sel(output="a")[0, 0] == 0.0
         assert out.sel(output="b")[0, 0] == 1.0
 
+    def test_eval_lazy(self):
+        pytest.importorskip("dask.array")
+
+        z = Zarr(source=self.path, data_key=["a", "b"], cache_output=False)
+        expected = z.eval(z.coordinates)
+
+        with podpac.settings:
+            podpac.settings["LAZY_EVAL"] = True
+            out = z.eval(z.coordinates)
+            assert is_lazy(out)
+            np.testing.assert_array_equal(out.compute(), expected)
+
+            # nearest neighbor interpolation is lazy
+            coords = Coordinates([[0, 2], [12, 38]], dims=["lat", "lon"])
+            out = z.eval(coords)
+            assert is_lazy(out)
+            np.testing.assert_array_equal(out.compute(), expected[[0, 2], [0, 3]])
+
     @pytest.mark.aws
     def test_s3(self):
         path = "s3://podpac-internal-test/drought_parameters.zarr"
@@ -10,9 +10,11 @@ zarr_open_consolidated = lazy_function("zarr.convenience.open_consolidated")
 zarrGroup = lazy_class("zarr.Group")
 
 from podpac.core.authentication import S3Mixin
+from podpac.core.settings import settings
 from podpac.core.utils import common_doc, cached_property
 from podpac.core.data.datasource import COMMON_DATA_DOC, DATA_DOC
 from podpac.core.data.file_source import BaseFileSource, FileKeysMixin
+from podpac.core.data.lazy import lazy_read, lazy_stack
 
 
 class Zarr(S3Mixin, FileKeysMixin, BaseFileSource):
@@ -188,6 +190,11 @@ class Zarr(S3Mixin, FileKeysMixin, BaseFileSource):
     def get_data(self, coordinates, coordinates_index):
         """{get_data}
         """
+        if settings["LAZY_EVAL"]:
+            if not isinstance(self.data_key, list):
+                return lazy_read(self.dataset[self.data_key], coordinates_index)
+            return lazy_stack([lazy_read(self.dataset[key], coordinates_index) for key in self.data_key], axis=-1)
+
         data = self.create_output_array(coordinates)
         if not isinstance(self.data_key, list):
             data[:] = self.dataset[self.data_key][coordinates_index]
@@ -115,7 +115,7 @@ class NearestNeighbor(Interpolator):
         eval_dims = eval_coordinates.dims
         if "output" in output_data.dims:
             eval_dims = eval_dims + ("output",)
-        output_data.data = source_data.transpose(*eval_dims)
+        output_data.data = source_data.transpose(*eval_dims).data
 
         return output_data
 
@@ -0,0 +1,88 @@
+"""
+Helpers for asyncio evaluation (see :meth:`podpac.Node.eval_async`).
+
+Blocking work (node evaluation, file and S3 access) runs in the event loop executor. HTTP downloads use ``aiohttp``
+when it is installed (``pip install podpac[async]``), so that many downloads can be in flight without a thread each;
+otherwise they also run in the executor.
+"""
+
+from __future__ import division, unicode_literals, print_function, absolute_import
+
+import asyncio
+import functools
+import logging
+import importlib
+
+from lazy_import import lazy_module
+
+requests = lazy_module("requests")
+
+_log = logging.getLogger(__name__)
+
+
+def _import_aiohttp():
+    """Import aiohttp when it is used.
+
+    Note: aiohttp is not imported with lazy_module, whose placeholder module in sys.modules makes other packages think
+    that it is installed.
+    """
+
+    try:
+        return importlib.import_module("aiohttp")
+    except ImportError:
+        raise ImportError("Asynchronous downloads require aiohttp, e.g. `pip install podpac[async]`")
+
+
+def _has_aiohttp():
+    try:
+        _import_aiohttp()
+    except ImportError as e:
+        _log.debug("%s; downloading in the event loop executor instead", e)
+        return False
+    return True
+
+
+async def run_sync(fn, *args, **kwargs):
+    """Run a blocking function in the event loop executor.
+
+    Parameters
+    ----------
+    fn : callable
+        blocking function
+    *args, **kwargs
+        arguments passed to the function
+
+    Returns
+    -------
+    result : any
+        the result of the function
+    """
+
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, functools.partial(fn, *args, **kwargs))
+
+
+async def get_url_async(url):
+    """Download the contents of an url, without blocking the event loop.
+
+    Parameters
+    ----------
+    url : str
+        http or https url
+
+    Returns
+    -------
+    content : bytes
+        The response content.
+    """
+
+    if not _has_aiohttp():
+        response = await run_sync(requests.get, url)
+        response.raise_for_status()
+        return response.content
+
+    aiohttp = _import_aiohttp()
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            return await response.read()
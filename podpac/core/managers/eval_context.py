@@ -0,0 +1,110 @@
+"""
+Per-call request state of node evaluations.
+
+Nodes keep the request state of an evaluation (e.g. the requested coordinates) in an evaluation context that belongs
+to the calling thread, instead of on the node itself, so that one node instance can be evaluated concurrently from
+several threads.
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import contextlib
+import functools
+import threading
+
+_local = threading.local()
+
+
+def _get_contexts():
+    if not hasattr(_local, "contexts"):
+        _local.contexts = {}
+    return _local.contexts
+
+
+@contextlib.contextmanager
+def eval_context(node):
+    """Context manager for a single evaluation of a node in the current thread.
+
+    Evaluations are reentrant: a nested evaluation of the same node gets its own context.
+
+    Parameters
+    ----------
+    node : Node
+        evaluated node
+
+    Yields
+    ------
+    context : dict
+        request state of the evaluation, see :class:`EvalState`
+    """
+
+    stack = _get_contexts().setdefault(id(node), [])
+    context = {}
+    stack.append(context)
+    try:
+        yield context
+    finally:
+        stack.pop()
+        if not stack:
+            del _get_contexts()[id(node)]
+
+
+def get_eval_context(node):
+    """The context of the evaluation of a node in progress in the current thread, or None if there is none."""
+
+    stack = _get_contexts().get(id(node))
+    return stack[-1] if stack else None
+
+
+def with_eval_context(fn):
+    """Decorator for node methods (e.g. eval) that run in their own evaluation context.
+
+    Parameters
+    ----------
+    fn : function
+        node method
+
+    Returns
+    -------
+    wrapper : function
+        wrapped node method
+    """
+
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        with eval_context(self):
+            return fn(self, *args, **kwargs)
+
+    return wrapper
+
+
+class EvalState(object):
+    """Node attribute that holds request state of an evaluation.
+
+    During an evaluation, the value is stored in the evaluation context of the calling thread, so that concurrent
+    evaluations of the same node do not share it. Outside of an evaluation, the attribute gives the value set by the
+    most recent evaluation, for debugging. The default value is None.
+
+    Parameters
+    ----------
+    name : str
+        attribute name
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+
+        context = get_eval_context(obj)
+        if context is not None:
+            return context.get(self.name)
+        return obj.__dict__.get("_last_eval_state", {}).get(self.name)
+
+    def __set__(self, obj, value):
+        context = get_eval_context(obj)
+        if context is not None:
+            context[self.name] = value
+        obj.__dict__.setdefault("_last_eval_state", {})[self.name] = value
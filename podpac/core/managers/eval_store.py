@@ -0,0 +1,261 @@
+"""
+Out-of-core evaluation of nodes into zarr or NetCDF stores, see :meth:`podpac.Node.eval_to_store`.
+
+The coordinates are evaluated chunk by chunk, and each chunk output is written into the store as soon as it is
+evaluated, so that the memory used is bounded by the chunk size and the number of workers. Chunks that are already in
+the store are skipped, so that an interrupted evaluation can be resumed.
+"""
+
+from __future__ import division, unicode_literals, print_function, absolute_import
+
+import os
+import logging
+import threading
+
+import numpy as np
+from six import string_types
+from lazy_import import lazy_module
+
+from podpac.core.coordinates import StackedCoordinates, DependentCoordinates
+from podpac.core.managers.multi_threading import thread_manager
+
+# Optional dependencies
+zarr = lazy_module("zarr")
+netCDF4 = lazy_module("netCDF4")
+
+# Set up logging
+_log = logging.getLogger(__name__)
+
+NETCDF_EXTENSIONS = [".nc", ".nc4", ".cdf"]
+
+
+def eval_to_store(node, coordinates, store, chunks, workers=1):
+    """
+    Evaluate a node chunk by chunk into a zarr or NetCDF store. See :meth:`podpac.Node.eval_to_store`.
+    """
+
+    chunks = node._get_chunk_shape(coordinates, chunk_shape=chunks)
+
+    if isinstance(store, string_types) and os.path.splitext(store)[1].lower() in NETCDF_EXTENSIONS:
+        writer = NetCDFWriter(node, coordinates, store, chunks)
+    else:
+        writer = ZarrWriter(node, coordinates, store, chunks)
+
+    todo = (
+        (chunk, slices)
+        for chunk, slices in coordinates.iterchunks(chunks, return_slices=True)
+        if not writer.exists(slices)
+    )
+
+    def _eval_chunk(args):
+        chunk, slices = args
+        writer.write(slices, node.eval(chunk))
+        _log.debug("Wrote chunk %s", slices)
+
+    n_threads = thread_manager.request_n_threads(workers) if workers > 1 else 0
+    try:
+        if n_threads > 1:
+            pool = thread_manager.get_thread_pool(processes=n_threads)
+            try:
+                n = sum(1 for _ in pool.imap_unordered(_eval_chunk, todo))
+            finally:
+                # wait for the chunks in progress before the writer is closed
+                pool.close()
+                pool.join()
+        else:
+            n = 0
+            for args in todo:
+                _eval_chunk(args)
+                n += 1
+    finally:
+        thread_manager.release_n_threads(n_threads)
+        writer.close()
+
+    return n
+
+
+def _get_keys(node):
+    """ data variable names for the node outputs """
+
+    if node.outputs is not None and node.output is None:
+        return list(node.outputs)
+    return [node.output or "data"]
+
+
+def _get_dtype(node):
+    """ dtype and fill value of the node outputs """
+
+    dtype = np.dtype(node.dtype)
+    fill_value = np.nan if dtype.kind in "fc" else None
+    return dtype, fill_value
+
+
+def _get_coordinate_arrays(coordinates):
+    """ (name, dims, values) of the coordinate arrays """
+
+    arrays = []
+    for c in coordinates._coords.values():
+        if isinstance(c, StackedCoordinates):
+            arrays.extend((s.name, (c.name,), s.coordinates) for s in c)
+        elif isinstance(c, DependentCoordinates):
+            arrays.extend((dim, c.idims, values) for dim, values in zip(c.dims, c.coordinates))
+        else:
+            arrays.append((c.name, (c.name,), c.coordinates))
+    return arrays
+
+
+def _check_coordinates(name, stored, values, store):
+    """ raise if the coordinate values in a store being resumed do not match the requested coordinates """
+
+    if stored.shape != values.shape or not np.array_equal(stored, values):
+        raise ValueError("Coordinates '%s' in '%s' do not match the requested coordinates" % (name, store))
+
+
+def _check_crs(key, crs, requested, store):
+    """ raise if the crs of an output variable in a store being resumed does not match the requested crs """
+
+    if crs is not None and crs != requested:
+        raise ValueError(
+            "Variable '%s' in '%s' has crs '%s', which does not match the requested crs '%s'"
+            % (key, store, crs, requested)
+        )
+
+
+def _get_chunk_data(output, key, dims):
+    """ data of one output variable, in the store dims order """
+
+    if "output" in output.dims:
+        output = output.sel(output=key)
+    return output.transpose(*dims).data
+
+
+class ZarrWriter(object):
+    """Write chunk outputs into a zarr group, with one zarr chunk per evaluation chunk.
+
+    The store is written with the zarr 2 API and format. Coordinates are written as arrays without a fill value and with
+    the ``_ARRAY_DIMENSIONS`` attribute, so that the store can be opened with :func:`xarray.open_zarr`. A chunk exists
+    when all of its variable chunks are in the store (note that zarr may not store chunks that only contain the fill
+    value, which are then evaluated again when resuming).
+    """
+
+    def __init__(self, node, coordinates, store, chunks):
+        self.dims = coordinates.idims
+        self.chunks = chunks
+        self.keys = _get_keys(node)
+        self.group = zarr.open_group(store, mode="a")
+
+        # when resuming, the stored coordinates must match the requested coordinates
+        arrays = _get_coordinate_arrays(coordinates)
+        for name, dims, values in arrays:
+            if name in self.group:
+                _check_coordinates(name, self.group[name][:], values, store)
+        for key in self.keys:
+            if key in self.group:
+                _check_crs(key, self.group[key].attrs.get("crs"), coordinates.crs, store)
+
+        dtype, fill_value = _get_dtype(node)
+        for key in self.keys:
+            arr = self.group.require_dataset(
+                key, shape=coordinates.shape, chunks=chunks, dtype=dtype, fill_value=fill_value, exact=True
+            )
+            arr.attrs["_ARRAY_DIMENSIONS"] = self.dims
+            arr.attrs["crs"] = coordinates.crs
+
+        for name, dims, values in arrays:
+            if name not in self.group:
+                # coordinate values equal to the default fill value (e.g. 0) would be read as missing
+                self.group.array(name, values, fill_value=None)
+                self.group[name].attrs["_ARRAY_DIMENSIONS"] = dims
+
+    def _chunk_key(self, key, slices):
+        index = ".".join(str(s.start // n) for s, n in zip(slices, self.chunks))
+        return "%s/%s" % (self.group[key].path, index)
+
+    def exists(self, slices):
+        return all(self._chunk_key(key, slices) in self.group.store for key in self.keys)
+
+    def write(self, slices, output):
+        for key in self.keys:
+            self.group[key][slices] = _get_chunk_data(output, key, self.dims)
+
+    def close(self):
+        pass
+
+
+class NetCDFWriter(object):
+    """Write chunk outputs into a NetCDF file.
+
+    Datetime coordinates are written in seconds since 1970-01-01. The chunks that have been written are recorded in the
+    ``_chunks_done`` variable. The NetCDF library is not thread-safe, so access to the file is serialized.
+    """
+
+    def __init__(self, node, coordinates, path, chunks):
+        self.dims = coordinates.idims
+        self.chunks = chunks
+        self.keys = _get_keys(node)
+        self._lock = threading.Lock()
+        self.dataset = netCDF4.Dataset(path, mode="a" if os.path.exists(path) else "w")
+        try:
+            self._setup(node, coordinates, path, chunks)
+        except Exception:
+            self.dataset.close()
+            raise
+
+    def _setup(self, node, coordinates, path, chunks):
+        ds = self.dataset
+        for dim, n in zip(self.dims, coordinates.shape):
+            if dim not in ds.dimensions:
+                ds.createDimension(dim, n)
+            elif len(ds.dimensions[dim]) != n:
+                raise ValueError("Dimension '%s' in '%s' does not match the coordinates size %d" % (dim, path, n))
+
+        for name, dims, values in _get_coordinate_arrays(coordinates):
+            datetime = values.dtype.kind == "M"
+            if datetime:
+                values = values.astype("datetime64[s]").astype("i8")
+
+            if name in ds.variables:
+                # when resuming, the stored coordinates must match the requested coordinates
+                _check_coordinates(name, np.asarray(ds[name][:]), values, path)
+            elif datetime:
+                var = ds.createVariable(name, "i8", dims)
+                var.units = "seconds since 1970-01-01T00:00:00"
+                var[:] = values
+            else:
+                var = ds.createVariable(name, values.dtype, dims)
+                var[:] = values
+
+        dtype, fill_value = _get_dtype(node)
+        for key in self.keys:
+            if key in ds.variables:
+                _check_crs(key, getattr(ds[key], "crs", None), coordinates.crs, path)
+            else:
+                var = ds.createVariable(key, dtype, self.dims, fill_value=fill_value, chunksizes=chunks)
+                var.crs = coordinates.crs
+
+        # chunks written, for resuming
+        grid = [int(np.ceil(n / c)) for n, c in zip(coordinates.shape, chunks)]
+        self.chunk_dims = tuple("_chunk_%s" % dim for dim in self.dims)
+        for dim, n in zip(self.chunk_dims, grid):
+            if dim not in ds.dimensions:
+                ds.createDimension(dim, n)
+        if "_chunks_done" not in ds.variables:
+            ds.createVariable("_chunks_done", "u1", self.chunk_dims, fill_value=0)
+
+    def _chunk_index(self, slices):
+        return tuple(s.start // n for s, n in zip(slices, self.chunks))
+
+    def exists(self, slices):
+        with self._lock:
+            return bool(self.dataset["_chunks_done"][self._chunk_index(slices)])
+
+    def write(self, slices, output):
+        data = {key: _get_chunk_data(output, key, self.dims) for key in self.keys}
+        with self._lock:
+            for key in self.keys:
+                self.dataset[key][slices] = data[key]
+            self.dataset["_chunks_done"][self._chunk_index(slices)] = 1
+            self.dataset.sync()
+
+    def close(self):
+        self.dataset.close()
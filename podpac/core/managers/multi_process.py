@@ -72,3 +72,6 @@ class Process(Node):
             output = o
 
         return output
+
+    def _plan_inputs(self, coordinates):
+        return [(self.source, coordinates)]
@@ -6,6 +6,7 @@ from __future__ import division, unicode_literals, print_function, absolute_impo
 
 import time
 import logging
+import threading
 import traitlets as tl
 import numpy as np
 
@@ -14,6 +15,7 @@ from multiprocessing.pool import ThreadPool
 from podpac.core.managers.multi_threading import Lock
 from podpac.core.node import Node
 from podpac.core.utils import NodeTrait
+from podpac.core.cache.eval_memo import _get_inputs
 from podpac.core.data.zarr_source import Zarr
 from podpac.core.coordinates import Coordinates, merge_dims
 
@@ -28,6 +30,36 @@ botocore = lazy_module("botocore")
 _log = logging.getLogger(__name__)
 
 
+def _has_datasets(node):
+    """True if the pipeline of a node has data sources with a dataset handle (e.g. an open file), which cannot be
+    shared between threads."""
+
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        if hasattr(type(n), "dataset"):
+            return True
+        stack.extend(_get_inputs(n))
+    return False
+
+
+_local = threading.local()
+
+
+def _get_thread_source(source):
+    """Copy of a source node for the current thread, built once per thread for each source definition, so that the
+    dataset handles of the copy are only used by one thread."""
+
+    sources = getattr(_local, "sources", None)
+    if sources is None:
+        sources = _local.sources = {}
+
+    key = source.json
+    if key not in sources:
+        sources[key] = Node.from_definition(source.definition)
+    return sources[key]
+
+
 class Parallel(Node):
     """
     This class launches the parallel node evaluations in separate threads. As such, the node does not need to return 
@@ -136,11 +168,18 @@ class Parallel(Node):
 
         return output
 
+    def _plan_inputs(self, coordinates):
+        shape = [self.chunks.get(d, coordinates[d].size) for d in coordinates.dims]
+        return [(self.source, coords) for coords in list(coordinates.iterchunks(shape))[self.start_i :]]
+
     def eval_source(self, coordinates, coordinates_index, out, i, source=None):
         if source is None:
             source = self.source
-            # Make a copy to prevent any possibility of memory corruption
-            source = Node.from_definition(source.definition)
+
+            # node evaluations keep their request state per call, so the chunks can share the source node, except for
+            # data sources with dataset handles, which are copied (and opened again) once for each worker thread
+            if _has_datasets(source):
+                source = _get_thread_source(source)
 
         _log.info("Submitting source {}".format(i))
         return (source.eval(coordinates, output=out), coordinates_index)
@@ -381,8 +420,6 @@ class ZarrOutputMixin(tl.HasTraits):
                 _log.info("Skipping {} (already exists)".format(i))
                 return out, coordinates_index
 
-        # Make a copy to prevent any possibility of memory corruption
-        source = Node.from_definition(source.definition)
         _log.debug("Creating output format.")
         output = dict(
             format="zarr_part",
@@ -395,6 +432,8 @@ class ZarrOutputMixin(tl.HasTraits):
         _log.debug("Finished creating output format.")
 
         if source.has_trait("output_format"):
+            # the output format is set for each chunk, so each chunk needs its own copy of the source
+            source = Node.from_definition(source.definition)
             source.set_trait("output_format", output)
         _log.debug("output: {}, coordinates.shape: {}".format(output, coordinates.shape))
         _log.debug("Evaluating node.")
@@ -0,0 +1,254 @@
+"""
+Opt-in execution tracing of node evaluations.
+
+Usage::
+
+    with podpac.profile() as p:
+        node.eval(coordinates)
+
+    print(p.summary())
+    p.to_chrome_trace("trace.json")  # open in chrome://tracing or https://ui.perfetto.dev
+
+Each node evaluation and its phases (intersect, get_data, interpolate, algorithm, composite, cache get/put) is recorded
+as a span, with the thread id, bytes read, output size, and cache hit/miss where they apply. When no profile is
+active, recording a span costs a single check.
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+
+_lock = threading.Lock()
+_profiles = []
+_local = threading.local()
+
+
+class _Span(object):
+    """ An open span, used to measure the time spent in child spans """
+
+    def __init__(self, name, cat, args):
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.child_time = 0.0
+
+
+@contextmanager
+def span(name, cat, node=None, **args):
+    """Record a span in the active profiles, if any.
+
+    Parameters
+    ----------
+    name : str
+        span name, e.g. the node or phase name
+    cat : str
+        span category, one of 'eval', 'phase', or 'cache'
+    node : Node, optional
+        the node that the span belongs to
+    **args
+        span arguments, e.g. ``bytes_read``
+
+    Yields
+    ------
+    args : dict
+        span arguments, which can be updated before the span ends (e.g. with the output size)
+    """
+
+    if not _profiles:
+        yield args
+        return
+
+    if node is not None:
+        # imported here to avoid a circular import (nodes record spans when they are evaluated)
+        from podpac.core.node import _get_hash
+
+        # nodes that cannot be hashed are recorded without their hash
+        node_hash = _get_hash(node)
+        if node_hash is not None:
+            args["node_hash"] = node_hash
+
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+
+    s = _Span(name, cat, args)
+    stack.append(s)
+    t0 = time.time()
+    try:
+        yield args
+    finally:
+        duration = time.time() - t0
+        stack.pop()
+        if stack:
+            stack[-1].child_time += duration
+
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": t0 * 1e6,
+            "dur": duration * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.current_thread().ident,
+            "args": args,
+            "self": duration - s.child_time,
+            "depth": len(stack),
+        }
+        with _lock:
+            for profile in _profiles:
+                profile._add(event)
+
+
+class Profile(object):
+    """Trace of the node evaluations made while the profile is active.
+
+    Use :func:`profile` to create and activate a profile.
+
+    Attributes
+    ----------
+    events : list
+        recorded spans, in the order that they ended. Times are in microseconds since the epoch.
+    """
+
+    def __init__(self):
+        self.events = []
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        with _lock:
+            _profiles.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        with _lock:
+            _profiles.remove(self)
+
+    def _add(self, event):
+        with self._lock:
+            self.events.append(event)
+
+    def to_chrome_trace(self, path=None):
+        """Export the trace in the Chrome trace event format.
+
+        Parameters
+        ----------
+        path : str, optional
+            If provided, the trace is written to this JSON file.
+
+        Returns
+        -------
+        trace : dict
+            trace in the Chrome trace event format, see
+            https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU
+        """
+
+        with self._lock:
+            events = [{k: v for k, v in e.items() if k not in ["self", "depth"]} for e in self.events]
+
+        trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+        if path is not None:
+            with open(path, "w") as f:
+                json.dump(trace, f, default=str)
+        return trace
+
+    def totals(self):
+        """Totals for each span name and category, sorted by decreasing self time.
+
+        Returns
+        -------
+        totals : list
+            dicts with the span ``name``, ``cat``, ``count``, ``total`` and ``self`` time (in seconds), ``bytes_read``,
+            ``output_bytes``, cache ``hits`` and ``misses``, and the ``threads`` count
+        """
+
+        with self._lock:
+            events = list(self.events)
+
+        totals = {}
+        for e in events:
+            t = totals.get((e["name"], e["cat"]))
+            if t is None:
+                t = totals[(e["name"], e["cat"])] = {
+                    "name": e["name"],
+                    "cat": e["cat"],
+                    "count": 0,
+                    "total": 0.0,
+                    "self": 0.0,
+                    "bytes_read": 0,
+                    "output_bytes": 0,
+                    "hits": 0,
+                    "misses": 0,
+                    "threads": set(),
+                }
+            t["count"] += 1
+            t["total"] += e["dur"] / 1e6
+            t["self"] += e["self"]
+            t["bytes_read"] += e["args"].get("bytes_read", 0)
+            t["output_bytes"] += e["args"].get("output_bytes", 0)
+            if "cache" in e["args"]:
+                t["hits" if e["args"]["cache"] == "hit" else "misses"] += 1
+            t["threads"].add(e["tid"])
+
+        rows = sorted(totals.values(), key=lambda t: t["self"], reverse=True)
+        for t in rows:
+            t["threads"] = len(t["threads"])
+        return rows
+
+    def summary(self):
+        """Human-readable table of the totals for each span name and category, sorted by decreasing self time."""
+
+        header = "%-32s %-6s %7s %10s %10s %12s %12s %6s %6s %7s" % (
+            "name",
+            "cat",
+            "count",
+            "total (s)",
+            "self (s)",
+            "read (B)",
+            "output (B)",
+            "hits",
+            "misses",
+            "threads",
+        )
+        lines = [header, "-" * len(header)]
+        for t in self.totals():
+            lines.append(
+                "%-32s %-6s %7d %10.4f %10.4f %12d %12d %6d %6d %7d"
+                % (
+                    t["name"][:32],
+                    t["cat"],
+                    t["count"],
+                    t["total"],
+                    t["self"],
+                    t["bytes_read"],
+                    t["output_bytes"],
+                    t["hits"],
+                    t["misses"],
+                    t["threads"],
+                )
+            )
+        return "\n".join(lines)
+
+
+def profile():
+    """
+    Profile node evaluations, for use in a ``with`` statement::
+
+        with podpac.profile() as p:
+            node.eval(coordinates)
+
+        print(p.summary())
+        p.to_chrome_trace("trace.json")
+
+    Evaluations in all threads are recorded while the profile is active.
+
+    Returns
+    -------
+    profile : :class:`Profile`
+        the profile, which is active inside the ``with`` statement
+    """
+
+    return Profile()
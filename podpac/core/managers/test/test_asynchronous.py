@@ -0,0 +1,30 @@
+import sys
+import asyncio
+
+import pytest
+
+from podpac.core.managers import asynchronous
+from podpac.core.managers.asynchronous import _import_aiohttp, _has_aiohttp, get_url_async
+
+
+class TestAsynchronous(object):
+    def test_aiohttp_not_installed(self, monkeypatch):
+        # None in sys.modules makes the import fail
+        monkeypatch.setitem(sys.modules, "aiohttp", None)
+
+        with pytest.raises(ImportError, match=r"podpac\[async\]"):
+            _import_aiohttp()
+        assert not _has_aiohttp()
+
+    def test_get_url_async_requests(self, monkeypatch):
+        # without aiohttp, downloads use requests in the event loop executor
+        monkeypatch.setitem(sys.modules, "aiohttp", None)
+
+        class Response(object):
+            content = b"content"
+
+            def raise_for_status(self):
+                pass
+
+        monkeypatch.setattr(asynchronous.requests, "get", lambda url: Response())
+        assert asyncio.get_event_loop().run_until_complete(get_url_async("http://example.com")) == b"content"
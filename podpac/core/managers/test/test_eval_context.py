@@ -0,0 +1,63 @@
+import threading
+
+from podpac.core.managers.eval_context import EvalState, eval_context, get_eval_context, with_eval_context
+
+
+class MyNode(object):
+    state = EvalState("state")
+
+    @with_eval_context
+    def eval(self, value, inner=None):
+        self.state = value
+        if inner is not None:
+            self.eval(inner)
+        return self.state
+
+
+class TestEvalContext(object):
+    def test_eval_context(self):
+        node = MyNode()
+        assert get_eval_context(node) is None
+
+        with eval_context(node) as context:
+            assert get_eval_context(node) is context
+            with eval_context(node) as inner:
+                assert get_eval_context(node) is inner
+            assert get_eval_context(node) is context
+
+        assert get_eval_context(node) is None
+
+    def test_eval_state(self):
+        node = MyNode()
+        assert node.state is None
+
+        # the most recent value is kept for debugging
+        node.eval(1)
+        assert node.state == 1
+
+        # nested evaluations have their own state
+        assert node.eval(2, inner=3) == 2
+        assert node.state == 3
+
+        # unset state does not leak between evaluations
+        with eval_context(node):
+            assert node.state is None
+
+    def test_eval_state_multithreaded(self):
+        node = MyNode()
+        barrier = threading.Barrier(2)
+        results = {}
+
+        def f(value):
+            with eval_context(node):
+                node.state = value
+                barrier.wait()
+                results[value] = node.state
+
+        threads = [threading.Thread(target=f, args=(value,)) for value in ["a", "b"]]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == {"a": "a", "b": "b"}
@@ -0,0 +1,148 @@
+import os
+
+import pytest
+import numpy as np
+
+import podpac
+from podpac.core.data.array_source import Array
+from podpac.core.managers.multi_threading import thread_manager
+
+
+class TestEvalToStore(object):
+    coordinates = podpac.Coordinates([np.linspace(0, 1, 10), np.linspace(0, 2, 20)], dims=["lat", "lon"])
+
+    def make_node(self, **kwargs):
+        data = np.arange(200, dtype=float).reshape(10, 20)
+        return Array(source=data, coordinates=self.coordinates, cache_output=False, **kwargs)
+
+    def test_zarr(self, tmpdir):
+        zarr = pytest.importorskip("zarr")
+        xr = pytest.importorskip("xarray")
+
+        path = os.path.join(str(tmpdir), "output.zarr")
+        node = self.make_node()
+        expected = node.eval(self.coordinates)
+
+        n = node.eval_to_store(self.coordinates, path, chunks=(4, 20))
+        assert n == 3
+
+        ds = xr.open_zarr(path)
+        np.testing.assert_array_equal(ds["data"], expected)
+        np.testing.assert_array_equal(ds["lat"], self.coordinates["lat"].coordinates)
+        np.testing.assert_array_equal(ds["lon"], self.coordinates["lon"].coordinates)
+
+        # resume
+        assert node.eval_to_store(self.coordinates, path, chunks=(4, 20)) == 0
+        zarr.open_group(path).store.__delitem__("data/1.0")
+        assert node.eval_to_store(self.coordinates, path, chunks=(4, 20)) == 1
+        np.testing.assert_array_equal(xr.open_zarr(path)["data"], expected)
+
+    def test_zarr_outputs(self, tmpdir):
+        pytest.importorskip("zarr")
+        xr = pytest.importorskip("xarray")
+
+        path = os.path.join(str(tmpdir), "output.zarr")
+        data = np.arange(400, dtype=float).reshape(10, 20, 2)
+        node = Array(source=data, coordinates=self.coordinates, outputs=["a", "b"], cache_output=False)
+
+        n = node.eval_to_store(self.coordinates, path, chunks={"lon": 5})
+        assert n == 4
+
+        ds = xr.open_zarr(path)
+        np.testing.assert_array_equal(ds["a"], data[:, :, 0])
+        np.testing.assert_array_equal(ds["b"], data[:, :, 1])
+
+    def test_zarr_workers(self, tmpdir):
+        pytest.importorskip("zarr")
+        xr = pytest.importorskip("xarray")
+
+        path = os.path.join(str(tmpdir), "output.zarr")
+        node = self.make_node()
+        expected = node.eval(self.coordinates)
+
+        with podpac.settings:
+            podpac.settings["N_THREADS"] = 4
+            n = node.eval_to_store(self.coordinates, path, chunks=(2, 5), workers=4)
+        assert n == 20
+        np.testing.assert_array_equal(xr.open_zarr(path)["data"], expected)
+
+    def test_zarr_workers_error(self, tmpdir):
+        pytest.importorskip("zarr")
+
+        class MyError(Exception):
+            pass
+
+        class ErrorNode(Array):
+            def eval(self, coordinates, output=None):
+                raise MyError("chunk error")
+
+        path = os.path.join(str(tmpdir), "output.zarr")
+        data = np.arange(200, dtype=float).reshape(10, 20)
+        node = ErrorNode(source=data, coordinates=self.coordinates, cache_output=False)
+
+        with podpac.settings:
+            podpac.settings["N_THREADS"] = 4
+            with pytest.raises(MyError):
+                node.eval_to_store(self.coordinates, path, chunks=(2, 5), workers=4)
+
+        # the threads are released
+        assert thread_manager._n_threads_used == 0
+
+    def test_netcdf(self, tmpdir):
+        netCDF4 = pytest.importorskip("netCDF4")
+
+        path = os.path.join(str(tmpdir), "output.nc")
+        node = self.make_node()
+        expected = node.eval(self.coordinates)
+
+        n = node.eval_to_store(self.coordinates, path, chunks=(4, 20), workers=2)
+        assert n == 3
+
+        with netCDF4.Dataset(path) as ds:
+            np.testing.assert_array_equal(ds["data"][:], expected)
+            np.testing.assert_array_equal(ds["lat"][:], self.coordinates["lat"].coordinates)
+            assert ds["_chunks_done"][:].tolist() == [[1], [1], [1]]
+
+        # resume
+        assert node.eval_to_store(self.coordinates, path, chunks=(4, 20)) == 0
+
+    def test_zarr_resume_mismatch(self, tmpdir):
+        pytest.importorskip("zarr")
+
+        path = os.path.join(str(tmpdir), "output.zarr")
+        node = self.make_node()
+        node.eval_to_store(self.coordinates, path, chunks=(4, 20))
+
+        # same shape, different coordinate values
+        coordinates = podpac.Coordinates([np.linspace(1, 2, 10), np.linspace(0, 2, 20)], dims=["lat", "lon"])
+        with pytest.raises(ValueError, match="Coordinates 'lat'"):
+            node.eval_to_store(coordinates, path, chunks=(4, 20))
+
+        # same coordinate values, different crs
+        coordinates = podpac.Coordinates(
+            [np.linspace(0, 1, 10), np.linspace(0, 2, 20)], dims=["lat", "lon"], crs="EPSG:3857"
+        )
+        with pytest.raises(ValueError, match="crs"):
+            node.eval_to_store(coordinates, path, chunks=(4, 20))
+
+    def test_netcdf_resume_mismatch(self, tmpdir):
+        pytest.importorskip("netCDF4")
+
+        path = os.path.join(str(tmpdir), "output.nc")
+        node = self.make_node()
+        node.eval_to_store(self.coordinates, path, chunks=(4, 20))
+
+        # same shape, different coordinate values
+        coordinates = podpac.Coordinates([np.linspace(1, 2, 10), np.linspace(0, 2, 20)], dims=["lat", "lon"])
+        with pytest.raises(ValueError, match="Coordinates 'lat'"):
+            node.eval_to_store(coordinates, path, chunks=(4, 20))
+
+        # same coordinate values, different crs
+        coordinates = podpac.Coordinates(
+            [np.linspace(0, 1, 10), np.linspace(0, 2, 20)], dims=["lat", "lon"], crs="EPSG:3857"
+        )
+        with pytest.raises(ValueError, match="crs"):
+            node.eval_to_store(coordinates, path, chunks=(4, 20))
+
+        # the file is closed after an error, and can be resumed with the original coordinates
+        assert node.eval_to_store(self.coordinates, path, chunks=(4, 20)) == 0
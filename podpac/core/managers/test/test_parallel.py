@@ -11,8 +11,12 @@ import pytest
 
 from podpac import settings
 from podpac.core.coordinates import Coordinates
+from podpac.core.node import Node
 from podpac.core.algorithm.utility import CoordData
+from podpac.core.algorithm.generic import Arithmetic
+from podpac.core.data.rasterio_source import Rasterio
 from podpac.core.managers.parallel import Parallel, ParallelOutputZarr, ParallelAsync, ParallelAsyncOutputZarr
+from podpac.core.managers.parallel import _has_datasets
 from podpac.core.managers.multi_process import Process
 
 logger = logging.getLogger("podpac")
@@ -40,6 +44,33 @@ class TestParallel(object):
 
         np.testing.assert_array_equal(o, o_p)
 
+    def test_has_datasets(self):
+        # chunks share the source, except for pipelines with dataset handles, which are copied for each chunk
+        source = Rasterio(source="test.tif")
+        assert _has_datasets(source)
+        assert _has_datasets(Arithmetic(A=source, B=CoordData(coord_name="time"), eqn="A + B"))
+        assert not _has_datasets(CoordData(coord_name="time"))
+
+    def test_datasets_copied_per_thread(self, monkeypatch):
+        # file sources are copied once for each worker thread, not for each chunk
+        path = os.path.join(os.path.dirname(__file__), "..", "..", "data", "test", "assets", "RGB.byte.tif")
+        source = Rasterio(source=path)
+        coords = source.coordinates[:80, :60]
+
+        copies = []
+        from_definition = Node.from_definition
+
+        def counted(definition):
+            copies.append(definition)
+            return from_definition(definition)
+
+        monkeypatch.setattr(Node, "from_definition", staticmethod(counted))
+
+        node = Parallel(source=source, number_of_workers=2, chunks={"lat": 10, "lon": 20})
+        o = node.eval(coords)
+        assert 0 < len(copies) <= 2
+        np.testing.assert_array_equal(o, source.eval(coords))
+
     @pytest.mark.skipif(sys.version < "3.7", reason="python < 3.7 cannot handle processes launched from threads")
     def test_parallel_process(self):
         node = Process(source=CoordData(coord_name="time"))
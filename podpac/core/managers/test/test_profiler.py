@@ -0,0 +1,119 @@
+import os
+import json
+import threading
+
+import numpy as np
+import traitlets as tl
+
+import podpac
+from podpac.core.data.array_source import Array
+from podpac.core.algorithm.utility import Arange
+from podpac.core.algorithm.generic import Arithmetic
+from podpac.core.managers.profiler import span, profile, Profile
+
+
+class TestProfiler(object):
+    def test_span_inactive(self):
+        with span("a", "phase", x=1) as trace:
+            trace["bytes_read"] = 10
+        assert trace == {"x": 1, "bytes_read": 10}
+
+    def test_span(self):
+        with profile() as p:
+            with span("a", "phase") as trace:
+                trace["bytes_read"] = 10
+                with span("b", "phase"):
+                    pass
+                with span("b", "phase"):
+                    pass
+
+        # not recorded after the profile ends
+        with span("a", "phase"):
+            pass
+
+        assert isinstance(p, Profile)
+        assert [e["name"] for e in p.events] == ["b", "b", "a"]
+        assert [e["depth"] for e in p.events] == [1, 1, 0]
+        a = p.events[-1]
+        assert a["args"] == {"bytes_read": 10}
+        assert a["self"] <= a["dur"] / 1e6
+
+    def test_totals(self):
+        with profile() as p:
+            with span("a", "cache") as trace:
+                trace["cache"] = "hit"
+            with span("a", "cache") as trace:
+                trace["cache"] = "miss"
+            with span("b", "phase", output_bytes=8):
+                pass
+
+        totals = {t["name"]: t for t in p.totals()}
+        assert totals["a"]["count"] == 2
+        assert totals["a"]["hits"] == 1
+        assert totals["a"]["misses"] == 1
+        assert totals["a"]["threads"] == 1
+        assert totals["b"]["output_bytes"] == 8
+
+        summary = p.summary()
+        assert "a" in summary
+        assert "b" in summary
+
+    def test_threads(self):
+        def f():
+            with span("a", "phase"):
+                pass
+
+        with profile() as p:
+            threads = [threading.Thread(target=f) for _ in range(3)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert p.totals()[0]["count"] == 3
+        assert all(e["depth"] == 0 for e in p.events)
+
+    def test_to_chrome_trace(self, tmpdir):
+        path = os.path.join(str(tmpdir), "trace.json")
+        with profile() as p:
+            with span("a", "phase"):
+                pass
+
+        trace = p.to_chrome_trace(path)
+        with open(path) as f:
+            assert json.load(f) == trace
+        assert len(trace["traceEvents"]) == 1
+        event = trace["traceEvents"][0]
+        assert event["ph"] == "X"
+        assert event["name"] == "a"
+        assert "self" not in event
+
+    def test_node_eval(self):
+        coords = podpac.Coordinates([range(3), range(4)], dims=["lat", "lon"])
+        node = Arithmetic(A=Arange(), B=Array(source=np.ones((3, 4)), coordinates=coords), eqn="A + B")
+        with podpac.settings, podpac.profile() as p:
+            podpac.settings.set_unsafe_eval(True)
+            node.eval(coords)
+
+        names = [(e["name"], e["cat"]) for e in p.events]
+        assert ("Array", "eval") in names
+        assert ("get_data", "phase") in names
+        assert ("interpolate", "phase") in names
+        assert ("algorithm", "phase") in names
+        assert names[-1][1] == "eval"
+        assert p.events[-1]["args"]["node_hash"] == node.hash
+        assert p.events[-1]["args"]["output_bytes"] > 0
+
+    def test_node_eval_unhashable(self):
+        class MyArray(Array):
+            value = tl.Any().tag(attr=True)
+
+        # profiling does not change the evaluation of nodes that cannot be hashed
+        coords = podpac.Coordinates([range(3), range(4)], dims=["lat", "lon"])
+        node = MyArray(source=np.ones((3, 4)), coordinates=coords, value=object(), cache_output=False)
+        with podpac.profile() as p:
+            output = node.eval(coords)
+
+        np.testing.assert_array_equal(output, 1)
+        assert p.events[-1]["name"] == "MyArray"
+        assert "node_hash" not in p.events[-1]["args"]
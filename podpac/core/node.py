@@ -21,7 +21,7 @@ import six
 import podpac
 from podpac.core.settings import settings
 from podpac.core.units import ureg, UnitsDataArray
-from podpac.core.utils import common_doc
+from podpac.core.utils import common_doc, is_lazy
 from podpac.core.utils import JSONEncoder
 from podpac.core.utils import cached_property
 from podpac.core.utils import trait_is_defined
@@ -29,7 +29,15 @@ from podpac.core.utils import _get_query_params_from_url, _get_from_url, _get_pa
 from podpac.core.coordinates import Coordinates
 from podpac.core.style import Style
 from podpac.core.cache import CacheCtrl, get_default_cache_ctrl, make_cache_ctrl, S3CacheStore, DiskCacheStore
+from podpac.core.cache import CacheException
+from podpac.core.cache.tiles import get_tiles
+from podpac.core.cache.single_flight import _single_flight
+from podpac.core.cache.eval_memo import EvalMemo, get_eval_memo, set_eval_memo, get_shared, propagate_eval_memo
 from podpac.core.managers.multi_threading import thread_manager
+from podpac.core.managers.eval_context import EvalState, with_eval_context
+from podpac.core.managers.profiler import span
+from podpac.core.managers.asynchronous import run_sync
+from podpac.core.managers.eval_store import eval_to_store
 
 
 COMMON_NODE_DOC = {
@@ -100,6 +108,12 @@ class Node(tl.HasTraits):
     force_eval: bool
         Default is False. Should the node's cached output be updated from the source data? If True it ignores the cache
         when computing outputs but puts results into the cache (thereby updating the cache)
+    cache_tile_size: int
+        Default is None. If provided (and ``cache_output`` is True), outputs are evaluated and cached in whole tiles of
+        this many grid cells in each uniformly-spaced dimension, aligned to a canonical grid for each resolution.
+        Requests on the same grid are assembled from the cached tiles, even if they are shifted or differently sized.
+        Tiling is only valid for pointwise nodes, whose output at each coordinate does not depend on the extent of the
+        request, and is ignored for other nodes (e.g. reductions and convolutions).
     cache_ctrl: :class:`podpac.core.cache.cache.CacheCtrl`
         Class that controls caching. If not provided, uses default based on settings.
     dtype : type
@@ -131,12 +145,17 @@ class Node(tl.HasTraits):
     dtype = tl.Any(default_value=float)
     cache_output = tl.Bool()
     force_eval = tl.Bool(False)
+    cache_tile_size = tl.Int(default_value=None, allow_none=True)
     cache_ctrl = tl.Instance(CacheCtrl, allow_none=True)
 
     # list of attribute names, used by __repr__ and __str__ to display minimal info about the node
     # e.g. data sources use ['source']
     _repr_keys = []
 
+    # True for node classes whose output at each coordinate only depends on their inputs at that coordinate (e.g.
+    # arithmetic), as opposed to the extent of the requested coordinates (e.g. reductions and convolutions)
+    _pointwise = False
+
     @tl.default("outputs")
     def _default_outputs(self):
         return None
@@ -168,7 +187,7 @@ class Node(tl.HasTraits):
         return get_default_cache_ctrl()
 
     # debugging
-    _requested_coordinates = tl.Instance(Coordinates, allow_none=True)
+    _requested_coordinates = EvalState("_requested_coordinates")
     _output = tl.Instance(UnitsDataArray, allow_none=True)
     _from_cache = tl.Bool(allow_none=True, default_value=None)
     # Flag that is True if the Node was run multi-threaded, or None if the question doesn't apply
@@ -176,6 +195,7 @@ class Node(tl.HasTraits):
 
     # util
     _definition_guard = False
+    _hash_guard = False
     _traits_initialized_guard = False
 
     def __init__(self, **kwargs):
@@ -267,10 +287,74 @@ class Node(tl.HasTraits):
 
         raise NotImplementedError
 
+    @common_doc(COMMON_DOC)
+    async def eval_async(self, coordinates, output=None):
+        """
+        Evaluate the node at the given coordinates, without blocking the asyncio event loop.
+
+        Inputs and downloads that the node supports fetching asynchronously (see `_prefetch_async`) are gathered
+        concurrently, and then the node is evaluated in the event loop executor.
+
+        Parameters
+        ----------
+        coordinates : podpac.Coordinates
+            {requested_coordinates}
+        output : podpac.UnitsDataArray, optional
+            {eval_output}
+
+        Returns
+        -------
+        output : {eval_return}
+        """
+
+        # nodes that cannot be hashed are evaluated without an evaluation memo
+        if _get_hash(self) is None:
+            return await run_sync(self.eval, coordinates, output=output)
+
+        # cached outputs do not need their inputs
+        memo = EvalMemo(get_shared(self))
+        cache_coordinates = coordinates.transpose(*sorted(coordinates.dims))
+        cached = self.cache_output and not self.force_eval
+        if not (cached and await run_sync(self.has_cache, "output", cache_coordinates)):
+            await self._prefetch_async(coordinates, memo)
+
+        def _eval():
+            set_eval_memo(memo)
+            try:
+                return self.eval(coordinates, output=output)
+            finally:
+                set_eval_memo(None)
+
+        return await run_sync(_eval)
+
+    async def _prefetch_async(self, coordinates, memo):
+        """
+        Asynchronously evaluate inputs and fetch remote data needed to evaluate the node. Implemented in child classes.
+
+        Evaluated inputs (see :meth:`EvalMemo.add`) and fetched resources (see :meth:`EvalMemo.add_prefetched`) are
+        added to the evaluation memo, and are used instead of evaluating or fetching them again during the evaluation.
+
+        Parameters
+        ----------
+        coordinates : podpac.Coordinates
+            Requested coordinates.
+        memo : EvalMemo
+            evaluation memo of the asynchronous evaluation
+        """
+
+        pass
+
     def eval_group(self, group):
         """
         Evaluate the node for each of the coordinates in the group.
 
+        The group is evaluated as a single top-level evaluation: when ``settings["EVAL_GROUP_SHARED_READS"]`` is
+        True, data sources read the union of the source data needed by the group members once and interpolate each
+        member from the shared read. The source data needed by each member is planned with `plan`, so that the
+        coordinates changes of the nodes between this node and the data sources are applied; the reads are not shared
+        if the node cannot be planned. When ``settings["MULTITHREADING"]`` is True, the members are evaluated
+        concurrently.
+
         Parameters
         ----------
         group : podpac.CoordinatesGroup
@@ -282,7 +366,223 @@ class Node(tl.HasTraits):
             evaluation output, list of UnitsDataArray objects
         """
 
-        return [self.eval(coords) for coords in group]
+        group = list(group)
+
+        # nodes that cannot be hashed are evaluated without an evaluation memo or shared reads
+        if _get_hash(self) is None:
+            return [self.eval(coords) for coords in group]
+
+        group_reads = self._plan_group(group) if settings["EVAL_GROUP_SHARED_READS"] else None
+        memo = EvalMemo(get_shared(self) if settings["EVAL_MEMO"] else set(), group_reads=group_reads)
+
+        previous = get_eval_memo()
+        set_eval_memo(memo)
+        try:
+            if settings["MULTITHREADING"]:
+                n_threads = thread_manager.request_n_threads(len(group))
+                if n_threads == 1:
+                    thread_manager.release_n_threads(n_threads)
+            else:
+                n_threads = 0
+
+            if settings["MULTITHREADING"] and n_threads > 1:
+                # evaluate members in parallel using thread pool
+                pool = thread_manager.get_thread_pool(processes=n_threads)
+                outputs = pool.map(propagate_eval_memo(self.eval), group)
+                pool.close()
+                thread_manager.release_n_threads(n_threads)
+            else:
+                outputs = [self.eval(coords) for coords in group]
+        finally:
+            set_eval_memo(previous)
+
+        return outputs
+
+    def _plan_group(self, group):
+        """ planned (source_coordinates, source_coordinates_index) reads of the group members by data source hash """
+
+        reads = {}
+        for coordinates in group:
+            try:
+                planned = self.plan(coordinates)
+            except NotImplementedError:
+                return None
+            except Exception:
+                # the member is evaluated (and any error raised) separately
+                continue
+
+            for node, rsc, rsci in planned:
+                node_hash = _get_hash(node)
+                if node_hash is not None:
+                    reads.setdefault(node_hash, []).append((rsc, rsci))
+        return reads
+
+    @common_doc(COMMON_DOC)
+    def iter_eval(self, coordinates, chunk_shape=None, max_bytes=None, prefetch=False):
+        """
+        Evaluate the node chunk by chunk, to stream large outputs with bounded memory.
+
+        Each chunk is a separate top-level evaluation. The chunks are yielded in row-major order.
+
+        Parameters
+        ----------
+        coordinates : podpac.Coordinates
+            {requested_coordinates}
+        chunk_shape : tuple, dict, optional
+            maximum shape of the chunks, with sizes corresponding to the coordinates dims, or a dictionary of sizes by
+            dim (the other dims are not chunked).
+        max_bytes : int, optional
+            maximum size of the chunk outputs in bytes, used when the chunk_shape is not given. Chunks span the
+            trailing dims first.
+        prefetch : bool, optional
+            Evaluate the next chunk in a background thread while the current chunk is consumed. Default False.
+
+        Yields
+        ------
+        slices : tuple
+            slices of the chunk in the coordinates
+        output : {eval_return}
+            chunk output
+        """
+
+        if chunk_shape is None and max_bytes is None:
+            raise ValueError("iter_eval requires a chunk_shape or max_bytes")
+
+        chunk_shape = self._get_chunk_shape(coordinates, chunk_shape=chunk_shape, max_bytes=max_bytes)
+        chunks = coordinates.iterchunks(chunk_shape, return_slices=True)
+
+        n_threads = thread_manager.request_n_threads(1) if prefetch else 0
+        if n_threads == 0:
+            for chunk, slices in chunks:
+                yield slices, self.eval(chunk)
+            return
+
+        pool = thread_manager.get_thread_pool(processes=n_threads)
+        try:
+            pending = None
+            for chunk, slices in chunks:
+                result = pool.apply_async(self.eval, (chunk,))
+                if pending is not None:
+                    yield pending[0], pending[1].get()
+                pending = (slices, result)
+            if pending is not None:
+                yield pending[0], pending[1].get()
+        finally:
+            pool.close()
+            thread_manager.release_n_threads(n_threads)
+
+    @common_doc(COMMON_DOC)
+    def eval_to_store(self, coordinates, store, chunks, workers=1):
+        """
+        Evaluate the node chunk by chunk, writing each chunk output directly into a zarr or NetCDF store.
+
+        The store contains a variable for each output (named 'data' for single-output nodes) and the coordinates, and
+        can be opened with xarray. Chunks that are already in the store are skipped, so that an interrupted evaluation
+        can be resumed by calling ``eval_to_store`` again with the same arguments.
+
+        Parameters
+        ----------
+        coordinates : podpac.Coordinates
+            {requested_coordinates}
+        store : str, MutableMapping
+            NetCDF file path (with a '.nc', '.nc4', or '.cdf' extension), or zarr store or path. Requires the netCDF4 or
+            zarr package, respectively.
+        chunks : tuple, dict
+            shape of the chunks, with sizes corresponding to the coordinates dims, or a dictionary of sizes by dim (the
+            other dims are not chunked). The zarr or NetCDF variables use the same chunks.
+        workers : int, optional
+            Number of chunks evaluated concurrently, in threads from the thread_manager pool. Default 1.
+
+        Returns
+        -------
+        n : int
+            number of chunks evaluated
+        """
+
+        return eval_to_store(self, coordinates, store, chunks, workers=workers)
+
+    def _get_chunk_shape(self, coordinates, chunk_shape=None, max_bytes=None):
+        """
+        Chunk shape as a list of sizes for the coordinates dims, used by iter_eval and eval_to_store.
+
+        The chunk_shape is a tuple of sizes or a dictionary of sizes by dim (the other dims are not chunked). Without a
+        chunk_shape, this is the largest chunk shape with outputs no larger than max_bytes, spanning the trailing dims
+        first.
+        """
+
+        if chunk_shape is not None:
+            if isinstance(chunk_shape, dict):
+                chunk_shape = [chunk_shape.get(dim, n) for dim, n in zip(coordinates.dims, coordinates.shape)]
+            return [min(c, n) for c, n in zip(chunk_shape, coordinates.shape)]
+
+        itemsize = np.dtype(self.dtype).itemsize
+        if self.outputs is not None:
+            itemsize *= len(self.outputs)
+
+        n = max(max_bytes // itemsize, 1)
+        shape = []
+        for size in coordinates.shape[::-1]:
+            shape.insert(0, min(size, max(n, 1)))
+            n //= size
+        return shape
+
+    @common_doc(COMMON_DOC)
+    @with_eval_context
+    def plan(self, coordinates):
+        """
+        Get the data source reads needed to evaluate the node at the given coordinates, without evaluating it.
+
+        The pipeline is walked from this node to its data sources, applying the coordinates changes of each node
+        (e.g. the expanded coordinates of Convolution and ExpandCoordinates nodes, or the chunks of Reduce nodes).
+        No source data is read, although data sources may need to open their files to get their coordinates. Nodes
+        with cached outputs need no reads.
+
+        Parameters
+        ----------
+        coordinates : podpac.Coordinates
+            {requested_coordinates}
+
+        Returns
+        -------
+        reads : list
+            (node, source_coordinates, source_coordinates_index) tuples of the data source reads, in evaluation order.
+            See :func:`podpac.core.data.datasource.merge_reads` to merge overlapping reads.
+        """
+
+        if self._plan_cached(coordinates):
+            return []
+
+        inputs = self._plan_inputs(coordinates)
+        return [read for node, node_coordinates in inputs for read in node.plan(node_coordinates)]
+
+    def _plan_inputs(self, coordinates):
+        """
+        Get the input nodes and coordinates that are evaluated to evaluate the node. Implemented in child classes.
+
+        Parameters
+        ----------
+        coordinates : podpac.Coordinates
+            Requested coordinates.
+
+        Returns
+        -------
+        inputs : list
+            (node, coordinates) tuples of the input evaluations.
+        """
+
+        raise NotImplementedError("Cannot plan the evaluation of %s nodes" % self.__class__.__name__)
+
+    def _plan_cached(self, coordinates):
+        """ True if the node output for these coordinates will be retrieved from the cache """
+
+        if not self.cache_output or self.force_eval:
+            return False
+
+        cache_coordinates = coordinates.transpose(*sorted(coordinates.dims))
+        try:
+            return self.has_cache("output", cache_coordinates)
+        except NodeException:
+            return False
 
     def find_coordinates(self):
         """
@@ -489,22 +789,35 @@ class Node(tl.HasTraits):
 
     @cached_property
     def hash(self):
-        """ hash for this node, used in caching and to determine equality. """
+        """
+        hash for this node, used in caching and to determine equality.
 
-        # deepcopy so that the cached definition property is not modified by the deletes below
-        d = deepcopy(self.definition)
+        The hash is computed from the node type, its attrs, and the hashes of its inputs, omitting the style and the
+        podpac version. Each node computes its hash once, so hashing a pipeline hashes each node once, and numerical
+        array attrs are hashed from their bytes.
+        """
+
+        if getattr(self, "_hash_guard", False):
+            raise NodeDefinitionError("node definition has a circular dependency")
 
-        # omit version
-        if "podpac_version" in d:
-            del d["podpac_version"]
+        if not getattr(self, "_traits_initialized_guard", False):
+            raise NodeDefinitionError("node is not yet fully initialized")
 
-        # omit style in every node
-        for k in d:
-            if "style" in d[k]:
-                del d[k]["style"]
+        try:
+            self._hash_guard = True
+
+            d = self._base_definition
+            h = hash_alg()
+            for key in ["plugin", "node"]:
+                if key in d:
+                    h.update(("%s=%s;" % (key, d[key])).encode("utf-8"))
+            for key in ["attrs", "inputs"]:
+                for name, value in sorted(d.get(key, {}).items()):
+                    h.update(("%s.%s=%s;" % (key, name, _hash_value(value))).encode("utf-8"))
+            return h.hexdigest()
 
-        s = json.dumps(d, separators=(",", ":"), cls=JSONEncoder)
-        return hash_alg(s.encode("utf-8")).hexdigest()
+        finally:
+            self._hash_guard = False
 
     def save(self, path):
         """
@@ -560,14 +873,17 @@ class Node(tl.HasTraits):
         """
 
         try:
-            self.definition
+            self.hash
         except NodeDefinitionError as e:
             raise NodeException("Cache unavailable, %s (key='%s')" % (e.args[0], key))
 
-        if self.cache_ctrl is None or not self.has_cache(key, coordinates=coordinates):
+        if self.cache_ctrl is None:
             raise NodeException("cached data not found for key '%s' and coordinates %s" % (key, coordinates))
 
-        return self.cache_ctrl.get(self, key, coordinates=coordinates)
+        try:
+            return self.cache_ctrl.get(self, key, coordinates=coordinates)
+        except CacheException:
+            raise NodeException("cached data not found for key '%s' and coordinates %s" % (key, coordinates))
 
     def put_cache(self, data, key, coordinates=None, overwrite=True):
         """
@@ -591,7 +907,7 @@ class Node(tl.HasTraits):
         """
 
         try:
-            self.definition
+            self.hash
         except NodeDefinitionError as e:
             raise NodeException("Cache unavailable, %s (key='%s')" % (e.args[0], key))
 
@@ -622,7 +938,7 @@ class Node(tl.HasTraits):
         """
 
         try:
-            self.definition
+            self.hash
         except NodeDefinitionError as e:
             raise NodeException("Cache unavailable, %s (key='%s')" % (e.args[0], key))
 
@@ -632,6 +948,111 @@ class Node(tl.HasTraits):
         with thread_manager.cache_lock:
             return self.cache_ctrl.has(self, key, coordinates=coordinates)
 
+    @cached_property
+    def _cache_subset(self):
+        """
+        True if the output can be selected from cached outputs for a superset of the requested coordinates, which
+        requires that the node and all of its inputs are pointwise.
+        """
+
+        if not self._pointwise:
+            return False
+
+        for value in self._base_definition.get("inputs", {}).values():
+            if isinstance(value, Node):
+                value = [value]
+            elif isinstance(value, dict):
+                value = list(value.values())
+            if not all(node._cache_subset for node in value):
+                return False
+        return True
+
+    def _get_cache_subset(self, key, coordinates):
+        """
+        Get cached data for this node from a cached superset of the given coordinates, for pointwise nodes only (see
+        ``_pointwise``).
+
+        Parameters
+        ----------
+        key : str
+            Key for the cached data, e.g. 'output'
+        coordinates : podpac.Coordinates
+            Requested coordinates.
+
+        Returns
+        -------
+        data : UnitsDataArray or None
+            The cached data, selected at the requested coordinates, or None if no cached superset was found.
+        """
+
+        if self.cache_ctrl is None or not self._cache_subset:
+            return None
+
+        with thread_manager.cache_lock:
+            cached_coordinates, indices = self.cache_ctrl.find_superset(self, key, coordinates)
+            if cached_coordinates is None:
+                return None
+            try:
+                data = self.cache_ctrl.get(self, key, coordinates=cached_coordinates)
+            except CacheException:
+                return None
+
+        # the output must have all of the requested dimensions
+        if any(dim not in data.dims for dim in indices):
+            return None
+
+        data = data.isel(**indices)
+        return _assign_coordinates(data, coordinates)
+
+    def _eval_tiles(self, fn, coordinates):
+        """
+        Evaluate this node using cached canonical tiles (see `cache_tile_size`), for pointwise nodes only.
+
+        Parameters
+        ----------
+        fn : function
+            Node eval method
+        coordinates : podpac.Coordinates
+            Requested coordinates.
+
+        Returns
+        -------
+        data : UnitsDataArray or None
+            The output assembled from the tiles, or None if the coordinates cannot be tiled or the output does not keep
+            the tiled dimensions.
+        from_cache : bool
+            True if all of the tiles were retrieved from the cache.
+        """
+
+        canonical, tiles = get_tiles(coordinates, self.cache_tile_size)
+        if canonical is None:
+            return None, False
+
+        output = self.create_output_array(canonical)
+        from_cache = True
+        for tile_coordinates, index in tiles:
+            if not self.force_eval and self.has_cache("output", tile_coordinates):
+                tile = self.get_cache("output", tile_coordinates)
+            else:
+                tile = fn(self, tile_coordinates)
+                self.put_cache(tile, "output", tile_coordinates)
+                from_cache = False
+
+            # tiles can only be assembled in the dimensions that the output keeps
+            if any(dim not in tile.dims for dim in index):
+                return None, False
+
+            # the output may not include every requested dimension
+            for dim in output.dims:
+                if dim not in tile.dims:
+                    output = output.sel(output=self.output) if dim == "output" else output.isel(**{dim: 0}, drop=True)
+            tile = tile.transpose(*output.dims)
+            output.data[tuple(index.get(dim, slice(None)) for dim in output.dims)] = tile.data
+
+        indexers = {dim: coordinates[dim].coordinates for dim in tiles[0][1] if dim in output.dims}
+        data = output.sel(method="nearest", **indexers)
+        return _assign_coordinates(data, coordinates), from_cache
+
     def rem_cache(self, key, coordinates=None, mode="all"):
         """
         Clear cached data for this node.
@@ -653,7 +1074,7 @@ class Node(tl.HasTraits):
         """
 
         try:
-            self.definition
+            self.hash
         except NodeDefinitionError as e:
             raise NodeException("Cache unavailable, %s (key='%s')" % (e.args[0], key))
 
@@ -850,6 +1271,41 @@ class Node(tl.HasTraits):
         return cls.from_definition(d)
 
 
+def _hash_value(value):
+    """ digest of a node attr or input, see Node.hash """
+
+    # input nodes
+    if isinstance(value, Node):
+        return value.hash
+
+    if isinstance(value, (list, tuple, np.ndarray)) and len(value) and all(isinstance(v, Node) for v in value):
+        return "[%s]" % ",".join(v.hash for v in value)
+
+    if isinstance(value, dict) and value and all(isinstance(v, Node) for v in value.values()):
+        return "{%s}" % ",".join("%s:%s" % (k, value[k].hash) for k in sorted(value))
+
+    # attrs
+    if isinstance(value, Coordinates):
+        return value.hash
+
+    if isinstance(value, np.ndarray) and value.dtype.kind in "biufcmM":
+        h = hash_alg(("%s%s" % (value.dtype.str, value.shape)).encode("utf-8"))
+        h.update(np.ascontiguousarray(value).reshape(-1).view(np.uint8))
+        return h.hexdigest()
+
+    s = json.dumps(value, separators=(",", ":"), cls=JSONEncoder)
+    return hash_alg(s.encode("utf-8")).hexdigest()
+
+
+def _get_hash(node):
+    """ node hash, or None if the node cannot be hashed (e.g. it has attrs that are not JSON serializable) """
+
+    try:
+        return node.hash
+    except (NodeDefinitionError, TypeError, ValueError):
+        return None
+
+
 def _lookup_input(nodes, name, value):
     # containers
     if isinstance(value, list):
@@ -952,9 +1408,22 @@ class DiskCacheMixin(tl.HasTraits):
 # --------------------------------------------------------#
 
 
+def _assign_coordinates(data, coordinates):
+    """ Assign the given coordinates to data selected from a cached superset of the coordinates. """
+
+    data = data.assign_coords(**{dim: c for dim, c in coordinates.coords.items() if dim in data.dims})
+    if "geotransform" in data.attrs:
+        try:
+            data.attrs["geotransform"] = coordinates.geotransform
+        except (TypeError, AttributeError):
+            del data.attrs["geotransform"]
+    return data
+
+
 def node_eval(fn):
     """
-    Decorator for Node eval methods that handles caching and a user provided output argument.
+    Decorator for Node eval methods that handles caching, coalescing of concurrent identical evaluations, and a user
+    provided output argument.
 
     fn : function
         Node eval method to wrap
@@ -969,22 +1438,82 @@ def node_eval(fn):
 
     @functools.wraps(fn)
     def wrapper(self, coordinates, output=None):
+        with span(self.__class__.__name__, "eval", node=self) as trace:
+            # the top-level evaluation keeps the outputs of shared sub-nodes for the whole pipeline
+            if get_eval_memo() is None and settings["EVAL_MEMO"] and _get_hash(self) is not None:
+                set_eval_memo(EvalMemo(get_shared(self)))
+                try:
+                    data = _wrapper(self, coordinates, output)
+                finally:
+                    set_eval_memo(None)
+            else:
+                data = _wrapper(self, coordinates, output)
+
+            trace["output_bytes"] = getattr(data, "nbytes", 0)
+        return data
+
+    # request state is kept per call, so that one node instance can be evaluated concurrently
+    @with_eval_context
+    def _wrapper(self, coordinates, output):
         if settings["DEBUG"]:
             self._requested_coordinates = coordinates
         key = cache_key
         cache_coordinates = coordinates.transpose(*sorted(coordinates.dims))  # order agnostic caching
+        node_hash = _get_hash(self)
+
+        def _eval_cached():
+            data = None
+            if (
+                self.cache_output
+                and self.cache_tile_size is not None
+                and self._cache_subset
+                and not settings["LAZY_EVAL"]
+            ):
+                data, from_cache = self._eval_tiles(fn, cache_coordinates)
+
+            if data is None and not self.force_eval and self.cache_output:
+                with span("cache get", "cache", node=self) as trace:
+                    try:
+                        data = self.get_cache(key, cache_coordinates)
+                    except NodeException:
+                        data = self._get_cache_subset(key, cache_coordinates)
+                    trace["cache"] = "miss" if data is None else "hit"
+                from_cache = True
+
+            if data is not None:
+                return data, from_cache, False
 
-        if not self.force_eval and self.cache_output and self.has_cache(key, cache_coordinates):
-            data = self.get_cache(key, cache_coordinates)
-            if output is not None:
-                order = [dim for dim in output.dims if dim not in data.dims] + list(data.dims)
-                output.transpose(*order)[:] = data
-            self._from_cache = True
-        else:
             data = fn(self, coordinates, output=output)
-            if self.cache_output:
-                self.put_cache(data, key, cache_coordinates)
-            self._from_cache = False
+            # caching lazy outputs would compute them
+            if self.cache_output and not is_lazy(data):
+                with span("cache put", "cache", node=self):
+                    self.put_cache(data, key, cache_coordinates)
+            return data, False, True
+
+        def _eval():
+            memo = get_eval_memo()
+            if memo is None or node_hash is None or not memo.is_shared(self):
+                return _eval_cached()
+
+            # shared sub-nodes are evaluated once per top-level evaluation (reported as retrieved from the cache)
+            data = memo.get(self, cache_coordinates)
+            if data is not None:
+                return data, True, False
+
+            data, from_cache, evaluated = _eval_cached()
+            memo.put(self, cache_coordinates, data)
+            return data, from_cache, evaluated
+
+        # concurrent evaluations of the same node and coordinates wait for the first one
+        if settings["SINGLE_FLIGHT_EVAL"] and node_hash is not None:
+            (data, from_cache, evaluated), shared = _single_flight.do((node_hash, cache_coordinates.hash), _eval)
+        else:
+            (data, from_cache, evaluated), shared = _eval(), False
+
+        if output is not None and (shared or not evaluated):
+            order = [dim for dim in output.dims if dim not in data.dims] + list(data.dims)
+            output.transpose(*order)[:] = data
+        self._from_cache = from_cache
 
         # extract single output, if necessary
         # subclasses should extract single outputs themselves if possible, but this provides a backup
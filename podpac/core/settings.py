@@ -29,6 +29,11 @@ DEFAULT_SETTINGS = {
     "MULTITHREADING": False,
     "N_THREADS": 8,
     "CHUNK_SIZE": None,  # Size of chunks for parallel processing or large arrays that do not fit in memory
+    "SINGLE_FLIGHT_EVAL": True,
+    "EVAL_MEMO": True,
+    "EVAL_GROUP_SHARED_READS": True,
+    "LAZY_EVAL": False,
+    "ASYNC_COMPOSITOR_PREFETCH": 4,
     "ENABLE_UNITS": True,
     "DEFAULT_CRS": "EPSG:4326",
     "PODPAC_VERSION": version.semver(),
@@ -43,8 +48,26 @@ DEFAULT_SETTINGS = {
     "DISK_CACHE_DIR": "cache",
     "S3_CACHE_DIR": "cache",
     "RAM_CACHE_ENABLED": True,
+    "RAM_CACHE_READ_ONLY": False,
     "DISK_CACHE_ENABLED": True,
+    "DISK_CACHE_MMAP": True,
+    "DISK_CACHE_INDEX": True,
     "S3_CACHE_ENABLED": True,
+    "RAM_CACHE_PROMOTE": True,
+    "DISK_CACHE_PROMOTE": True,
+    "S3_CACHE_PROMOTE": False,
+    "DISK_CACHE_CODEC": None,
+    "S3_CACHE_CODEC": None,
+    "DISK_CACHE_TTL": None,
+    "S3_CACHE_TTL": None,
+    "CACHE_WRITE_BEHIND": False,
+    "CACHE_WRITE_BEHIND_THREADS": 2,
+    "CACHE_WRITE_BEHIND_QUEUE_SIZE": 16,
+    "CACHE_WRITE_BEHIND_POLICY": "block",
+    "CACHE_STATS_LOG_INTERVAL": None,
+    "NEGATIVE_CACHE_ENABLED": True,
+    "NEGATIVE_CACHE_MAX_ENTRIES": 100000,
+    "NEGATIVE_CACHE_TTL": 60,
     # AWS
     "AWS_ACCESS_KEY_ID": None,
     "AWS_SECRET_ACCESS_KEY": None,
@@ -115,32 +138,92 @@ class PodpacSettings(dict):
     CACHE_DATASOURCE_OUTPUT_DEFAULT : bool
         Default value for DataSource nodes ``cache_output`` trait. If True, the outputs of nodes (eval) will be automatically cached.
     RAM_CACHE_MAX_BYTES : int
-        Maximum RAM cache size in bytes. 
-        Note, for RAM cache only, the limit is applied to the total amount of RAM used by the python process; 
-        not just the contents of the RAM cache. The python process will not be restrited by this limit,
-        but once the limit is reached, additions to the cache will be subject to it.
-        Defaults to ``1e9`` (~1G). 
+        Maximum RAM cache size in bytes.
+        The limit is applied to the total size of the objects in the RAM cache. Once the limit is reached, the least
+        recently used objects are removed from the RAM cache to make room for new objects.
+        Defaults to ``1e9`` (~1G).
         Set to `None` explicitly for no limit.
     DISK_CACHE_MAX_BYTES : int
         Maximum disk space for use by the disk cache in bytes. 
+        Once the limit is reached, expired and least recently used entries are removed to make room for new entries.
         Defaults to ``10e9`` (~10G). 
         Set to `None` explicitly for no limit.
     S3_CACHE_MAX_BYTES : int
         Maximum storage space for use by the s3 cache in bytes. 
+        Once the limit is reached, expired and least recently modified entries are removed to make room for new
+        entries (s3 does not record access times).
         Defaults to ``10e9`` (~10G). 
         Set to `None` explicitly for no limit.
     DISK_CACHE_DIR : str
         Subdirectory to use for the disk cache. Defaults to ``'cache'`` in the podpac root directory. 
         Use settings.cache_path to access this settings (this property looks for the environmental variable 
-        `XDG_CACHE_HOME` to adjust the location of the cache directory)
+        `XDG_CACHE_HOME` to adjust the location of the cache directory). For a directory on a network file system
+        (e.g. NFS), set `DISK_CACHE_INDEX` to False.
     S3_CACHE_DIR : str
         Subdirectory to use for S3 cache (within the specified S3 bucket). Defaults to ``'cache'``.
     RAM_CACHE_ENABLED: bool
         Enable caching to RAM. Note that if disabled, some nodes may fail. Defaults to ``True``.
+    RAM_CACHE_READ_ONLY: bool
+        Return arrays retrieved from the RAM cache as read-only views of the cached data instead of copies. This avoids
+        copying large arrays on every cache hit, but node outputs retrieved from the RAM cache cannot be modified
+        in-place. Defaults to ``False``.
     DISK_CACHE_ENABLED: bool
         Enable caching to disk. Note that if disabled, some nodes may fail. Defaults to ``True``.
+    DISK_CACHE_MMAP: bool
+        Store arrays in the disk cache as raw ``.npy`` data with a json metadata file, so that cached arrays are
+        memory-mapped when retrieved instead of read into memory. If False, arrays are stored as NetCDF files.
+        Defaults to ``True``.
+    DISK_CACHE_INDEX: bool
+        Look up, size, and evict disk cache entries using a SQLite index in the cache directory instead of scanning the
+        cache directory. Concurrent access to the index relies on SQLite file locking, which is unreliable on network
+        file systems (e.g. NFS), so set this to False when the cache directory is on a network file system shared by
+        several machines. Without the index, entries are found by filename and evicted by file access time.
+        Defaults to ``True``.
     S3_CACHE_ENABLED: bool
         Enable caching to RAM. Note that if disabled, some nodes may fail. Defaults to ``True``.
+    RAM_CACHE_PROMOTE: bool
+        Copy data found in a later cache store (e.g. disk or s3) into the RAM cache store when it is retrieved. Defaults
+        to ``True``.
+    DISK_CACHE_PROMOTE: bool
+        Copy data found in a later cache store (e.g. s3) into the disk cache store when it is retrieved. Defaults to
+        ``True``.
+    S3_CACHE_PROMOTE: bool
+        Copy data found in a later cache store into the s3 cache store when it is retrieved. Defaults to ``False``.
+    DISK_CACHE_CODEC: str
+        Compression codec for entries in the disk cache: ``'zlib'``, ``'zstd'``, ``'lz4'``, ``'blosc'`` (with byte
+        shuffle), or ``None`` for no compression. The codec is recorded in each entry, so existing entries remain
+        readable when the codec is changed. Arrays stored in the memory-mappable format (see `DISK_CACHE_MMAP`) are not
+        compressed. Codecs other than ``'zlib'`` require the corresponding optional package (``zstandard``, ``lz4``,
+        or ``blosc``). Defaults to ``None``.
+    S3_CACHE_CODEC: str
+        Compression codec for entries in the s3 cache, see `DISK_CACHE_CODEC`. Defaults to ``None``.
+    DISK_CACHE_TTL: float
+        Maximum age of entries in the disk cache in seconds. Expired entries are treated as missing and are removed.
+        Defaults to ``None`` (no limit).
+    S3_CACHE_TTL: float
+        Maximum age of entries in the s3 cache in seconds, see `DISK_CACHE_TTL`. Defaults to ``None`` (no limit).
+    CACHE_WRITE_BEHIND: bool
+        Write to the disk and s3 caches using background threads, so that evaluation does not wait for cache writes.
+        Data waiting to be written is still available from the cache. Defaults to ``False``.
+    CACHE_WRITE_BEHIND_THREADS: int
+        Number of background threads used to write to the cache when `CACHE_WRITE_BEHIND` is True. Defaults to ``2``.
+    CACHE_WRITE_BEHIND_QUEUE_SIZE: int
+        Maximum number of cache writes waiting for a background thread. Defaults to ``16``.
+    CACHE_WRITE_BEHIND_POLICY: str
+        What to do with new cache writes when the write-behind queue is full: ``'block'`` waits for room in the queue,
+        ``'drop'`` skips the cache write, and ``'sync'`` writes synchronously. Defaults to ``'block'``.
+    CACHE_STATS_LOG_INTERVAL: float
+        Minimum interval in seconds between cache statistics summaries logged by ``podpac.core.cache.cache_stats`` at
+        the INFO level, see `podpac.core.cache.stats`. Defaults to ``None`` (no logging).
+    NEGATIVE_CACHE_ENABLED: bool
+        Remember data source requests that produce no data, i.e. requested coordinates that do not intersect the
+        source coordinates and sources that do not exist (missing files and HTTP 404 errors), so that repeated requests
+        return immediately. Defaults to ``True``.
+    NEGATIVE_CACHE_MAX_ENTRIES: int
+        Maximum number of negative results to remember, see `NEGATIVE_CACHE_ENABLED`. Defaults to ``100000``.
+    NEGATIVE_CACHE_TTL: float
+        Time in seconds after which negative results are forgotten, so that sources that become available are used.
+        Defaults to ``60``.
     ROOT_PATH : str
         Path to primary podpac working directory. Defaults to the ``.podpac`` directory in the users home directory.
     S3_BUCKET_NAME : str
@@ -160,6 +243,25 @@ class PodpacSettings(dict):
     CHUNK_SIZE: int, 'auto', None
         Chunk size for iterative evaluation, when applicable (e.g. Reduce Nodes). Use None for no iterative evaluation,
         and 'auto' to automatically calculate a chunk size based on the system. Defaults to ``None``.
+    SINGLE_FLIGHT_EVAL: bool
+        Coalesce concurrent evaluations of the same node (by hash) at the same coordinates: the first thread evaluates
+        the node and the other threads wait for and share its output. Defaults to ``True``.
+    EVAL_MEMO: bool
+        Evaluate nodes that are used as inputs more than once in a pipeline (by hash) only once per top-level
+        evaluation, independent of the node output caching. Defaults to ``True``.
+    EVAL_GROUP_SHARED_READS: bool
+        When evaluating a group of coordinates, data sources read the union of the source data needed by the group
+        members once and interpolate each member from the shared read. Defaults to ``True``.
+    LAZY_EVAL: bool
+        Evaluate nodes lazily with dask (requires dask). Data sources that support it (zarr, h5py, and rasterio) return
+        dask arrays chunked like the source, and nodes compose them without reading the data, so that the output is a
+        dask-backed UnitsDataArray that is read and computed when it is written, reduced, or computed (e.g. with
+        ``output.compute()``). Lazy outputs are not cached. Defaults to ``False``.
+    ASYNC_COMPOSITOR_PREFETCH: int
+        Number of compositor sources evaluated concurrently by :meth:`podpac.Node.eval_async`. The sources are evaluated
+        in batches, in order, and ordered compositors stop once the sources evaluated so far fill the output, so larger
+        batches evaluate faster but may evaluate sources that are not needed. Set to None to evaluate all of the
+        selected sources concurrently. Defaults to ``4``.
     """
 
     def __init__(self):
@@ -2,6 +2,9 @@ from __future__ import division, unicode_literals, print_function, absolute_impo
 
 import os
 import json
+import time
+import asyncio
+import threading
 import warnings
 import tempfile
 from collections import OrderedDict
@@ -31,6 +34,8 @@ from podpac.core.cache import CacheCtrl, RamCacheStore, DiskCacheStore
 from podpac.core.node import Node, NodeException, NodeDefinitionError
 from podpac.core.node import node_eval
 from podpac.core.node import NoCacheMixin, DiskCacheMixin
+from podpac.core.cache.eval_memo import get_eval_memo
+from podpac.core.managers.multi_threading import thread_manager
 
 
 class TestNode(object):
@@ -194,9 +199,81 @@ class TestNode(object):
         with pytest.raises(Exception):
             node.eval_group(c1)
 
+    def test_eval_group_unhashable(self):
+        class MyNode(Node):
+            value = tl.Any().tag(attr=True)
+
+            @node_eval
+            def eval(self, coordinates, output=None):
+                return self.create_output_array(coordinates, data=1)
+
+        c1 = podpac.Coordinates([[0, 1], [0, 1]], dims=["lat", "lon"])
+        c2 = podpac.Coordinates([[10, 11], [10, 11, 12]], dims=["lat", "lon"])
+        g = podpac.coordinates.GroupCoordinates([c1, c2])
+
+        # nodes that cannot be hashed are evaluated without an evaluation memo
+        node = MyNode(value=object(), cache_output=False)
+        with pytest.raises(TypeError):
+            node.hash
+        outputs = node.eval_group(g)
+        assert [output.shape for output in outputs] == [(2, 2), (2, 3)]
+
         with pytest.raises(Exception):
             node.eval(g)
 
+    def test_iter_eval(self):
+        class MyNode(Node):
+            def eval(self, coordinates, output=None):
+                data = coordinates["lat"].coordinates[:, None] * 100 + coordinates["lon"].coordinates[None, :]
+                return self.create_output_array(coordinates, data=data)
+
+        node = MyNode(cache_output=False)
+        coords = podpac.Coordinates([range(10), range(20)], dims=["lat", "lon"])
+        expected = node.eval(coords)
+
+        def assemble(chunks):
+            output = node.create_output_array(coords)
+            for slices, chunk in chunks:
+                assert isinstance(chunk, UnitsDataArray)
+                output[slices] = chunk
+            return output
+
+        # chunk shape
+        chunks = list(node.iter_eval(coords, chunk_shape=(3, 20)))
+        assert len(chunks) == 4
+        assert chunks[0][0] == (slice(0, 3), slice(0, 20))
+        assert chunks[0][1].shape == (3, 20)
+        np.testing.assert_array_equal(assemble(chunks), expected)
+
+        chunks = list(node.iter_eval(coords, chunk_shape={"lon": 5}))
+        assert len(chunks) == 4
+        assert chunks[0][1].shape == (10, 5)
+        np.testing.assert_array_equal(assemble(chunks), expected)
+
+        # max bytes
+        chunks = list(node.iter_eval(coords, max_bytes=8 * 50))
+        assert chunks[0][1].shape == (2, 20)
+        np.testing.assert_array_equal(assemble(chunks), expected)
+
+        chunks = list(node.iter_eval(coords, max_bytes=8 * 10))
+        assert chunks[0][1].shape == (1, 10)
+        np.testing.assert_array_equal(assemble(chunks), expected)
+
+        # prefetch
+        chunks = list(node.iter_eval(coords, chunk_shape=(3, 20), prefetch=True))
+        assert [slices for slices, chunk in chunks] == [slices for slices, chunk in node.iter_eval(coords, (3, 20))]
+        np.testing.assert_array_equal(assemble(chunks), expected)
+
+        # stop early, releasing the prefetch thread
+        n_threads_used = thread_manager._n_threads_used
+        chunks = node.iter_eval(coords, chunk_shape=(3, 20), prefetch=True)
+        next(chunks)
+        chunks.close()
+        assert thread_manager._n_threads_used == n_threads_used
+
+        with pytest.raises(ValueError, match="requires a chunk_shape or max_bytes"):
+            next(node.iter_eval(coords))
+
     def test_eval_not_implemented(self):
         node = Node()
         with pytest.raises(NotImplementedError):
@@ -210,6 +287,11 @@ class TestNode(object):
         with pytest.raises(NotImplementedError):
             node.find_coordinates()
 
+    def test_plan_not_implemented(self):
+        node = Node(cache_output=False)
+        with pytest.raises(NotImplementedError):
+            node.plan(podpac.Coordinates([[0, 1]], dims=["lat"]))
+
 
 class TestCreateOutputArray(object):
     def test_create_output_array_default(self):
@@ -299,6 +381,331 @@ class TestNodeEval(object):
         out = node.eval(coords)
         assert out.shape == (4, 2)
 
+    def test_cache_superset(self):
+        class MyNode(Node):
+            evals = 0
+            _pointwise = True
+
+            @node_eval
+            def eval(self, coordinates, output=None):
+                self.evals += 1
+                out = self.create_output_array(coordinates, data=0)
+                return out + out["lat"]
+
+        coords = podpac.Coordinates([podpac.clinspace(0, 10, 11), podpac.clinspace(0, 1, 3)], dims=["lat", "lon"])
+        node = MyNode(cache_output=True, cache_ctrl=CacheCtrl([RamCacheStore()]))
+        node.rem_cache(key="*", coordinates="*")
+        node.eval(coords)
+        assert node.evals == 1
+
+        # sub-slice of the cached coordinates
+        requested = podpac.Coordinates([podpac.clinspace(0.5, 1, 2), podpac.clinspace(2, 5, 4)], dims=["lon", "lat"])
+        out = node.eval(requested)
+        assert node.evals == 1
+        assert node._from_cache
+        assert out.dims == ("lon", "lat")
+        np.testing.assert_array_equal(out["lat"], [2, 3, 4, 5])
+        np.testing.assert_array_equal(out["lon"], [0.5, 1])
+        np.testing.assert_array_equal(out, [[2, 3, 4, 5], [2, 3, 4, 5]])
+
+        # different spacing
+        requested = podpac.Coordinates([podpac.clinspace(2, 5, 7), podpac.clinspace(0, 1, 3)], dims=["lat", "lon"])
+        node.eval(requested)
+        assert node.evals == 2
+        assert not node._from_cache
+
+        node.rem_cache(key="*", coordinates="*")
+
+    def test_cache_superset_not_pointwise(self):
+        from podpac.core.algorithm.stats import Mean
+        from podpac.core.algorithm.generic import Arithmetic
+
+        coords = podpac.Coordinates([[0, 1, 2], ["2018-01-01", "2018-01-02", "2018-01-03"]], dims=["lat", "time"])
+        source = podpac.data.Array(source=np.arange(9.0).reshape(3, 3), coordinates=coords)
+        requested = podpac.Coordinates([[0, 1, 2], ["2018-01-01", "2018-01-02"]], dims=["lat", "time"])
+        cache_ctrl = CacheCtrl([RamCacheStore()])
+
+        # the reduced dimension is not in the cached output
+        node = Mean(source=source, dims=["time"], cache_output=True, cache_ctrl=cache_ctrl)
+        node.eval(coords)
+        np.testing.assert_array_equal(node.eval(requested), [0.5, 3.5, 6.5])
+        assert not node._from_cache
+
+        # reductions are not pointwise, and neither are nodes with inputs that are not pointwise
+        node = Mean(source=source, dims=["lat"], cache_output=True, cache_ctrl=cache_ctrl)
+        assert source._cache_subset
+        assert not node._cache_subset
+        node.eval(coords)
+        np.testing.assert_array_equal(node.eval(requested[:2, :]), [1.5, 2.5])
+        assert not node._from_cache
+
+        assert Arithmetic(A=source, eqn="A + 1")._cache_subset
+        assert not Arithmetic(A=node, eqn="A + 1")._cache_subset
+
+        node.rem_cache(key="*", coordinates="*")
+
+    def test_cache_superset_evicted(self):
+        from podpac.core.cache.coordinates_index import _index
+
+        class MyNode(Node):
+            _pointwise = True
+
+            @node_eval
+            def eval(self, coordinates, output=None):
+                return self.create_output_array(coordinates, data=0)
+
+        coords = podpac.Coordinates([podpac.clinspace(0, 10, 11)], dims=["lat"])
+        node = MyNode(cache_output=True, cache_ctrl=CacheCtrl([RamCacheStore()]))
+        node.eval(coords)
+        assert len(list(_index.find(node, "output", coords[2:4]))) == 1
+
+        # entries evicted from the RAM cache are removed from the index
+        with podpac.settings:
+            podpac.settings["RAM_CACHE_MAX_BYTES"] = 200
+            node.eval(podpac.Coordinates([podpac.clinspace(20, 30, 11)], dims=["lat"]))
+        assert len(list(_index.find(node, "output", coords[2:4]))) == 0
+
+    def test_cache_tiles(self):
+        class MyNode(Node):
+            evals = 0
+            _pointwise = True
+
+            @node_eval
+            def eval(self, coordinates, output=None):
+                self.evals += 1
+                out = self.create_output_array(coordinates, data=0)
+                return out + out["lat"]
+
+        node = MyNode(cache_output=True, cache_tile_size=4, cache_ctrl=CacheCtrl([RamCacheStore()]))
+        node.rem_cache(key="*", coordinates="*")
+
+        coords = podpac.Coordinates([podpac.clinspace(0.3, 1.2, 10), podpac.clinspace(0, 1, 3)], dims=["lat", "lon"])
+        out = node.eval(coords)
+        assert node.evals == 4
+        assert not node._from_cache
+        assert out.shape == (10, 3)
+        np.testing.assert_array_equal(out["lat"], coords["lat"].coordinates)
+        np.testing.assert_allclose(out[:, 0], coords["lat"].coordinates)
+
+        # shifted and reversed request on the same grid
+        coords = podpac.Coordinates([podpac.clinspace(1.1, 0.5, 7), podpac.clinspace(0, 1, 3)], dims=["lat", "lon"])
+        out = node.eval(coords)
+        assert node.evals == 4
+        assert node._from_cache
+        np.testing.assert_array_equal(out["lat"], coords["lat"].coordinates)
+        np.testing.assert_allclose(out[:, 0], coords["lat"].coordinates)
+
+        # partially cached
+        coords = podpac.Coordinates([podpac.clinspace(1.1, 1.6, 6), podpac.clinspace(0, 1, 3)], dims=["lat", "lon"])
+        node.eval(coords)
+        assert node.evals == 5
+        assert not node._from_cache
+
+        node.rem_cache(key="*", coordinates="*")
+
+    def test_cache_tiles_not_pointwise(self):
+        from podpac.core.algorithm.stats import Mean
+
+        coords = podpac.Coordinates([podpac.clinspace(0, 9, 10), podpac.clinspace(0, 1, 3)], dims=["lat", "lon"])
+        source = podpac.data.Array(source=np.arange(10.0)[:, None].repeat(3, axis=1), coordinates=coords)
+
+        # tiling is ignored, the mean is computed over the requested coordinates only
+        node = Mean(
+            source=source, dims=["lat"], cache_output=True, cache_tile_size=4, cache_ctrl=CacheCtrl([RamCacheStore()])
+        )
+        np.testing.assert_array_equal(node.eval(coords), [4.5, 4.5, 4.5])
+        np.testing.assert_array_equal(node.eval(coords[2:5, :]), [3, 3, 3])
+
+        node.rem_cache(key="*", coordinates="*")
+
+    def test_single_flight(self):
+        class MyNode(Node):
+            evals = 0
+
+            @node_eval
+            def eval(self, coordinates, output=None):
+                MyNode.evals += 1
+                time.sleep(0.1)
+                return self.create_output_array(coordinates, data=1)
+
+        coords = podpac.Coordinates([[0, 1, 2], [10, 20]], dims=["lat", "lon"])
+        nodes = [MyNode(cache_output=False) for _ in range(4)]
+        outputs = [None] * len(nodes)
+
+        def f(i):
+            if i == 0:
+                outputs[i] = nodes[i].eval(coords)
+            else:
+                # transposed request and user provided output
+                output = nodes[i].create_output_array(coords.transpose("lon", "lat"))
+                nodes[i].eval(coords.transpose("lon", "lat"), output=output)
+                outputs[i] = output
+
+        threads = [threading.Thread(target=f, args=(i,)) for i in range(len(nodes))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert MyNode.evals == 1
+        assert outputs[0].dims == ("lat", "lon")
+        for output in outputs[1:]:
+            assert output.dims == ("lon", "lat")
+            np.testing.assert_array_equal(output, 1)
+
+        # disabled
+        with podpac.settings:
+            podpac.settings["SINGLE_FLIGHT_EVAL"] = False
+            threads = [threading.Thread(target=f, args=(i,)) for i in range(len(nodes))]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert MyNode.evals == 5
+
+    def test_single_flight_error(self):
+        class MyNode(Node):
+            @node_eval
+            def eval(self, coordinates, output=None):
+                time.sleep(0.1)
+                raise ValueError("eval failed")
+
+        coords = podpac.Coordinates([[0, 1, 2], [10, 20]], dims=["lat", "lon"])
+        errors = []
+
+        def f():
+            try:
+                MyNode(cache_output=False).eval(coords)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=f) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(errors) == 3
+
+    def test_single_flight_unhashable(self):
+        class MyNode(Node):
+            value = tl.Any().tag(attr=True)
+
+            @node_eval
+            def eval(self, coordinates, output=None):
+                return self.create_output_array(coordinates, data=1)
+
+        # nodes that cannot be hashed are evaluated without single-flight coalescing
+        coords = podpac.Coordinates([[0, 1, 2], [10, 20]], dims=["lat", "lon"])
+        node = MyNode(value=object(), cache_output=False)
+        with pytest.raises(TypeError):
+            node.hash
+
+        with podpac.settings:
+            podpac.settings["SINGLE_FLIGHT_EVAL"] = True
+            podpac.settings["EVAL_MEMO"] = False
+            np.testing.assert_array_equal(node.eval(coords), 1)
+
+    def test_eval_memo(self):
+        class MySource(Node):
+            evals = 0
+
+            @node_eval
+            def eval(self, coordinates, output=None):
+                MySource.evals += 1
+                return self.create_output_array(coordinates, data=1)
+
+        class MySum(Node):
+            a = NodeTrait().tag(attr=True)
+            b = NodeTrait().tag(attr=True)
+
+            @node_eval
+            def eval(self, coordinates, output=None):
+                return self.a.eval(coordinates) + self.b.eval(coordinates)
+
+        coords = podpac.Coordinates([[0, 1, 2], [10, 20]], dims=["lat", "lon"])
+
+        # the shared source (by hash) is evaluated once per top-level evaluation
+        node = MySum(a=MySource(cache_output=False), b=MySource(cache_output=False), cache_output=False)
+        output = node.eval(coords)
+        np.testing.assert_array_equal(output, 2)
+        assert MySource.evals == 1
+        assert get_eval_memo() is None
+
+        node.eval(coords)
+        assert MySource.evals == 2
+
+        # nested
+        node2 = MySum(a=node, b=MySource(cache_output=False), cache_output=False)
+        output = node2.eval(coords)
+        np.testing.assert_array_equal(output, 3)
+        assert MySource.evals == 3
+
+        # disabled
+        with podpac.settings:
+            podpac.settings["EVAL_MEMO"] = False
+            node.eval(coords)
+        assert MySource.evals == 5
+
+    def test_eval_memo_shared_generic_inputs(self):
+        from podpac.core.algorithm.generic import Arithmetic
+        from podpac.core.algorithm.utility import SinCoords
+        from podpac.core.cache.eval_memo import get_shared
+
+        source = SinCoords()
+        with podpac.settings:
+            podpac.settings.set_unsafe_eval(True)
+            node = Arithmetic(A=source, B=Arithmetic(A=source, eqn="A + 1"), eqn="A + B")
+        assert get_shared(node) == {source.hash}
+
+    def test_eval_memo_unhashable(self):
+        class MyNode(Node):
+            value = tl.Any().tag(attr=True)
+            source = NodeTrait().tag(attr=True)
+
+            @node_eval
+            def eval(self, coordinates, output=None):
+                return self.source.eval(coordinates) + 1
+
+        # nodes that cannot be hashed are evaluated without an evaluation memo
+        coords = podpac.Coordinates([[0, 1, 2], [10, 20]], dims=["lat", "lon"])
+        node = MyNode(value=object(), source=podpac.algorithm.Arange(), cache_output=False)
+        with podpac.settings:
+            podpac.settings["SINGLE_FLIGHT_EVAL"] = False
+            podpac.settings["EVAL_MEMO"] = True
+            np.testing.assert_array_equal(node.eval(coords), [[1, 2], [3, 4], [5, 6]])
+            assert get_eval_memo() is None
+
+    def test_eval_async(self):
+        class MySource(Node):
+            evals = 0
+
+            @node_eval
+            def eval(self, coordinates, output=None):
+                MySource.evals += 1
+                return self.create_output_array(coordinates, data=1)
+
+        coords = podpac.Coordinates([[0, 1, 2], [10, 20]], dims=["lat", "lon"])
+        node = MySource(cache_output=False)
+
+        loop = asyncio.new_event_loop()
+        try:
+            output = loop.run_until_complete(node.eval_async(coords))
+            np.testing.assert_array_equal(output, 1)
+            assert MySource.evals == 1
+
+            # concurrent
+            async def f():
+                return await asyncio.gather(node.eval_async(coords), node.eval_async(coords))
+
+            outputs = loop.run_until_complete(f())
+            for output in outputs:
+                np.testing.assert_array_equal(output, 1)
+        finally:
+            loop.close()
+
+        assert get_eval_memo() is None
+
 
 class TestCaching(object):
     @classmethod
@@ -727,6 +1134,54 @@ class TestSerialization(object):
         assert n1.hash != n3.hash
         assert n1.hash != m1.hash
 
+    def test_hash_inputs(self):
+        class N(Node):
+            my_attr = tl.Int().tag(attr=True)
+
+        class M(Node):
+            source = NodeTrait().tag(attr=True)
+            sources = tl.List().tag(attr=True)
+
+        a1 = M(source=N(my_attr=1), sources=[N(my_attr=2), N(my_attr=3)])
+        a2 = M(source=N(my_attr=1), sources=[N(my_attr=2), N(my_attr=3)])
+        b = M(source=N(my_attr=2), sources=[N(my_attr=2), N(my_attr=3)])
+        c = M(source=N(my_attr=1), sources=[N(my_attr=3), N(my_attr=2)])
+
+        assert a1.hash == a2.hash
+        assert a1.hash != b.hash
+        assert a1.hash != c.hash
+
+        # memoized
+        assert a1.hash is a1.hash
+
+    def test_hash_array_attr(self):
+        class N(Node):
+            my_attr = ArrayTrait().tag(attr=True)
+
+        n1 = N(my_attr=np.arange(1000.0))
+        n2 = N(my_attr=np.arange(1000.0))
+        n3 = N(my_attr=np.arange(1000.0) + 1)
+        n4 = N(my_attr=np.arange(1000))
+        n5 = N(my_attr=np.arange(1000.0).reshape(10, 100))
+
+        assert n1.hash == n2.hash
+        assert n1.hash != n3.hash
+        assert n1.hash != n4.hash
+        assert n1.hash != n5.hash
+
+    def test_hash_circular(self):
+        class MyNode(Node):
+            a = tl.Any().tag(attr=True)
+
+            @tl.default("a")
+            def _default_a(self):
+                self.hash
+                return 10
+
+        node = MyNode()
+        with pytest.raises(NodeDefinitionError, match="node definition has a circular dependency"):
+            node.hash
+
     def test_hash_preserves_definition(self):
         n = Node()
         d_before = deepcopy(n.definition)
@@ -21,6 +21,8 @@ from podpac.core.utils import OrderedDictTrait, ArrayTrait, TupleTrait, NodeTrai
 from podpac.core.utils import JSONEncoder, is_json_serializable
 from podpac.core.utils import cached_property
 from podpac.core.utils import ind2slice
+from podpac.core.utils import is_lazy
+from podpac.core.data.lazy import lazy_read
 
 
 class TestCommonDocs(object):
@@ -242,6 +244,10 @@ class TestJSONEncoder(object):
         td = np.timedelta64()
         json.dumps(td, cls=JSONEncoder)
 
+    def test_numpy_scalar(self):
+        assert json.dumps(np.int64(3), cls=JSONEncoder) == "3"
+        assert json.dumps(np.float32(0.5), cls=JSONEncoder) == "0.5"
+
     def test_datetime(self):
         now = datetime.datetime.now()
         json.dumps(now, cls=JSONEncoder)
@@ -420,3 +426,30 @@ class TestInd2Slice(object):
         assert ind2slice([1, 2, 4]) == slice(1, 5)
         assert ind2slice([False, True, True, False, True, False]) == slice(1, 5)
         assert ind2slice([1, 3, 5]) == slice(1, 7, 2)
+
+
+class TestIsLazy(object):
+    def test_numpy(self):
+        assert not is_lazy(np.zeros(3))
+        assert not is_lazy(xr.DataArray(np.zeros(3)))
+
+    def test_dask(self):
+        da = pytest.importorskip("dask.array")
+        assert is_lazy(da.zeros(3))
+        assert is_lazy(xr.DataArray(da.zeros(3)))
+
+    def test_dask_not_installed(self, monkeypatch):
+        # dask.array is not imported (None in sys.modules makes the import fail)
+        monkeypatch.setitem(sys.modules, "dask.array", None)
+        assert not is_lazy(np.zeros(3))
+
+        # lazy reads raise a clear error
+        with pytest.raises(ImportError, match="requires dask"):
+            lazy_read(np.zeros(3), (slice(None),))
+
+        # evaluation does not require dask
+        node = podpac.data.Array(
+            source=np.ones((3, 4)), coordinates=podpac.Coordinates([range(3), range(4)], dims=["lat", "lon"])
+        )
+        output = node.eval(node.coordinates)
+        np.testing.assert_array_equal(output, 1)
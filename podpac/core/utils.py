@@ -246,6 +246,10 @@ class JSONEncoder(json.JSONEncoder):
         if isinstance(obj, pd.DataFrame):
             return obj.to_json()
 
+        # numpy scalars
+        if isinstance(obj, np.generic):
+            return obj.item()
+
         # numpy array
         if isinstance(obj, np.ndarray):
             if np.issubdtype(obj.dtype, np.datetime64):
@@ -448,3 +452,25 @@ def _ind2slice(I):
 
     # non-stepped slice
     return slice(I.min(), I.max() + 1)
+
+
+def is_lazy(data):
+    """ Check if an array (or the data of a DataArray) is a lazy dask array, see the ``LAZY_EVAL`` setting.
+
+    Arguments
+    ---------
+    data : array-like, xr.DataArray
+        array or data array
+
+    Returns
+    -------
+    lazy : bool
+        True if the data is a dask array
+    """
+
+    # nothing can be lazy unless dask is in use
+    da = sys.modules.get("dask.array")
+    if da is None:
+        return False
+
+    return isinstance(getattr(data, "data", data), da.Array)
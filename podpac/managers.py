@@ -8,3 +8,4 @@ from podpac.core.managers import aws
 from podpac.core.managers.aws import Lambda
 from podpac.core.managers.parallel import Parallel, ParallelOutputZarr
 from podpac.core.managers.multi_process import Process
+from podpac.core.managers.profiler import Profile
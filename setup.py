@@ -42,9 +42,10 @@ extras_require = {
         "beautifulsoup4>=4.6",
         "h5py>=2.9",
         "lxml>=4.2",
+        "netCDF4>=1.4",
         "pydap>=3.2",
         "rasterio>=1.0",
-        "zarr>=2.3",
+        "zarr>=2.3,<3",
         #"intake>=0.5"  Not supported in Python 3.5
     ],
     "aws": [
@@ -55,6 +56,17 @@ extras_require = {
     "algorithms": [
         "numexpr>=2.6"
     ],
+    "async": [
+        "aiohttp>=3.5"
+    ],
+    "lazy": [
+        "dask[array]>=2.0"
+    ],
+    "cache": [
+        "zstandard",
+        "lz4",
+        "blosc"
+    ],
     "notebook": [
         "jupyterlab",
         "ipyleaflet",